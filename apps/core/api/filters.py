@@ -0,0 +1,19 @@
+from django.db.models.constants import LOOKUP_SEP
+
+from rest_framework.filters import SearchFilter
+
+from apps.core.lookups import TextIContains
+
+
+class CITextSearchFilter(SearchFilter):
+    """Search filter for `CICharField` fields which uses trigram indexes.
+
+    Default `icontains` lookup is replaced with `text_icontains`, check
+    `apps.core.lookups`. All `search_fields` without lookup prefix must be
+    `CICharField` fields.
+    """
+
+    def construct_search(self, field_name):
+        if field_name[0] in self.lookup_prefixes:
+            return super().construct_search(field_name)
+        return LOOKUP_SEP.join([field_name, TextIContains.lookup_name])
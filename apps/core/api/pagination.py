@@ -0,0 +1,215 @@
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.db.models import Q
+from django.db.models.constants import LOOKUP_SEP
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(LimitOffsetPagination):
+    """Pagination which uses values of last item instead of offset.
+
+    It's enabled with `cursor` query param (empty for first page), without
+    it works like `LimitOffsetPagination`. Items are ordered by
+    `keyset_ordering` of view (e.g. `("english", "id")`, fields can't be
+    nullable and last one must be unique) and next page is got with
+    `(english, id) > (last english, last id)` condition, so with index on
+    ordering fields deep pages don't scan skipped rows. If ordering field
+    is in joined table, index can't be used for both filter and ordering,
+    so all filtered rows are sorted.
+
+    Count isn't calculated for keyset pages, `count=approximate` query param
+    makes it return planner estimate of items count.
+
+    Example:
+    class WordsViewSet(BaseViewSet, ListModelMixin):
+        pagination_class = KeysetPagination
+        keyset_ordering = ("english", "id")
+
+    """
+    cursor_query_param = "cursor"
+    cursor_query_description = _(
+        "Cursor for keyset pagination, pass empty value for first page."
+    )
+    count_query_param = "count"
+    count_query_description = _(
+        "Pass `approximate` to get estimated count of items with cursor."
+    )
+    approximate_count = "approximate"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Get page of items using cursor if it's passed."""
+        self.keyset_ordering = getattr(view, "keyset_ordering", None)
+        self.is_keyset = bool(self.keyset_ordering) and (
+            self.cursor_query_param in request.query_params
+        )
+        if not self.is_keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.check_keyset_ordering(queryset.model)
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.count = None
+        if request.query_params.get(
+            self.count_query_param,
+        ) == self.approximate_count:
+            self.count = self.get_approximate_count(queryset)
+
+        queryset = queryset.order_by(*self.keyset_ordering)
+        cursor = self.decode_cursor(
+            request.query_params[self.cursor_query_param],
+        )
+        if cursor is not None:
+            queryset = queryset.filter(self.get_keyset_filter(cursor))
+        items = list(queryset[:self.limit + 1])
+        self.has_next = len(items) > self.limit
+        items = items[:self.limit]
+        self.next_cursor = None
+        if self.has_next:
+            self.next_cursor = self.encode_cursor(items[-1])
+        return items
+
+    def get_paginated_response(self, data):
+        """Return page in the same format as `LimitOffsetPagination`."""
+        if not self.is_keyset:
+            return super().get_paginated_response(data)
+        return Response(OrderedDict([
+            ("count", self.count),
+            ("next", self.get_next_link()),
+            ("previous", None),
+            ("results", data),
+        ]))
+
+    def get_next_link(self):
+        """Get link to next page."""
+        if not self.is_keyset:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.offset_query_param)
+        return replace_query_param(
+            url,
+            self.cursor_query_param,
+            self.next_cursor,
+        )
+
+    def check_keyset_ordering(self, model):
+        """Check that ordering fields can't be null.
+
+        `NULL` can't be compared with `>`, so items after it would be lost.
+        """
+        for field_path in self.keyset_ordering:
+            field_model = model
+            for name in field_path.split(LOOKUP_SEP):
+                field = field_model._meta.get_field(name)
+                if field.null:
+                    raise ImproperlyConfigured(
+                        f"Keyset ordering field `{field_path}` of "
+                        f"{model.__name__} is nullable",
+                    )
+                field_model = field.related_model
+
+    def get_keyset_filter(self, cursor: list) -> Q:
+        """Get filter of items which are after cursor.
+
+        `(a, b, c) > (x, y, z)` is expanded to
+        `a >= x AND (a > x OR (a = x AND b > y) OR (a = x AND b = y AND
+        c > z))`, leading `a >= x` is used as index condition.
+        """
+        conditions = []
+        for index, field in enumerate(self.keyset_ordering):
+            equal = {
+                previous_field: cursor[previous_index]
+                for previous_index, previous_field in enumerate(
+                    self.keyset_ordering[:index],
+                )
+            }
+            conditions.append(Q(**equal, **{f"{field}__gt": cursor[index]}))
+        first_field = self.keyset_ordering[0]
+        return Q(**{f"{first_field}__gte": cursor[0]}) & reduce(
+            or_,
+            conditions,
+        )
+
+    def encode_cursor(self, item) -> str:
+        """Encode ordering values of item to cursor."""
+        values = [
+            str(self.get_item_value(item, field))
+            for field in self.keyset_ordering
+        ]
+        return base64.urlsafe_b64encode(
+            json.dumps(values).encode(),
+        ).decode()
+
+    def decode_cursor(self, cursor: str):
+        """Decode ordering values from cursor, empty cursor is first page."""
+        if not cursor:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (TypeError, ValueError, binascii.Error):
+            raise NotFound(_("Invalid cursor"))
+        if (
+            not isinstance(values, list)
+            or len(values) != len(self.keyset_ordering)
+            or not all(isinstance(value, str) for value in values)
+        ):
+            raise NotFound(_("Invalid cursor"))
+        return values
+
+    @staticmethod
+    def get_item_value(item, field: str):
+        """Get value of ordering field (can be related) of item."""
+        for attr in field.split(LOOKUP_SEP):
+            item = getattr(item, attr)
+        return item
+
+    @staticmethod
+    def get_approximate_count(queryset) -> int:
+        """Get count of items estimated by postgres planner."""
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def get_schema_operation_parameters(self, view):
+        """Add cursor params to schema."""
+        parameters = super().get_schema_operation_parameters(view)
+        if not getattr(view, "keyset_ordering", None):
+            return parameters
+        return parameters + [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(self.cursor_query_description),
+                "schema": {
+                    "type": "string",
+                },
+            },
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(self.count_query_description),
+                "schema": {
+                    "type": "string",
+                    "enum": [self.approximate_count],
+                },
+            },
+        ]
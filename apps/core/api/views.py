@@ -1,6 +1,13 @@
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.viewsets import GenericViewSet
 
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+
+from apps.core import cache
+
 
 class BaseViewSet(GenericViewSet):
     """Base viewset for all views."""
@@ -15,3 +22,15 @@ class BaseViewSet(GenericViewSet):
         if not serializer:
             return self.serializer_class
         return serializer
+
+
+class CacheStatsView(APIView):
+    """View to get hits and misses of two tier caches of process.
+
+    It's used for monitoring, check `apps.core.cache`.
+    """
+    permission_classes = (IsAdminUser,)
+
+    @extend_schema(responses={200: OpenApiTypes.OBJECT})
+    def get(self, request):
+        return Response(cache.get_stats())
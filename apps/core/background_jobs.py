@@ -0,0 +1,104 @@
+"""Statuses and files of background jobs.
+
+Long operations (e.g. adding of category words to dictionary, words import
+and catalogue export) are run by celery tasks. Status of each run is stored
+in Django cache by id of run, so client can poll it. Status always has
+`is_done`, `is_failed` and `error`, other values (progress, results) are
+specific for job.
+
+Files of jobs (uploaded for import or exported) are kept in storage of job.
+
+Example:
+    words_import_job = BackgroundJob(
+        "training:words-import",
+        initial_status=dict(processed_rows=0),
+        storage_setting="TRAINING_WORDS_IMPORT_STORAGE",
+    )
+    import_id = words_import_job.start()
+    ...
+    words_import_job.set_status(
+        import_id,
+        words_import_job.get_initial_status(is_done=True, processed_rows=10),
+    )
+"""
+import copy
+import uuid
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage, get_storage_class
+
+CSV_FORMAT = "csv"
+XLSX_FORMAT = "xlsx"
+FORMATS = (CSV_FORMAT, XLSX_FORMAT)
+
+STATUS_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def get_file_format(file_name: str) -> Optional[str]:
+    """Get supported format of file by its extension."""
+    file_format = file_name.rsplit(".", 1)[-1].lower()
+    return file_format if file_format in FORMATS else None
+
+
+class BackgroundJob:
+    """Kind of background job, stores statuses of its runs in cache."""
+
+    def __init__(
+        self,
+        name: str,
+        initial_status: Optional[dict] = None,
+        storage_setting: Optional[str] = None,
+    ):
+        """Store job name and values of not started run.
+
+        `name` is prefix of cache keys, `storage_setting` is name of setting
+        with storage class of job files.
+        """
+        self.name = name
+        self.initial_status = initial_status or {}
+        self.storage_setting = storage_setting
+
+    def get_initial_status(self, **values) -> dict:
+        """Get status of not started run, passed values are added to it."""
+        return {
+            "is_done": False,
+            "is_failed": False,
+            "error": None,
+            **copy.deepcopy(self.initial_status),
+            **values,
+        }
+
+    def start(self, **values) -> str:
+        """Store initial status of new run and return its id."""
+        job_id = str(uuid.uuid4())
+        self.set_status(job_id, self.get_initial_status(**values))
+        return job_id
+
+    def get_status(self, job_id: str) -> Optional[dict]:
+        """Get status of run."""
+        return cache.get(self._get_key(job_id))
+
+    def set_status(self, job_id: str, status: dict):
+        """Store status of run."""
+        cache.set(self._get_key(job_id), status, STATUS_CACHE_TIMEOUT)
+
+    def fail(self, job_id: str, error: Exception):
+        """Mark run as failed, progress stored before error is kept."""
+        status = self.get_status(job_id) or self.get_initial_status()
+        status.update(is_done=True, is_failed=True, error=str(error))
+        self.set_status(job_id, status)
+
+    def get_storage(self):
+        """Get storage for files of job, default one if it isn't set."""
+        storage_class = None
+        if self.storage_setting:
+            storage_class = getattr(settings, self.storage_setting)
+        if storage_class:
+            return get_storage_class(storage_class)()
+        return default_storage
+
+    def _get_key(self, job_id: str) -> str:
+        """Get cache key for status of run."""
+        return f"{self.name}:{job_id}"
@@ -0,0 +1,172 @@
+"""Two tier cache for hot data.
+
+Data which is read on almost every request (e.g. training types) is kept in
+memory of process (LRU with TTL) in front of shared Django cache, so most
+reads don't even go to redis. Values are pickled in both tiers, so changing
+of got value doesn't change cached one.
+
+Local tier of other processes isn't invalidated, changes are visible there
+after `TWO_TIER_CACHE_LOCAL_TIMEOUT`. Use it only for data which can be
+stale for this time or which keys contain version.
+
+Hits and misses of each cache are counted, check `get_stats`.
+"""
+import pickle
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+_MISSING = object()
+
+TWO_TIER_CACHES: dict[str, "TwoTierCache"] = {}
+
+
+class TwoTierCache:
+    """Process local LRU cache with TTL in front of Django cache."""
+
+    def __init__(
+        self,
+        name: str,
+        max_size: Optional[int] = None,
+        local_timeout: Optional[int] = None,
+        alias: str = DEFAULT_CACHE_ALIAS,
+    ):
+        """Register cache with unique name, it's used as keys prefix."""
+        self.name = name
+        self.max_size = max_size
+        self.local_timeout = local_timeout
+        self.alias = alias
+        self._local: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = Counter()
+        TWO_TIER_CACHES[name] = self
+
+    @property
+    def shared(self):
+        """Get shared Django cache."""
+        return caches[self.alias]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get value from local tier, then from shared one."""
+        value = self._get_local(key)
+        if value is not _MISSING:
+            self._count("local_hits")
+            return value
+        self._count("local_misses")
+
+        value = self.shared.get(self._make_key(key), _MISSING)
+        if value is _MISSING:
+            self._count("shared_misses")
+            return default
+        self._count("shared_hits")
+        self._set_local(key, value)
+        return value
+
+    def set(self, key: str, value: Any, timeout=DEFAULT_TIMEOUT):
+        """Put value to both tiers."""
+        self.shared.set(self._make_key(key), value, timeout)
+        self._set_local(key, value, timeout)
+
+    def get_or_set(
+        self,
+        key: str,
+        default: Callable[[], Any],
+        timeout=DEFAULT_TIMEOUT,
+    ) -> Any:
+        """Get value or calculate and cache it if it's missing.
+
+        `None` values are not cached.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = default()
+            if value is not None:
+                self.set(key, value, timeout)
+        return value
+
+    def delete(self, key: str):
+        """Remove value from both tiers."""
+        with self._lock:
+            self._local.pop(key, None)
+        self.shared.delete(self._make_key(key))
+
+    def clear_local(self):
+        """Remove all values from local tier."""
+        with self._lock:
+            self._local.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get counts of hits and misses of both tiers."""
+        with self._lock:
+            stats = dict(
+                local_hits=0,
+                local_misses=0,
+                shared_hits=0,
+                shared_misses=0,
+            )
+            stats.update(self._stats)
+            stats["local_size"] = len(self._local)
+        return stats
+
+    def _get_local(self, key: str) -> Any:
+        """Get not expired value from local tier."""
+        with self._lock:
+            expires_at, pickled = self._local.get(key, (None, None))
+            if expires_at is None:
+                return _MISSING
+            if expires_at <= time.monotonic():
+                del self._local[key]
+                return _MISSING
+            self._local.move_to_end(key)
+        return pickle.loads(pickled)
+
+    def _set_local(self, key: str, value: Any, timeout=DEFAULT_TIMEOUT):
+        """Put value to local tier, least recently used values are dropped.
+
+        Value is kept locally not longer than its shared timeout.
+        """
+        local_timeout = self._get_local_timeout()
+        if timeout is not DEFAULT_TIMEOUT and timeout is not None:
+            local_timeout = min(local_timeout, timeout)
+        if local_timeout <= 0:
+            return
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._local[key] = (time.monotonic() + local_timeout, pickled)
+            self._local.move_to_end(key)
+            while len(self._local) > self._get_max_size():
+                self._local.popitem(last=False)
+
+    def _get_local_timeout(self) -> int:
+        """Get time in seconds while values are kept in local tier."""
+        if self.local_timeout is not None:
+            return self.local_timeout
+        return settings.TWO_TIER_CACHE_LOCAL_TIMEOUT
+
+    def _get_max_size(self) -> int:
+        """Get max count of values in local tier."""
+        if self.max_size is not None:
+            return self.max_size
+        return settings.TWO_TIER_CACHE_LOCAL_MAX_SIZE
+
+    def _make_key(self, key: str) -> str:
+        """Get key for shared cache."""
+        return f"{self.name}:{key}"
+
+    def _count(self, stat: str):
+        """Increase counter of hits or misses."""
+        with self._lock:
+            self._stats[stat] += 1
+
+
+def get_stats() -> dict[str, dict[str, int]]:
+    """Get hits and misses of all two tier caches of process."""
+    return {
+        name: two_tier_cache.get_stats()
+        for name, two_tier_cache in TWO_TIER_CACHES.items()
+    }
@@ -5,7 +5,14 @@ from apps.core.import_export.widgets import CharWidget
 
 
 class ModelResource(BaseModelResource):
-    """Override to add custom widgets."""
+    """Override to add custom widgets.
+
+    Widgets with `prepare` method (e.g. `CreatableManyToManyWidget`) get all
+    values of their column before import, so they can resolve related
+    objects of whole import at once. Widgets with `prefetch` method (e.g.
+    `FileWidget`) get them before import transaction is started, so slow
+    work (e.g. download of files) doesn't keep transaction open.
+    """
 
     WIDGETS_MAP = {
         'ManyToManyField': 'get_m2m_widget',
@@ -29,3 +36,47 @@ class ModelResource(BaseModelResource):
         'BooleanField': widgets.BooleanWidget,
         'CICharField': CharWidget,
     }
+
+    def import_data(self, dataset, *args, **kwargs):
+        """Prefetch data of widgets before import transaction."""
+        self.prefetch(dataset.dict)
+        return super().import_data(dataset, *args, **kwargs)
+
+    def prefetch(self, rows):
+        """Pass column values of rows to widgets which prefetch them."""
+        rows = list(rows)
+        for field in self.get_import_fields():
+            if hasattr(field.widget, 'prefetch'):
+                field.widget.prefetch(
+                    row.get(field.column_name) for row in rows
+                )
+
+    def before_import(self, dataset, using_transactions, dry_run, **kwargs):
+        """Pass column values to widgets which prepare them in bulk."""
+        super().before_import(dataset, using_transactions, dry_run, **kwargs)
+        for field in self.get_import_fields():
+            if (
+                hasattr(field.widget, 'prepare')
+                and field.column_name in dataset.headers
+            ):
+                field.widget.prepare(dataset[field.column_name])
+
+    def after_import(
+        self,
+        dataset,
+        result,
+        using_transactions,
+        dry_run,
+        **kwargs,
+    ):
+        """Reset prepared widgets."""
+        super().after_import(
+            dataset,
+            result,
+            using_transactions,
+            dry_run,
+            **kwargs,
+        )
+        for field in self.get_import_fields():
+            if hasattr(field.widget, 'reset'):
+                field.widget.reset()
@@ -1,29 +1,104 @@
+from typing import Iterable, Optional
+
 from import_export.widgets import CharWidget as BaseCharWidget
 from import_export.widgets import ManyToManyWidget
 
+from libs.import_export.utils import get_clear_q_filter, get_normalized_key
+
 
 class CreatableManyToManyWidget(ManyToManyWidget):
-    """Overrides to add object creation."""
+    """Overrides to add object creation.
+
+    Objects are matched by `field`, missing ones are created. Resource
+    calls `prepare` with all values of column before import, so objects of
+    whole import are resolved with bulk queries and rows are cleaned
+    without queries.
+    """
+
+    def __init__(self, model, separator=None, field=None, *args, **kwargs):
+        super().__init__(model, separator, field, *args, **kwargs)
+        self._instances: Optional[dict] = None
+
+    def prepare(self, values: Iterable):
+        """Resolve objects of all passed column values."""
+        self._instances = self.resolve({
+            name
+            for value in values
+            for name in self.get_names(value)
+        })
+
+    def reset(self):
+        """Forget objects resolved by `prepare`."""
+        self._instances = None
 
     def clean(self, value, row=None, *args, **kwargs):
-        instances = super().clean(value, row, *args, **kwargs)
-        if instances:
-            return instances
+        """Get objects of value, missing ones are created."""
+        names = {
+            get_normalized_key(name): name for name in self.get_names(value)
+        }
+        instances = self._instances or {}
+        missing_names = {
+            name for key, name in names.items() if key not in instances
+        }
+        if missing_names:
+            instances = {**instances, **self.resolve(missing_names)}
+        not_resolved_names = [
+            name for key, name in names.items() if key not in instances
+        ]
+        if not_resolved_names:
+            raise ValueError(
+                f"Can't create {self.model._meta.verbose_name}: "
+                f"{', '.join(not_resolved_names)}"
+            )
+        return [instances[key] for key in names]
 
+    def get_names(self, value) -> list[str]:
+        """Split value of cell to list of values of `field`."""
+        if not value:
+            return []
         if isinstance(value, (float, int)):
-            field_values = [int(value)]
-        else:
-            field_values = value.split(self.separator)
-
-        instances = []
-        for field_value in field_values:
-            instances.append(
-                self.model.objects.create(
-                    **{self.field: field_value}
-                )
+            return [str(int(value))]
+        return list(filter(None, (
+            name.strip() for name in value.split(self.separator)
+        )))
+
+    def resolve(self, names: Iterable[str]) -> dict:
+        """Get objects by normalized keys of `field`, create missing ones.
+
+        Values are matched regardless of case and extra whitespaces (check
+        `get_clear_q_filter`).
+
+        Makes one query if all objects exist and three queries otherwise.
+        """
+        names = set(names)
+        if not names:
+            return {}
+        instances = self._get_instances(names)
+        missing_names = {
+            get_normalized_key(name): name
+            for name in names
+            if get_normalized_key(name) not in instances
+        }
+        if missing_names:
+            self.model.objects.bulk_create(
+                [
+                    self.model(**{self.field: name})
+                    for name in missing_names.values()
+                ],
+                ignore_conflicts=True,
             )
+            instances.update(self._get_instances(missing_names.values()))
         return instances
 
+    def _get_instances(self, names: Iterable[str]) -> dict:
+        """Get existing objects by normalized keys of `field`."""
+        return {
+            get_normalized_key(str(getattr(instance, self.field))): instance
+            for instance in self.model.objects.filter(
+                get_clear_q_filter(names, self.field),
+            )
+        }
+
 
 class CharWidget(BaseCharWidget):
 
@@ -0,0 +1,68 @@
+"""Lookups for case insensitive text fields which could use indexes.
+
+`CICharField` columns have `citext` type, while `pg_trgm` operator classes
+work only with `text`. So trigram indexes are created for `column::text`
+expression and lookups here cast column to `text` the same way, that's
+how postgres planner can use these indexes.
+
+Example of index:
+    GinIndex(
+        OpClass(Cast("name", models.TextField()), name="gin_trgm_ops"),
+        name="app_model_name_trgm",
+    )
+
+`normalized_key` transform is used for whitespace and case insensitive
+matching with b-tree expression index instead of `iregex` scan.
+
+Example of index:
+    models.Index(NormalizedKey("name"), name="app_model_name_key")
+"""
+from django.contrib.postgres.fields import CICharField
+from django.contrib.postgres.lookups import TrigramSimilar
+from django.db.models import CharField, TextField, Transform, lookups
+
+
+class TextCastMixin:
+    """Cast left side of lookup to `text`."""
+
+    def process_lhs(self, compiler, connection, lhs=None):
+        lhs_sql, params = super().process_lhs(compiler, connection, lhs)
+        return f"({lhs_sql})::text", params
+
+
+class TextIContains(TextCastMixin, lookups.IContains):
+    """Case insensitive containment using `ILIKE`.
+
+    Unlike `icontains` it doesn't wrap column in `UPPER()`, so trigram
+    index could be used.
+    """
+    lookup_name = "text_icontains"
+
+    def as_sql(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        params = tuple(lhs_params) + tuple(rhs_params)
+        return f"{lhs_sql} ILIKE {rhs_sql}", params
+
+
+class TextTrigramSimilar(TextCastMixin, TrigramSimilar):
+    """`trigram_similar` which could use trigram index."""
+    lookup_name = "text_trigram_similar"
+
+
+class NormalizedKey(Transform):
+    """Lowered value with runs of whitespaces replaced by single space.
+
+    Python counterpart is `libs.import_export.utils.get_normalized_key`.
+    """
+    lookup_name = "normalized_key"
+    output_field = TextField()
+    template = (
+        r"LOWER(REGEXP_REPLACE((%(expressions)s)::text, '\s+', ' ', 'g'))"
+    )
+
+
+CICharField.register_lookup(TextIContains)
+CICharField.register_lookup(TextTrigramSimilar)
+CharField.register_lookup(NormalizedKey)
+TextField.register_lookup(NormalizedKey)
@@ -0,0 +1,68 @@
+from django.core.files.storage import default_storage
+
+import pytest
+
+from ..background_jobs import BackgroundJob, get_file_format
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+
+@pytest.fixture
+def job(settings):
+    """Job with list in initial status."""
+    settings.TEST_JOB_STORAGE = "django.core.files.storage.FileSystemStorage"
+    return BackgroundJob(
+        "test:job",
+        initial_status=dict(errors=[]),
+        storage_setting="TEST_JOB_STORAGE",
+    )
+
+
+def test_status_is_stored(job):
+    """Test that started run gets initial status which can be changed."""
+    job_id = job.start(user_id=1)
+    status = job.get_status(job_id)
+    assert status == dict(
+        is_done=False,
+        is_failed=False,
+        error=None,
+        errors=[],
+        user_id=1,
+    )
+
+    status["errors"].append("error")
+    assert job.get_initial_status()["errors"] == []
+    job.set_status(job_id, dict(status, is_done=True))
+    assert job.get_status(job_id)["is_done"]
+    assert job.get_status("unknown") is None
+
+
+def test_fail(job):
+    """Test that failed run keeps progress and stores error."""
+    job_id = job.start()
+    job.set_status(job_id, job.get_initial_status(errors=["row"]))
+
+    job.fail(job_id, ValueError("broken"))
+
+    assert job.get_status(job_id) == dict(
+        is_done=True,
+        is_failed=True,
+        error="broken",
+        errors=["row"],
+    )
+
+
+def test_get_storage(job, settings):
+    """Test that storage is taken from setting of job."""
+    assert job.get_storage().__class__.__name__ == "FileSystemStorage"
+    settings.TEST_JOB_STORAGE = None
+    assert job.get_storage() is default_storage
+
+
+@pytest.mark.parametrize(
+    "file_name, file_format",
+    [("words.CSV", "csv"), ("words.xlsx", "xlsx"), ("words.xls", None)],
+)
+def test_get_file_format(file_name, file_format):
+    """Test that only supported formats are detected."""
+    assert get_file_format(file_name) == file_format
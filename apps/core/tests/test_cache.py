@@ -0,0 +1,48 @@
+from django.core.cache import cache
+
+import pytest
+
+from ..cache import TwoTierCache
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+
+@pytest.fixture
+def two_tier_cache():
+    """Cache with two values in local tier."""
+    cache.clear()
+    yield TwoTierCache("test", max_size=2, local_timeout=60)
+    cache.clear()
+
+
+def test_values_are_got_from_local_tier(two_tier_cache):
+    """Test that local tier is used before shared one."""
+    two_tier_cache.set("key", ["value"])
+    two_tier_cache.get("key").append("changed")
+
+    assert two_tier_cache.get("key") == ["value"]
+    stats = two_tier_cache.get_stats()
+    assert stats["local_hits"] == 2
+    assert stats["shared_hits"] == 0
+
+
+def test_least_recently_used_values_are_dropped(two_tier_cache):
+    """Test that local tier keeps limited count of values."""
+    for key in ("first", "second", "third"):
+        two_tier_cache.set(key, key)
+
+    assert two_tier_cache.get_stats()["local_size"] == 2
+    assert two_tier_cache.get("first") == "first"
+    stats = two_tier_cache.get_stats()
+    assert stats["local_misses"] == 1
+    assert stats["shared_hits"] == 1
+
+
+def test_deleted_values_are_missing(two_tier_cache):
+    """Test that deleted value is removed from both tiers."""
+    two_tier_cache.set("key", "value")
+    two_tier_cache.delete("key")
+
+    assert two_tier_cache.get("key") is None
+    assert two_tier_cache.get_or_set("key", lambda: "new") == "new"
+    assert two_tier_cache.get("key") == "new"
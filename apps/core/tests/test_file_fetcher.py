@@ -0,0 +1,114 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.cache import cache
+from django.core.files.storage import FileSystemStorage
+
+import pytest
+
+from libs.import_export.fetcher import RemoteFilesFetcher
+from libs.import_export.utils import DownloadError
+from libs.import_export.widgets import FileWidget
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+FILES = {
+    "/cat.png": b"cat",
+    "/cat-copy.png": b"cat",
+    "/dog.png": b"dog",
+    "/big.png": b"x" * 1024,
+}
+
+
+class FilesHandler(BaseHTTPRequestHandler):
+    """Handler which serves `FILES` and records requested paths."""
+
+    def do_GET(self):  # noqa: N802
+        """Return file content or 404."""
+        self.server.requested_paths.append(self.path)
+        content = FILES.get(self.path)
+        if content is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        """Don't log requests."""
+
+
+@pytest.fixture
+def server():
+    """Local HTTP server with files."""
+    cache.clear()
+    http_server = ThreadingHTTPServer(("127.0.0.1", 0), FilesHandler)
+    http_server.requested_paths = []
+    thread = threading.Thread(target=http_server.serve_forever, daemon=True)
+    thread.start()
+    yield http_server
+    http_server.shutdown()
+    http_server.server_close()
+    cache.clear()
+
+
+@pytest.fixture
+def fetcher(tmp_path):
+    """Fetcher which saves files to temporary directory."""
+    return RemoteFilesFetcher(
+        upload_to="images",
+        storage=FileSystemStorage(location=tmp_path),
+        max_size=512,
+    )
+
+
+def _url(server, path: str) -> str:
+    """Get URL of file on local server."""
+    host, port = server.server_address
+    return f"http://{host}:{port}{path}"
+
+
+def test_same_content_is_stored_once(server, fetcher, tmp_path):
+    """Test that files with the same content are saved once."""
+    urls = [_url(server, path) for path in ("/cat.png", "/cat-copy.png")]
+
+    names = fetcher.fetch(urls + urls)
+
+    assert len(server.requested_paths) == 2
+    assert names[urls[0]] == names[urls[1]]
+    assert len(list((tmp_path / "images").iterdir())) == 1
+
+
+def test_downloaded_urls_are_cached(server, fetcher):
+    """Test that the same URL isn't downloaded again."""
+    url = _url(server, "/dog.png")
+    names = fetcher.fetch([url])
+
+    assert fetcher.fetch([url]) == names
+    assert server.requested_paths == ["/dog.png"]
+
+
+@pytest.mark.parametrize("path", ["/big.png", "/missing.png"])
+def test_download_errors_are_returned(server, fetcher, path):
+    """Test that too large and missing files are returned as errors."""
+    url = _url(server, path)
+
+    assert isinstance(fetcher.fetch([url])[url], DownloadError)
+
+
+def test_file_widget_uses_prefetched_files(server, settings, tmp_path):
+    """Test that widget cleans external URLs to downloaded files."""
+    settings.MEDIA_ROOT = tmp_path
+    settings.IMPORT_EXPORT_DOWNLOAD_MAX_SIZE = 512
+    widget = FileWidget(filename="image")
+    url = _url(server, "/dog.png")
+    big_url = _url(server, "/big.png")
+
+    widget.prefetch([f" {url} ", big_url, "/media/cat.png", None])
+
+    assert widget.clean(url).startswith("imports/image/")
+    assert widget.clean("/media/cat.png") == "cat.png"
+    with pytest.raises(ValueError):
+        widget.clean(big_url)
+    assert sorted(server.requested_paths) == ["/big.png", "/dog.png"]
@@ -0,0 +1,85 @@
+import re
+import unicodedata
+
+import pytest
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+from libs.import_export import utils
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+VALUES = [
+    "",
+    "  hello \t world\n",
+    "bell\x07 and\x00null",
+    "tab\x0bvertical",
+    " non breaking ",
+    "ﬁne ｆｕｌｌｗｉｄｔｈ",
+    "  Привет,   мир\x01 ",
+    "hello world",
+]
+
+
+def _normalize_string_value(value: str) -> str:
+    """Normalization before fast path was added."""
+    cleaned = " ".join(value.strip().split()).strip()
+    return unicodedata.normalize(
+        "NFKC",
+        re.sub(ILLEGAL_CHARACTERS_RE, "", cleaned),
+    )
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_normalize_string_value(value):
+    """Test that fast path gives the same result as full normalization."""
+    assert utils.normalize_string_value(value) == (
+        _normalize_string_value(value)
+    )
+
+
+def test_normalize_string_values():
+    """Test that columns with and without repeats are normalized."""
+    values = VALUES + VALUES[::-1]
+
+    assert utils.normalize_string_values(VALUES) == [
+        _normalize_string_value(value) for value in VALUES
+    ]
+    assert utils.normalize_string_values(values) == [
+        _normalize_string_value(value) for value in values
+    ]
+    assert utils.clean_sequence_of_string_values(values) == [
+        _normalize_string_value(value)
+        for value in values
+        if _normalize_string_value(value)
+    ]
+
+
+def test_clear_seq_items():
+    """Test that items are normalized and lowered."""
+    assert utils.clear_seq_items(["Name : Value", "ＡＢ", "Name : Value"]) == [
+        "name:value",
+        "ab",
+        "name:value",
+    ]
+
+
+def test_get_clear_q_filter():
+    """Test that many values are matched by normalized keys."""
+    q_filter = utils.get_clear_q_filter(["Hello   World", "hello world"], "en")
+
+    assert q_filter.children == [("en__normalized_key__in", {"hello world"})]
+
+
+def test_get_clear_q_filter_with_regex():
+    """Test that regex mode matches any of values."""
+    q_filter = utils.get_clear_q_filter(
+        ["Hello   World", "a+b"],
+        "en",
+        use_normalized_key=False,
+    )
+
+    assert q_filter.connector == "OR"
+    assert q_filter.children == [
+        ("en__iregex", r"^Hello\s+World$"),
+        ("en__iregex", r"^a\+b$"),
+    ]
@@ -0,0 +1,119 @@
+import base64
+from types import SimpleNamespace
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q
+
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+import pytest
+
+from apps.training.factories import UserWordFactory, WordFactory
+from apps.training.models import UserWord, Word
+from apps.users.factories import UserFactory
+
+from ..api.pagination import KeysetPagination
+
+
+@pytest.fixture
+def paginator():
+    """Paginator with two ordering fields."""
+    keyset_paginator = KeysetPagination()
+    keyset_paginator.keyset_ordering = ("word__english", "id")
+    return keyset_paginator
+
+
+def test_cursor_is_encoded_and_decoded(paginator):
+    """Test that cursor contains ordering values of item."""
+    item = SimpleNamespace(id=2, word=SimpleNamespace(english="cat"))
+    cursor = paginator.encode_cursor(item)
+    assert paginator.decode_cursor(cursor) == ["cat", "2"]
+    assert paginator.decode_cursor("") is None
+
+
+def test_invalid_cursor(paginator):
+    """Test that invalid cursor returns 404."""
+    with pytest.raises(NotFound):
+        paginator.decode_cursor("invalid")
+    with pytest.raises(NotFound):
+        paginator.decode_cursor(
+            base64.urlsafe_b64encode(b'[null, "2"]').decode(),
+        )
+
+
+def test_nullable_ordering_is_rejected(paginator):
+    """Test that nullable fields can't be used for keyset ordering."""
+    paginator.check_keyset_ordering(UserWord)
+    paginator.keyset_ordering = ("similar_words_computed_at", "id")
+    with pytest.raises(ImproperlyConfigured):
+        paginator.check_keyset_ordering(Word)
+
+
+def test_keyset_filter(paginator):
+    """Test that items after cursor are filtered."""
+    assert paginator.get_keyset_filter(["cat", "2"]) == (
+        Q(word__english__gte="cat") & (
+            Q(word__english__gt="cat") | Q(word__english="cat", id__gt="2")
+        )
+    )
+
+
+def _get_all_pages(queryset, keyset_ordering: tuple, limit: int) -> list:
+    """Get items of all keyset pages of queryset one page after another."""
+    view = SimpleNamespace(keyset_ordering=keyset_ordering)
+    items = []
+    cursor = ""
+    while cursor is not None:
+        paginator = KeysetPagination()
+        request = Request(APIRequestFactory().get(
+            "/",
+            dict(cursor=cursor, limit=limit),
+        ))
+        page = paginator.paginate_queryset(queryset, request, view)
+        assert len(page) <= limit
+        items.extend(page)
+        cursor = paginator.next_cursor
+    return items
+
+
+@pytest.mark.django_db
+def test_dictionary_pages_with_equal_english():
+    """Test that user words with equal english are paged without gaps."""
+    words = [
+        WordFactory(english=english)
+        for english in ("apple", "Banana", "cherry")
+    ]
+    for _ in range(3):
+        user = UserFactory()
+        for word in words:
+            UserWordFactory(user=user, word=word)
+    keyset_ordering = ("word__english", "id")
+    queryset = UserWord.objects.select_related("word")
+
+    items = _get_all_pages(queryset, keyset_ordering, limit=2)
+
+    assert [item.id for item in items] == list(
+        queryset.order_by(*keyset_ordering).values_list("id", flat=True),
+    )
+    assert len({item.id for item in items}) == len(words) * 3
+
+
+@pytest.mark.django_db
+def test_words_pages_with_equal_values():
+    """Test that words with equal ordering values are paged without gaps.
+
+    `english` of words is unique, so equal `russian` is used.
+    """
+    for english in ("apple", "Banana", "cherry", "date", "Elder"):
+        WordFactory(english=english, russian="фрукт")
+    keyset_ordering = ("russian", "id")
+    queryset = Word.objects.all()
+
+    items = _get_all_pages(queryset, keyset_ordering, limit=2)
+
+    assert [item.id for item in items] == list(
+        queryset.order_by(*keyset_ordering).values_list("id", flat=True),
+    )
+    assert len({item.id for item in items}) == 5
@@ -1,9 +1,119 @@
 from django.contrib import admin
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, StreamingHttpResponse
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import path
+from django.utils.translation import gettext_lazy as _
 
 from django_admin_inline_paginator.admin import TabularInlinePaginated
 from import_export.admin import ImportExportMixin
 
-from . import models, resources
+from apps.core import background_jobs
+
+from . import catalogue_export, forms, models, resources, tasks, words_import
+
+
+class CatalogueExportMixin:
+    """Mixin to export big catalogues without building dataset in memory.
+
+    Adds streaming CSV export of changelist (with applied search and
+    filters) and export of whole catalogue to file in background, check
+    `apps.training.catalogue_export`.
+    """
+    catalogue_export_name: str
+
+    def get_urls(self):
+        """Add urls of streaming and background export."""
+        info = self.get_model_info()
+        return [
+            path(
+                "export-stream/",
+                self.admin_site.admin_view(self.export_stream_view),
+                name="%s_%s_export_stream" % info,
+            ),
+            path(
+                "export-catalogue/",
+                self.admin_site.admin_view(self.export_catalogue_view),
+                name="%s_%s_export_catalogue" % info,
+            ),
+            path(
+                "export-catalogue/<str:export_id>/",
+                self.admin_site.admin_view(
+                    self.export_catalogue_status_view,
+                ),
+                name="%s_%s_export_catalogue_status" % info,
+            ),
+        ] + super().get_urls()
+
+    def export_stream_view(self, request):
+        """Stream changelist objects as CSV."""
+        if not self.has_export_permission(request):
+            raise PermissionDenied
+        rows = catalogue_export.export_rows(
+            self.get_export_resource_class()(),
+            catalogue_export.prefetch_related(
+                self.catalogue_export_name,
+                self.get_export_queryset(request),
+            ),
+        )
+        response = StreamingHttpResponse(
+            catalogue_export.stream_csv(rows),
+            content_type="text/csv",
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.catalogue_export_name}.csv"'
+        )
+        return response
+
+    def export_catalogue_view(self, request):
+        """Start export of whole catalogue in background."""
+        if not self.has_export_permission(request):
+            raise PermissionDenied
+        form = forms.CatalogueExportForm(data=request.POST or None)
+        if request.method == "POST" and form.is_valid():
+            export_id = catalogue_export.job.start()
+            tasks.export_catalogue.delay(
+                self.catalogue_export_name,
+                form.cleaned_data["file_format"],
+                export_id,
+            )
+            return redirect(
+                "admin:%s_%s_export_catalogue_status" % self.get_model_info(),
+                export_id=export_id,
+            )
+        return self._render_export_catalogue(request, form=form)
+
+    def export_catalogue_status_view(self, request, export_id):
+        """Show progress of export in background and link to file."""
+        if not self.has_export_permission(request):
+            raise PermissionDenied
+        status = catalogue_export.job.get_status(export_id)
+        if status is None:
+            raise Http404
+        file_url = None
+        if status["file_name"]:
+            file_url = catalogue_export.job.get_storage().url(
+                status["file_name"],
+            )
+        return self._render_export_catalogue(
+            request,
+            status=status,
+            file_url=file_url,
+        )
+
+    def _render_export_catalogue(self, request, **context):
+        """Render page of export in background."""
+        return TemplateResponse(
+            request,
+            "admin/training/export_catalogue.html",
+            dict(
+                self.admin_site.each_context(request),
+                opts=self.model._meta,
+                title=_("Export in background"),
+                **context,
+            ),
+        )
 
 
 @admin.register(models.TrainingType)
@@ -98,9 +208,15 @@ class UserWordAdmin(admin.ModelAdmin):
 
 
 @admin.register(models.Word)
-class WordAdmin(ImportExportMixin, admin.ModelAdmin):
-    """Admin class for ``Word`` model."""
+class WordAdmin(CatalogueExportMixin, ImportExportMixin, admin.ModelAdmin):
+    """Admin class for ``Word`` model.
+
+    Besides import of `ImportExportMixin` big files can be imported in
+    background, check `apps.training.words_import`.
+    """
     resource_class = resources.WordResource
+    catalogue_export_name = "word"
+    change_list_template = "admin/training/word/change_list.html"
 
     search_fields = ("english", "russian")
     filter_horizontal = ("categories",)
@@ -118,12 +234,77 @@ class WordAdmin(ImportExportMixin, admin.ModelAdmin):
     )
     readonly_fields = ("id",)
 
+    def get_queryset(self, request):
+        """Prefetch categories."""
+        return super().get_queryset(request).prefetch_related("categories")
+
     def _categories(self, instance):
         """Get all categories for word."""
         return ", ".join(
             [str(category) for category in instance.categories.all()]
         )
 
+    def get_urls(self):
+        """Add urls of words import in background."""
+        info = self.get_model_info()
+        return [
+            path(
+                "import-words/",
+                self.admin_site.admin_view(self.import_words_view),
+                name="%s_%s_import_words" % info,
+            ),
+            path(
+                "import-words/<str:import_id>/",
+                self.admin_site.admin_view(self.import_words_status_view),
+                name="%s_%s_import_words_status" % info,
+            ),
+        ] + super().get_urls()
+
+    def import_words_view(self, request):
+        """Upload words file and start its import in background."""
+        if not self.has_import_permission(request):
+            raise PermissionDenied
+        form = forms.WordsImportForm(
+            data=request.POST or None,
+            files=request.FILES or None,
+        )
+        if request.method == "POST" and form.is_valid():
+            file = form.cleaned_data["file"]
+            import_id = words_import.job.start()
+            file_format = background_jobs.get_file_format(file.name)
+            file_name = words_import.job.get_storage().save(
+                f"imports/words/{import_id}.{file_format}",
+                file,
+            )
+            tasks.import_words.delay(file_name, file_format, import_id)
+            return redirect(
+                "admin:%s_%s_import_words_status" % self.get_model_info(),
+                import_id=import_id,
+            )
+        return self._render_import_words(request, form=form)
+
+    def import_words_status_view(self, request, import_id):
+        """Show progress of words import in background."""
+        if not self.has_import_permission(request):
+            raise PermissionDenied
+        status = words_import.job.get_status(import_id)
+        if status is None:
+            raise Http404
+        return self._render_import_words(request, status=status)
+
+    def _render_import_words(self, request, **context):
+        """Render page of words import in background."""
+        return TemplateResponse(
+            request,
+            "admin/training/word/import_words.html",
+            dict(
+                self.admin_site.each_context(request),
+                opts=self.model._meta,
+                title=_("Import words in background"),
+                **context,
+            ),
+        )
+
 
 class WordInline(TabularInlinePaginated):
     model = models.Word.categories.through
@@ -131,9 +312,15 @@ class WordInline(TabularInlinePaginated):
 
 
 @admin.register(models.Category)
-class CategoryAdmin(ImportExportMixin, admin.ModelAdmin):
+class CategoryAdmin(
+    CatalogueExportMixin,
+    ImportExportMixin,
+    admin.ModelAdmin,
+):
     """Admin class for ``Category`` model."""
     resource_class = resources.CategoryResource
+    catalogue_export_name = "category"
+    change_list_template = "admin/training/category/change_list.html"
     search_fields = ("name",)
     list_display = (
         "id",
@@ -1,4 +1,5 @@
 from drf_spectacular.utils import (
+    OpenApiParameter,
     extend_schema,
     extend_schema_view,
 )
@@ -10,7 +11,25 @@ extend_schema_view(
     add_category_words=extend_schema(
         request=serializers.CategoryIdSerializer,
         responses={
-            200: None
+            200: serializers.AddCategoryWordsStatusSerializer,
+            202: serializers.AddCategoryWordsStatusSerializer,
+        }
+    ),
+    add_category_words_status=extend_schema(
+        parameters=[
+            OpenApiParameter("status_id", str, OpenApiParameter.PATH),
+        ],
+    ),
+    bulk_add=extend_schema(
+        request=serializers.BulkAddWordsSerializer,
+        responses={
+            200: serializers.BulkWordResultSerializer(many=True),
+        }
+    ),
+    bulk_remove=extend_schema(
+        request=serializers.BulkRemoveWordsSerializer,
+        responses={
+            200: serializers.BulkWordResultSerializer(many=True),
         }
     ),
 )(views.DictionaryApiViewSet)
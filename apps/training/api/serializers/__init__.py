@@ -1,9 +1,15 @@
 from .category import CategorySerializer
 from .dictionary import (
+    AddCategoryWordsStatusSerializer,
     AddWordsToTrainingSerializer,
+    BulkAddWordsSerializer,
+    BulkRemoveWordsSerializer,
+    BulkWordResultSerializer,
+    BulkWordsSerializer,
     CategoryIdSerializer,
     UserWordCreateSerializer,
     UserWordRemoveSerializer,
+    UserWordsCounterSerializer,
     UserWordSerializer,
     WordSerializer,
 )
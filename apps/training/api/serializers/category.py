@@ -6,7 +6,8 @@ from apps.training.models import Category
 
 class CategorySerializer(ModelBaseSerializer):
     """Category for list view."""
-    words_count = serializers.SerializerMethodField()
+    words_count = serializers.IntegerField(read_only=True)
+    user_words_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Category
@@ -15,8 +16,5 @@ class CategorySerializer(ModelBaseSerializer):
             "name",
             "image",
             "words_count",
+            "user_words_count",
         )
-
-    def get_words_count(self, obj) -> int:
-        """Get count of words in category."""
-        return obj.words.count()
@@ -1,13 +1,58 @@
+from django.conf import settings
+from django.db.models import Manager
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
 
-from apps.core.api.serializers import BaseSerializer, ModelBaseSerializer
-from apps.training import models
+from apps.core.api.serializers import (
+    BaseListSerializer,
+    BaseSerializer,
+    ModelBaseSerializer,
+)
+from apps.training import dictionary, models, trainings
+
+
+class IsLinkedField(serializers.BooleanField):
+    """Field for `is_linked` of word.
+
+    Value is taken from `linked_words_ids` of context if it's there,
+    otherwise from `is_linked` annotation (check `WordQuerySet`).
+    """
+
+    def __init__(self, **kwargs):
+        """Make field read only."""
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        """Check if word is in linked words ids."""
+        linked_words_ids = self.context.get("linked_words_ids")
+        if linked_words_ids is not None:
+            return instance.id in linked_words_ids
+        return super().get_attribute(instance)
+
+
+class WordListSerializer(BaseListSerializer):
+    """List serializer which gets linked words of page with one query."""
+
+    def to_representation(self, data):
+        """Put ids of linked words to context before serialization."""
+        words = list(data.all() if isinstance(data, Manager) else data)
+        is_annotated = bool(words) and hasattr(words[0], "is_linked")
+        if (
+            not is_annotated
+            and not self.context.get("catalogue_only")
+            and self._user is not None
+            and self._user.is_authenticated
+        ):
+            self.context["linked_words_ids"] = models.Word.objects.filter(
+                id__in=[word.id for word in words],
+            ).get_linked_ids(self._user)
+        return super().to_representation(words)
 
 
 class WordSerializer(ModelBaseSerializer):
-    is_linked = serializers.BooleanField(read_only=True)
+    is_linked = IsLinkedField()
 
     class Meta:
         model = models.Word
@@ -17,6 +62,7 @@ class WordSerializer(ModelBaseSerializer):
             "russian",
             "is_linked"
         )
+        list_serializer_class = WordListSerializer
 
 
 class UserWordSerializer(ModelBaseSerializer):
@@ -51,10 +97,12 @@ class UserWordRemoveSerializer(BaseSerializer):
     def validate_word(self, word_id):
         """Validate passed word id.
 
-        Check that word linked to user.
+        Check that word is in user dictionary, so nothing is cleaned up for
+        word which can't be removed.
         """
-        if not models.Word.objects.filter(
-                user_words__user=self._user,
+        if not models.UserWord.objects.filter(
+            user=self._user,
+            word_id=word_id,
         ).exists():
             raise serializers.ValidationError(
                 _("User don't have this word")
@@ -66,14 +114,66 @@ class UserWordRemoveSerializer(BaseSerializer):
 
         Delete training where this word was.
         """
-        word_id = self.validated_data["word"]
-        models.Training.objects.filter(
-            questions__user_word__word_id=word_id,
-        ).delete()
-        models.UserWord.objects.get(
-            user=self._user,
-            word_id=word_id,
-        ).delete()
+        dictionary.remove_words(
+            user_id=self._user.id,
+            words_ids=[self.validated_data["word"]],
+        )
+
+
+class BulkWordsSerializer(BaseSerializer):
+    """Serializer for words which are added or removed with one request."""
+    words = serializers.ListField(
+        child=serializers.CharField(),
+        allow_empty=False,
+        max_length=settings.TRAINING_BULK_WORDS_MAX_COUNT,
+    )
+
+
+class BulkWordResultSerializer(serializers.Serializer):
+    """Serializer for result of adding or removing of one word."""
+    word = serializers.CharField()
+    result = serializers.ChoiceField(choices=(
+        dictionary.ADDED,
+        dictionary.ALREADY_ADDED,
+        dictionary.REMOVED,
+        dictionary.NOT_IN_DICTIONARY,
+        dictionary.NOT_FOUND,
+    ))
+
+
+class BulkAddWordsSerializer(BulkWordsSerializer):
+    """Serializer to add many words to dictionary."""
+
+    def save(self, **kwargs):
+        """Add words and return results of each word."""
+        return dictionary.add_words(
+            user_id=self._user.id,
+            words_ids=self.validated_data["words"],
+        )
+
+
+class BulkRemoveWordsSerializer(BulkWordsSerializer):
+    """Serializer to remove many words from dictionary."""
+
+    def save(self, **kwargs):
+        """Remove words and return results of each word."""
+        return dictionary.remove_words(
+            user_id=self._user.id,
+            words_ids=self.validated_data["words"],
+        )
+
+
+class UserWordsCounterSerializer(ModelBaseSerializer):
+    """Serializer for counters of user dictionary."""
+
+    class Meta:
+        model = models.UserWordsCounter
+        fields = (
+            "words_count",
+            "new_words_count",
+            "in_study_words_count",
+            "learned_words_count",
+        )
 
 
 class CategoryIdSerializer(serializers.Serializer):
@@ -81,6 +181,19 @@ class CategoryIdSerializer(serializers.Serializer):
     category_id = serializers.IntegerField()
 
 
+class AddCategoryWordsStatusSerializer(serializers.Serializer):
+    """Serializer for status of adding of category words.
+
+    `status_id` is returned if words are added in background, it should be
+    used to get status later. `is_failed` is set if adding in background
+    failed, words are not added in this case.
+    """
+    status_id = serializers.CharField(required=False)
+    is_done = serializers.BooleanField()
+    is_failed = serializers.BooleanField()
+    added_count = serializers.IntegerField(allow_null=True)
+
+
 class AddWordsToTrainingSerializer(BaseSerializer):
     """Serializer to add words to training type for future trainings."""
     words = serializers.PrimaryKeyRelatedField(
@@ -113,20 +226,17 @@ class AddWordsToTrainingSerializer(BaseSerializer):
     def save(self, **kwargs):
         """Save words for future trainings.
 
-        Also it deletes created training if no chosen words were in it.
+        Also it deletes created training if no chosen words were in it,
+        cached questions of training are removed with it.
         """
         words = self.validated_data["words"]
         training_type = self.validated_data["training_type"]
 
-        current_training = self._user.trainings.filter(
-            type=training_type,
-        ).first()
-        if current_training:
-            current_training_questions = current_training.questions.all()
-            if not current_training_questions.filter(
-                user_word__chosen_words__training_type=training_type,
-            ).exists():
-                current_training.delete()
+        trainings.invalidate_trainings(
+            user_id=self._user.id,
+            training_type_id=training_type.id,
+            without_chosen_words=True,
+        )
 
         user_words = self._user.user_words.all().filter(
             word__in=words,
@@ -1,13 +1,13 @@
-from operator import itemgetter
+from collections import Counter
 
-from django.db.models import F
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
 
 from apps.core.api.serializers import BaseSerializer
 
-from ... import models
+from ... import models, training_results
 
 
 class TrainingItemTranslationSerializer(BaseSerializer):
@@ -32,12 +32,7 @@ class FinishTrainingItemSerializer(BaseSerializer):
 
     def validate_word(self, word: str):
         """Validate if this word was in training"""
-        training = self._parent_from_list.training
-        current_training_words = [
-            question.user_word.word.english for question
-            in training.questions.all()
-        ]
-        if word not in current_training_words:
+        if word not in self._parent_from_list.training_user_words:
             raise serializers.ValidationError(
                 _(f"{word} wasn't in training"),
             )
@@ -58,18 +53,22 @@ class FinishTrainingSerializer(BaseSerializer):
         self.training = training
         super().__init__(*args, **kwargs)
 
+    @cached_property
+    def training_user_words(self) -> dict[str, models.UserWord]:
+        """Get user words of training by their english words.
+
+        It's calculated once and used to validate all result items.
+        """
+        return {
+            question.user_word.word.english: question.user_word
+            for question in self.training.questions.all()
+        }
+
     def validate(self, attrs):
         """Validate all words were passed."""
         attrs = super().validate(attrs)
-        result = attrs["result"]
-        words = [data["word"] for data in result]
-        current_training_words = [
-            question.user_word.word.english for question
-            in self.training.questions.all()
-        ]
-        current_training_words.sort()
-        words.sort()
-        if words != current_training_words:
+        words = Counter(data["word"] for data in attrs["result"])
+        if words != Counter(self.training_user_words.keys()):
             raise serializers.ValidationError(
                 _("Not all words were provided"),
             )
@@ -80,22 +79,11 @@ class FinishTrainingSerializer(BaseSerializer):
 
         Also it deletes questions to start new training.
         """
-        result = self.validated_data["result"]
-        right_words = list(filter(
-            itemgetter("is_true"),
-            result,
-        ))
-        right_words_ids = [result_item["word"] for result_item in right_words]
-        if len(right_words_ids) > 0:
-            models.UserWord.objects.filter(
-                user=self._user,
-                word_id__in=right_words_ids,
-            ).update(
-                rank=F("rank") + self.training.type.cost,
-            )
-            models.TrainingTypeUserWord.objects.filter(
-                training_type=self.training.type,
-                user_word__user=self._user,
-                user_word__word_id__in=right_words_ids,
-            ).delete()
-            self.training.delete()
+        training_results.apply_training_result(
+            training=self.training,
+            results={
+                self.training_user_words[result_item["word"]]:
+                    result_item["is_true"]
+                for result_item in self.validated_data["result"]
+            },
+        )
@@ -1,17 +1,59 @@
 from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
 
+from django_filters.rest_framework import DjangoFilterBackend
+
+from apps.core.api.filters import CITextSearchFilter
+from apps.core.api.pagination import KeysetPagination
 from apps.core.api.views import BaseViewSet
 from apps.training.models import Category
 
 from .. import serializers
+from .mixins import CatalogueCacheMixin
+
 
+class CategoryViewSet(
+    CatalogueCacheMixin,
+    BaseViewSet,
+    ListModelMixin,
+    RetrieveModelMixin,
+):
+    """ViewSet for category model.
 
-class CategoryViewSet(BaseViewSet, ListModelMixin, RetrieveModelMixin):
-    """ViewSet for category model"""
+    `user_words_count` of categories is added to cached catalogue page as
+    user overlay.
+    """
     queryset = Category.objects.all()
     serializer_class = serializers.CategorySerializer
+    filter_backends = [DjangoFilterBackend, CITextSearchFilter]
+    pagination_class = KeysetPagination
+    keyset_ordering = ("name", "id")
+    has_user_overlay = True
 
     search_fields = (
         "word__english",
         "word__russian",
     )
+
+    def get_queryset(self):
+        """Annotate with counts of all words and words of user."""
+        queryset = super().get_queryset().with_words_count()
+        if self.is_catalogue_only:
+            return queryset
+        return queryset.with_user_words_count(self.request.user)
+
+    def get_user_overlay(self, items: list) -> dict[str, dict]:
+        """Get `user_words_count` of categories of page."""
+        categories_ids = [item["id"] for item in items]
+        user_words_counts = dict(
+            Category.objects.filter(
+                id__in=categories_ids,
+            ).with_user_words_count(
+                self.request.user,
+            ).values_list("id", "user_words_count")
+        )
+        return {
+            str(category_id): dict(
+                user_words_count=user_words_counts.get(category_id, 0),
+            )
+            for category_id in categories_ids
+        }
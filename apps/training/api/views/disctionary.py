@@ -1,13 +1,17 @@
+from django.conf import settings
+from django.http import Http404
+
 from rest_framework import status
 from rest_framework.decorators import action
-from rest_framework.filters import SearchFilter
 from rest_framework.generics import get_object_or_404
 from rest_framework.mixins import CreateModelMixin, ListModelMixin
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from apps.core.api.filters import CITextSearchFilter
+from apps.core.api.pagination import KeysetPagination
 from apps.core.api.views import BaseViewSet
-from apps.training import models
+from apps.training import categories_pool, counters, dictionary, models, tasks
 
 from ...models import Category
 from .. import serializers
@@ -23,10 +27,17 @@ class DictionaryApiViewSet(
         "create": serializers.UserWordCreateSerializer,
         "destroy": serializers.UserWordCreateSerializer,
         "add_category_words": serializers.CategoryIdSerializer,
+        "add_category_words_status":
+            serializers.AddCategoryWordsStatusSerializer,
         "remove_from_dictionary": serializers.UserWordRemoveSerializer,
+        "bulk_add": serializers.BulkAddWordsSerializer,
+        "bulk_remove": serializers.BulkRemoveWordsSerializer,
         "add_words_to_training": serializers.AddWordsToTrainingSerializer,
+        "counter": serializers.UserWordsCounterSerializer,
     }
-    filter_backends = [SearchFilter]
+    filter_backends = [CITextSearchFilter]
+    pagination_class = KeysetPagination
+    keyset_ordering = ("word__english", "id")
     search_fields = (
         "word__english",
         "word__russian",
@@ -37,11 +48,15 @@ class DictionaryApiViewSet(
     def get_queryset(self):
         return models.UserWord.objects.filter(
             user=self.request.user
-        ).select_related("word").order_by("word__english")
+        ).select_related("word").order_by("word__english", "id")
 
     @action(methods=["POST"], detail=False, url_path="add-category-words")
     def add_category_words(self, request):
-        """Add all words from category to user."""
+        """Add all words from category to user.
+
+        Big categories are added in background, in this case response
+        contains `status_id` which should be used to get status.
+        """
         category_id_serializer = self.get_serializer(data=request.data)
         category_id_serializer.is_valid(raise_exception=True)
         category_id = category_id_serializer.data["category_id"]
@@ -49,12 +64,51 @@ class DictionaryApiViewSet(
             queryset=Category.objects.all(),
             id=category_id,
         )
-        self.request.user.words.add(
-            *category.words.exclude(
-                id__in=self.request.user.words.values("id")
+        words_count = len(categories_pool.get_category_words_ids(category.id))
+        threshold = settings.TRAINING_ADD_CATEGORY_WORDS_ASYNC_THRESHOLD
+        if words_count <= threshold:
+            added_count = dictionary.add_category_words(
+                user_id=request.user.id,
+                category_id=category.id,
             )
+            serializer = serializers.AddCategoryWordsStatusSerializer(dict(
+                is_done=True,
+                is_failed=False,
+                added_count=added_count,
+            ))
+            return Response(data=serializer.data, status=status.HTTP_200_OK)
+
+        status_id = dictionary.add_category_words_job.start(
+            user_id=request.user.id,
         )
-        return Response(status=status.HTTP_200_OK)
+        tasks.add_category_words.delay(
+            user_id=request.user.id,
+            category_id=category.id,
+            status_id=status_id,
+        )
+        serializer = serializers.AddCategoryWordsStatusSerializer(dict(
+            status_id=status_id,
+            is_done=False,
+            is_failed=False,
+            added_count=None,
+        ))
+        return Response(data=serializer.data, status=status.HTTP_202_ACCEPTED)
+
+    @action(
+        methods=["GET"],
+        detail=False,
+        url_path=r"add-category-words/(?P<status_id>[^/.]+)",
+    )
+    def add_category_words_status(self, request, status_id=None):
+        """Get status of adding of category words in background."""
+        add_status = dictionary.add_category_words_job.get_status(status_id)
+        if not add_status or add_status["user_id"] != request.user.id:
+            raise Http404
+        serializer = self.get_serializer(dict(
+            add_status,
+            status_id=status_id,
+        ))
+        return Response(data=serializer.data, status=status.HTTP_200_OK)
 
     @action(
         methods=["POST"],
@@ -68,6 +122,16 @@ class DictionaryApiViewSet(
         serializer.save()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @action(methods=["POST"], detail=False, url_path="bulk-add")
+    def bulk_add(self, request):
+        """Add many words to dictionary, already added words are skipped."""
+        return self._bulk_change_words(request)
+
+    @action(methods=["POST"], detail=False, url_path="bulk-remove")
+    def bulk_remove(self, request):
+        """Remove many words from dictionary."""
+        return self._bulk_change_words(request)
+
     @action(
         methods=["POST"],
         detail=False,
@@ -79,3 +143,28 @@ class DictionaryApiViewSet(
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(status=status.HTTP_200_OK)
+
+    @action(methods=["GET"], detail=False)
+    def counter(self, request):
+        """Get counters of words in dictionary."""
+        serializer = self.get_serializer(
+            counters.get_counter(request.user.id),
+        )
+        return Response(data=serializer.data, status=status.HTTP_200_OK)
+
+    def _bulk_change_words(self, request):
+        """Add or remove words and return result for each passed word."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = serializer.save()
+        results_serializer = serializers.BulkWordResultSerializer(
+            [
+                dict(word=word_id, result=result)
+                for word_id, result in results.items()
+            ],
+            many=True,
+        )
+        return Response(
+            data=results_serializer.data,
+            status=status.HTTP_200_OK,
+        )
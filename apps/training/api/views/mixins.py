@@ -0,0 +1,79 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from rest_framework.response import Response
+
+from apps.training import catalogue, counters
+
+
+class CatalogueCacheMixin:
+    """Mixin for lists of catalogue with cached and conditional responses.
+
+    Serialized page is cached per catalogue version and url without user
+    specific fields (`is_catalogue_only` is set for this). User specific
+    fields are added to page by `get_user_overlay`. ETag is built from
+    catalogue version, url and version of user dictionary (check
+    `apps.training.counters`), so `304 Not Modified` is returned without
+    database queries when nothing was changed.
+
+    `Last-Modified` is returned only if there is no user overlay, because
+    overlay can be changed without changes of catalogue.
+    """
+    is_catalogue_only = False
+    has_user_overlay = False
+
+    def list(self, request, *args, **kwargs):
+        """Return cached page of catalogue or `304 Not Modified`."""
+        version = catalogue.get_version()
+        url = request.build_absolute_uri()
+        etag = self._get_etag(version.tag, url)
+        last_modified = None if self.has_user_overlay else version.modified_at
+        not_modified_response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        if not_modified_response is not None:
+            return not_modified_response
+
+        data = catalogue.get_response_data(version.tag, self.basename, url)
+        if data is None:
+            self.is_catalogue_only = True
+            data = super().list(request, *args, **kwargs).data
+            catalogue.set_response_data(
+                version.tag,
+                self.basename,
+                url,
+                data,
+            )
+        if self.has_user_overlay:
+            items = data["results"] if isinstance(data, dict) else data
+            overlay = self.get_user_overlay(items)
+            for item in items:
+                item.update(overlay.get(str(item["id"]), {}))
+        response = Response(data=data)
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def get_serializer_context(self):
+        """Pass that user specific data shouldn't be serialized."""
+        context = super().get_serializer_context()
+        context["catalogue_only"] = self.is_catalogue_only
+        return context
+
+    def get_user_overlay(self, items: list) -> dict[str, dict]:
+        """Get user specific fields of items, mapping of id to fields."""
+        return {}
+
+    def _get_etag(self, version: str, url: str) -> str:
+        """Get ETag for catalogue version, url and user dictionary."""
+        parts = [version, url]
+        if self.has_user_overlay:
+            parts.append(counters.get_dictionary_version(self.request.user.id))
+        etag_hash = hashlib.md5(":".join(parts).encode()).hexdigest()
+        return f'"{etag_hash}"'
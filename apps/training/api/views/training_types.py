@@ -1,3 +1,4 @@
+from django.db.models import Prefetch
 from django.http import Http404
 
 from rest_framework import status
@@ -7,12 +8,14 @@ from rest_framework.mixins import ListModelMixin
 from rest_framework.response import Response
 
 from apps.core.api.views import BaseViewSet
-from apps.training import models
+from apps.training import cache, models
 from apps.training.api import serializers
 from apps.training.constants import TRAINING_TYPES_PROCESSORS_MAPPING
 
+from .mixins import CatalogueCacheMixin
 
-class TrainingTypeViewSet(BaseViewSet, ListModelMixin):
+
+class TrainingTypeViewSet(CatalogueCacheMixin, BaseViewSet, ListModelMixin):
     """ViewSet for training type."""
     queryset = models.TrainingType.objects.all()
     serializer_class = serializers.TrainingTypeSerializer
@@ -23,6 +26,16 @@ class TrainingTypeViewSet(BaseViewSet, ListModelMixin):
         finish=serializers.FinishTrainingSerializer,
     )
 
+    def get_object(self):
+        """Get training type from cache."""
+        training_type = cache.get_training_type(
+            self.kwargs[self.lookup_url_kwarg or self.lookup_field],
+        )
+        if training_type is None:
+            raise Http404
+        self.check_object_permissions(self.request, training_type)
+        return training_type
+
     @action(
         detail=True,
         methods=["POST"],
@@ -30,21 +43,27 @@ class TrainingTypeViewSet(BaseViewSet, ListModelMixin):
     def start(self, request, pk=None):
         """Start training."""
         training_type: models.TrainingType = self.get_object()
-        processor = TRAINING_TYPES_PROCESSORS_MAPPING[training_type.id](
-            training_type=training_type,
+        training_id = models.Training.objects.filter(
+            type=training_type,
             user=request.user,
-        )
-        is_enough_words = processor.check_enough_words()
-        if not is_enough_words:
-            error_message = processor.get_not_enough_words_error_message()
-            raise ValidationError(error_message)
-
-        serializer = self.get_serializer(
-            processor.generate_data_for_training(),
-            many=True,
-        )
+        ).values_list("id", flat=True).first()
+        data = None
+        if training_id is not None:
+            data = cache.get_training_data(
+                request.user.id,
+                training_type.id,
+                training_id,
+            )
+        if data is None:
+            data, training_id = self._generate_training_data(training_type)
+            cache.set_training_data(
+                request.user.id,
+                training_type.id,
+                training_id,
+                data,
+            )
         return Response(
-            data=serializer.data,
+            data=data,
             status=status.HTTP_200_OK,
         )
 
@@ -59,9 +78,16 @@ class TrainingTypeViewSet(BaseViewSet, ListModelMixin):
             type=training_type,
             user=request.user,
         ).select_related("type").prefetch_related(
-            "questions",
-            "questions__user_word",
-            "questions__user_word__word",
+            Prefetch(
+                "questions",
+                queryset=models.Question.objects.select_related(
+                    "user_word__word",
+                ).only(
+                    "training_id",
+                    "user_word__rank",
+                    "user_word__word__english",
+                ),
+            ),
         ).first()
         if not training:
             raise Http404
@@ -72,3 +98,26 @@ class TrainingTypeViewSet(BaseViewSet, ListModelMixin):
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(status=status.HTTP_200_OK)
+
+    def _generate_training_data(
+        self,
+        training_type: models.TrainingType,
+    ) -> tuple[list, int]:
+        """Generate rendered questions of training.
+
+        Returns questions and id of training.
+        """
+        processor = TRAINING_TYPES_PROCESSORS_MAPPING[training_type.id](
+            training_type=training_type,
+            user=self.request.user,
+        )
+        is_enough_words = processor.check_enough_words()
+        if not is_enough_words:
+            error_message = processor.get_not_enough_words_error_message()
+            raise ValidationError(error_message)
+
+        serializer = self.get_serializer(
+            processor.generate_data_for_training(),
+            many=True,
+        )
+        return serializer.data, processor.training.id
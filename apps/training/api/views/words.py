@@ -1,19 +1,30 @@
 from rest_framework.mixins import ListModelMixin
 
+from django_filters.rest_framework import DjangoFilterBackend
+
+from apps.core.api.filters import CITextSearchFilter
+from apps.core.api.pagination import KeysetPagination
 from apps.core.api.views import BaseViewSet
 from apps.training.api.filters import WordsFilter
 from apps.training.api.serializers import WordSerializer
 from apps.training.models import Word
 
+from .mixins import CatalogueCacheMixin
+
 
-class WordsViewSet(BaseViewSet, ListModelMixin):
+class WordsViewSet(CatalogueCacheMixin, BaseViewSet, ListModelMixin):
     """ViewSet for words with filtering.
 
-    It can be used to get words for category.
+    It can be used to get words for category. `is_linked` of words is
+    added to cached catalogue page as user overlay.
     """
     queryset = Word.objects.all()
     serializer_class = WordSerializer
     filterset_class = WordsFilter
+    filter_backends = [DjangoFilterBackend, CITextSearchFilter]
+    pagination_class = KeysetPagination
+    keyset_ordering = ("english", "id")
+    has_user_overlay = True
 
     search_fields = (
         "english",
@@ -21,5 +32,20 @@ class WordsViewSet(BaseViewSet, ListModelMixin):
     )
 
     def get_queryset(self):
-        """Annotate with is_linked."""
-        return super().get_queryset().with_is_linked(self.request.user).order_by("english")
+        """Order words by english.
+
+        `is_linked` is calculated for page of words by serializer (check
+        `WordListSerializer`).
+        """
+        return super().get_queryset().order_by("english", "id")
+
+    def get_user_overlay(self, items: list) -> dict[str, dict]:
+        """Get `is_linked` of words of page."""
+        words_ids = [item["id"] for item in items]
+        linked_words_ids = Word.objects.filter(
+            id__in=words_ids,
+        ).get_linked_ids(self.request.user)
+        return {
+            word_id: dict(is_linked=word_id in linked_words_ids)
+            for word_id in words_ids
+        }
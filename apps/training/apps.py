@@ -9,4 +9,5 @@ class TrainingAppConfig(AppConfig):
 
     def ready(self):
         super().ready()
-        from .api import schema # noqa
\ No newline at end of file
+        from .api import schema # noqa
+        from . import signals # noqa
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""Cache of trainings data.
+
+Rendered questions of in-progress training are cached, so repeated starts
+of the same training (e.g. when user refreshes training screen) don't
+generate questions and distractors again.
+
+Cache key is built from user, training type and training, so questions of
+finished training, which are cached by concurrent start after training is
+deleted, are never returned for next training. Cached data is also
+removed when training is deleted (check `apps.training.signals`).
+
+Training types are read by every start and finish of training, so they
+are kept in two tier cache (check `apps.core.cache`) and invalidated when
+training type is changed.
+"""
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.cache import TwoTierCache
+from apps.training import models
+
+TRAINING_DATA_CACHE_KEY = (
+    "training:data:{user_id}:{training_type_id}:{training_id}"
+)
+TRAINING_TYPE_CACHE_KEY = "training-type:{training_type_id}"
+
+reference_cache = TwoTierCache("training:reference")
+
+
+def get_training_data(
+    user_id: int,
+    training_type_id: str,
+    training_id: int,
+) -> Optional[list]:
+    """Get cached rendered questions of training."""
+    return cache.get(
+        _get_training_data_key(user_id, training_type_id, training_id),
+    )
+
+
+def set_training_data(
+    user_id: int,
+    training_type_id: str,
+    training_id: int,
+    data: list,
+):
+    """Cache rendered questions of training."""
+    cache.set(
+        _get_training_data_key(user_id, training_type_id, training_id),
+        data,
+        settings.TRAINING_DATA_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_training_data(
+    user_id: int,
+    training_type_id: str,
+    training_id: int,
+):
+    """Remove cached questions of training."""
+    cache.delete(
+        _get_training_data_key(user_id, training_type_id, training_id),
+    )
+
+
+def get_training_type(
+    training_type_id: str,
+) -> Optional[models.TrainingType]:
+    """Get training type by id from cache or database."""
+    return reference_cache.get_or_set(
+        TRAINING_TYPE_CACHE_KEY.format(training_type_id=training_type_id),
+        lambda: models.TrainingType.objects.filter(
+            id=training_type_id,
+        ).first(),
+        settings.TRAINING_REFERENCE_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_training_type(training_type_id: str):
+    """Remove cached training type."""
+    reference_cache.delete(
+        TRAINING_TYPE_CACHE_KEY.format(training_type_id=training_type_id),
+    )
+
+
+def _get_training_data_key(
+    user_id: int,
+    training_type_id: str,
+    training_id: int,
+) -> str:
+    """Get cache key for training data."""
+    return TRAINING_DATA_CACHE_KEY.format(
+        user_id=user_id,
+        training_type_id=training_type_id,
+        training_id=training_id,
+    )
@@ -0,0 +1,77 @@
+"""Version of catalogue.
+
+Catalogue (words, categories and training types) is changed only by admins
+(edit or import), so its API responses are cached per catalogue version and
+clients get `304 Not Modified` while version is the same (check
+`apps.training.api.views.mixins.CatalogueCacheMixin`).
+
+Version is stored in Django cache, so checking it doesn't need database
+queries. It's changed by signals of catalogue models and imports, check
+`apps.training.signals`.
+
+Responses are stored in two tier cache (check `apps.core.cache`), their
+keys contain version, so they don't become stale in process memory.
+"""
+import hashlib
+import random
+import time
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.cache import TwoTierCache
+
+VERSION_CACHE_KEY = "training:catalogue-version"
+RESPONSE_CACHE_KEY = "{version}:{name}:{url_hash}"
+
+responses_cache = TwoTierCache("training:catalogue")
+
+
+class CatalogueVersion(NamedTuple):
+    """Version of catalogue and time when it was changed."""
+    tag: str
+    modified_at: int
+
+
+def get_version() -> CatalogueVersion:
+    """Get current version of catalogue."""
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        version = _new_version()
+        if not cache.add(VERSION_CACHE_KEY, version, None):
+            version = cache.get(VERSION_CACHE_KEY, version)
+    return CatalogueVersion(*version)
+
+
+def bump_version():
+    """Change version of catalogue, so cached responses become stale."""
+    cache.set(VERSION_CACHE_KEY, _new_version(), None)
+
+
+def get_response_data(version: str, name: str, url: str) -> Optional[dict]:
+    """Get cached data of catalogue response."""
+    return responses_cache.get(_get_response_key(version, name, url))
+
+
+def set_response_data(version: str, name: str, url: str, data):
+    """Cache data of catalogue response for version."""
+    responses_cache.set(
+        _get_response_key(version, name, url),
+        data,
+        settings.TRAINING_CATALOGUE_CACHE_TIMEOUT,
+    )
+
+
+def _get_response_key(version: str, name: str, url: str) -> str:
+    """Get cache key of response data."""
+    return RESPONSE_CACHE_KEY.format(
+        version=version,
+        name=name,
+        url_hash=hashlib.md5(url.encode()).hexdigest(),
+    )
+
+
+def _new_version() -> tuple[str, int]:
+    """Generate new random version with current time."""
+    return f"{random.getrandbits(64):x}", int(time.time())
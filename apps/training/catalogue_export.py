@@ -0,0 +1,167 @@
+"""Streaming export of words and categories.
+
+Export of `ImportExportMixin` builds whole tablib dataset in memory, so big
+catalogue exports eat memory of web process. Here rows are produced one by
+one:
+* objects are fetched in chunks ordered by primary key (`pk > last pk`),
+  related objects of each chunk are fetched with `prefetch_related`
+  (`QuerySet.iterator` ignores it), so each chunk costs fixed count of
+  queries
+* CSV rows are written to response as soon as they are rendered
+  (`StreamingHttpResponse`)
+* XLSX is written by openpyxl in write only mode to file in background
+  (`apps.training.tasks.export_catalogue`), its progress is stored in status
+  of `job` (check `apps.core.background_jobs`)
+"""
+import csv
+import io
+import tempfile
+from typing import IO, Iterable, Iterator, Optional
+
+from django.conf import settings
+from django.core.files import File
+from django.db.models import QuerySet
+
+from import_export.resources import Resource
+from openpyxl import Workbook
+
+from apps.core import background_jobs
+from apps.training import resources
+
+# Exported resources and related objects fetched with each chunk
+RESOURCES = {
+    "word": (resources.WordResource, ("categories",)),
+    "category": (resources.CategoryResource, ()),
+}
+
+job = background_jobs.BackgroundJob(
+    "training:catalogue-export",
+    initial_status=dict(exported_rows=0, file_name=None),
+    storage_setting="TRAINING_CATALOGUE_EXPORT_STORAGE",
+)
+
+
+class _Echo:
+    """File-like object which returns written value instead of storing."""
+
+    def write(self, value: str) -> str:
+        """Return written value."""
+        return value
+
+
+def get_queryset(name: str) -> QuerySet:
+    """Get queryset of all objects of resource."""
+    resource_class, _ = RESOURCES[name]
+    return prefetch_related(name, resource_class().get_queryset())
+
+
+def prefetch_related(name: str, queryset: QuerySet) -> QuerySet:
+    """Prefetch only related objects which are exported by resource."""
+    _, prefetch = RESOURCES[name]
+    return queryset.prefetch_related(None).prefetch_related(*prefetch)
+
+
+def iterate_chunks(
+    queryset: QuerySet,
+    chunk_size: Optional[int] = None,
+) -> Iterator[list]:
+    """Iterate objects of queryset by chunks ordered by primary key."""
+    chunk_size = chunk_size or settings.TRAINING_CATALOGUE_EXPORT_CHUNK_SIZE
+    queryset = queryset.order_by("pk")
+    last_pk = None
+    while True:
+        chunk_queryset = queryset
+        if last_pk is not None:
+            chunk_queryset = queryset.filter(pk__gt=last_pk)
+        chunk = list(chunk_queryset[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        last_pk = chunk[-1].pk
+
+
+def export_rows(
+    resource: Resource,
+    queryset: QuerySet,
+    chunk_size: Optional[int] = None,
+) -> Iterator[list]:
+    """Get headers and rendered rows of objects one by one."""
+    yield resource.get_export_headers()
+    for chunk in iterate_chunks(queryset, chunk_size):
+        for obj in chunk:
+            yield resource.export_resource(obj)
+
+
+def stream_csv(rows: Iterable[list]) -> Iterator[str]:
+    """Render rows to CSV lines one by one."""
+    writer = csv.writer(_Echo())
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def export_to_storage(name: str, file_format: str, export_id: str) -> dict:
+    """Export all objects of resource to file in storage.
+
+    Progress is stored in status of `job` after each chunk. Returns status
+    of export.
+    """
+    resource_class, _ = RESOURCES[name]
+    status = job.get_initial_status()
+    rows = _track_progress(
+        export_rows(resource_class(), get_queryset(name)),
+        status,
+        export_id,
+    )
+    with tempfile.TemporaryFile() as file:
+        FILE_WRITERS[file_format](rows, file)
+        file.seek(0)
+        status["file_name"] = job.get_storage().save(
+            f"exports/{name}/{export_id}.{file_format}",
+            File(file),
+        )
+    status["is_done"] = True
+    job.set_status(export_id, status)
+    return status
+
+
+def _track_progress(
+    rows: Iterator[list],
+    status: dict,
+    export_id: str,
+) -> Iterator[list]:
+    """Count exported rows and store status after each chunk."""
+    chunk_size = settings.TRAINING_CATALOGUE_EXPORT_CHUNK_SIZE
+    yield next(rows)
+    for row in rows:
+        yield row
+        status["exported_rows"] += 1
+        if status["exported_rows"] % chunk_size == 0:
+            job.set_status(export_id, status)
+
+
+def _write_csv(rows: Iterable[list], file: IO[bytes]):
+    """Write rows to CSV file one by one."""
+    text_file = io.TextIOWrapper(file, encoding="utf-8", newline="")
+    writer = csv.writer(text_file)
+    for row in rows:
+        writer.writerow(row)
+    text_file.detach()
+
+
+def _write_xlsx(rows: Iterable[list], file: IO[bytes]):
+    """Write rows to XLSX file.
+
+    Workbook is in write only mode, so rows are flushed to temporary file
+    instead of being kept in memory.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for row in rows:
+        sheet.append(row)
+    workbook.save(file)
+
+
+FILE_WRITERS = {
+    background_jobs.CSV_FORMAT: _write_csv,
+    background_jobs.XLSX_FORMAT: _write_xlsx,
+}
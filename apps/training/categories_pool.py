@@ -0,0 +1,174 @@
+"""Random words of categories.
+
+Getting random words of category with `ORDER BY random()` sorts all words
+of category on every call. Instead of it ids of category words are loaded
+once and cached (both in process and in Django cache), and random words
+are sampled from cached ids, so cost of sampling doesn't depend on
+category size.
+
+Cached ids are invalidated with category version which is changed when
+words of category are changed, check `apps.training.signals`. Process
+keeps only last version of ids of recently used categories (count is
+limited by `TRAINING_CATEGORIES_POOLS_MAX_SIZE`).
+"""
+import random
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.training import models
+
+POOL_CACHE_KEY = "training:category-words:{category_id}:{version}"
+VERSION_CACHE_KEY = "training:category-words-version:{category_id}"
+POOL_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Max attempts to pick not yet sampled word per requested word
+MAX_SAMPLE_ATTEMPTS = 10
+
+_pools: "OrderedDict[int, tuple[str, tuple[str, ...]]]" = OrderedDict()
+_pools_lock = threading.Lock()
+
+
+def get_category_words_ids(category_id: int) -> tuple[str, ...]:
+    """Get ids of all category words."""
+    return get_categories_words_ids([category_id])[category_id]
+
+
+def get_categories_words_ids(
+    categories_ids: Iterable[int],
+) -> dict[int, tuple[str, ...]]:
+    """Get ids of words of each category.
+
+    Versions of all categories are read from cache at once, pools missing
+    in process are read from cache at once and pools missing there are
+    loaded with one query.
+    """
+    versions = _get_versions(categories_ids)
+    pools = {}
+    with _pools_lock:
+        for category_id, version in versions.items():
+            cached_version, words_ids = _pools.get(category_id, (None, None))
+            if cached_version == version:
+                _pools.move_to_end(category_id)
+                pools[category_id] = words_ids
+    missing_keys = {
+        POOL_CACHE_KEY.format(category_id=category_id, version=version):
+            category_id
+        for category_id, version in versions.items()
+        if category_id not in pools
+    }
+    if not missing_keys:
+        return pools
+
+    loaded_pools = {
+        missing_keys[key]: words_ids
+        for key, words_ids in cache.get_many(missing_keys).items()
+    }
+    not_cached_ids = set(missing_keys.values()) - set(loaded_pools)
+    if not_cached_ids:
+        words_ids = defaultdict(list)
+        relations = models.Word.categories.through.objects.filter(
+            category_id__in=not_cached_ids,
+        ).values_list("category_id", "word_id")
+        for category_id, word_id in relations:
+            words_ids[category_id].append(word_id)
+        not_cached_pools = {
+            category_id: tuple(words_ids[category_id])
+            for category_id in not_cached_ids
+        }
+        cache.set_many(
+            {
+                POOL_CACHE_KEY.format(
+                    category_id=category_id,
+                    version=versions[category_id],
+                ): pool
+                for category_id, pool in not_cached_pools.items()
+            },
+            POOL_CACHE_TIMEOUT,
+        )
+        loaded_pools.update(not_cached_pools)
+
+    with _pools_lock:
+        for category_id, pool in loaded_pools.items():
+            _pools[category_id] = (versions[category_id], pool)
+            _pools.move_to_end(category_id)
+        while len(_pools) > settings.TRAINING_CATEGORIES_POOLS_MAX_SIZE:
+            _pools.popitem(last=False)
+    return {**pools, **loaded_pools}
+
+
+def get_words_categories(
+    words_ids: Iterable[str],
+) -> dict[str, list[int]]:
+    """Get categories ids of words."""
+    words_categories = defaultdict(list)
+    pairs = models.Word.categories.through.objects.filter(
+        word_id__in=list(words_ids),
+    ).values_list("word_id", "category_id")
+    for word_id, category_id in pairs:
+        words_categories[word_id].append(category_id)
+    return words_categories
+
+
+def sample_words_ids(
+    categories_ids: list[int],
+    count: int,
+    exclude: Optional[set[str]] = None,
+) -> list[str]:
+    """Get ids of random words from categories.
+
+    Words are picked from all categories uniformly (category is chosen
+    with weight of its size), ids from `exclude` are never returned.
+    """
+    pools = list(get_categories_words_ids(categories_ids).values())
+    pools = [pool for pool in pools if pool]
+    if not pools or count <= 0:
+        return []
+    weights = [len(pool) for pool in pools]
+    excluded = set(exclude or ())
+    sampled = []
+    for _ in range(count * MAX_SAMPLE_ATTEMPTS):
+        pool = random.choices(pools, weights=weights)[0]
+        word_id = pool[random.randrange(len(pool))]
+        if word_id in excluded:
+            continue
+        excluded.add(word_id)
+        sampled.append(word_id)
+        if len(sampled) == count:
+            break
+    return sampled
+
+
+def invalidate(categories_ids: Iterable[int]):
+    """Change versions of categories, so their words will be reloaded."""
+    for category_id in set(categories_ids):
+        key = VERSION_CACHE_KEY.format(category_id=category_id)
+        cache.set(key, _new_version(), None)
+
+
+def _get_versions(categories_ids: Iterable[int]) -> dict[int, str]:
+    """Get current versions of words of categories with one cache read."""
+    keys = {
+        VERSION_CACHE_KEY.format(category_id=category_id): category_id
+        for category_id in categories_ids
+    }
+    versions = {
+        keys[key]: version
+        for key, version in cache.get_many(keys).items()
+    }
+    for key, category_id in keys.items():
+        if category_id in versions:
+            continue
+        version = _new_version()
+        if not cache.add(key, version, None):
+            version = cache.get(key, version)
+        versions[category_id] = version
+    return versions
+
+
+def _new_version() -> str:
+    """Generate new random version."""
+    return f"{random.getrandbits(64):x}"
@@ -0,0 +1,139 @@
+"""Denormalized counters of user dictionary.
+
+Counters are stored in `UserWordsCounter` and updated with `F()`
+expressions in the same transaction with user words changes, so number of
+words in dictionary is got without counting of user words.
+
+Words are split to rank bands:
+    new - rank is 0
+    in study - rank from 1 to 99
+    learned - rank is 100
+
+Every change of counters changes version of user dictionary (after
+commit), it's used in ETag of catalogue responses with user specific
+fields, check `apps.training.api.views.mixins.CatalogueCacheMixin`.
+"""
+import random
+from collections import Counter
+from typing import Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+from apps.training import models
+
+NEW_WORDS = "new_words_count"
+IN_STUDY_WORDS = "in_study_words_count"
+LEARNED_WORDS = "learned_words_count"
+WORDS = "words_count"
+
+LEARNED_RANK = 100
+
+VERSION_CACHE_KEY = "training:dictionary-version:{user_id}"
+VERSION_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+
+
+def get_rank_band(rank: int) -> str:
+    """Get counter of rank band."""
+    if rank <= 0:
+        return NEW_WORDS
+    if rank >= LEARNED_RANK:
+        return LEARNED_WORDS
+    return IN_STUDY_WORDS
+
+
+def get_counter(user_id: int) -> models.UserWordsCounter:
+    """Get counter of user, it's created if it doesn't exist yet."""
+    counter = models.UserWordsCounter.objects.filter(user_id=user_id).first()
+    if counter is None:
+        counter = refresh_counter(user_id)
+    return counter
+
+
+def refresh_counter(user_id: int) -> models.UserWordsCounter:
+    """Recalculate counter of user with counting of user words."""
+    counts = models.UserWord.objects.filter(user_id=user_id).aggregate(
+        **{
+            WORDS: Count("id"),
+            NEW_WORDS: Count("id", filter=Q(rank__lte=0)),
+            IN_STUDY_WORDS: Count(
+                "id",
+                filter=Q(rank__gt=0, rank__lt=LEARNED_RANK),
+            ),
+            LEARNED_WORDS: Count("id", filter=Q(rank__gte=LEARNED_RANK)),
+        }
+    )
+    counter, _ = models.UserWordsCounter.objects.update_or_create(
+        user_id=user_id,
+        defaults=counts,
+    )
+    return counter
+
+
+def change_counter(user_id: int, deltas: dict[str, int]):
+    """Change counters of user by passed deltas.
+
+    If user doesn't have counter yet, nothing is changed, counter will be
+    calculated on first usage.
+    """
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    models.UserWordsCounter.objects.filter(
+        user_id=user_id,
+    ).update(**{
+        field: F(field) + delta
+        for field, delta in deltas.items()
+    })
+    transaction.on_commit(lambda: bump_dictionary_version(user_id))
+
+
+def add_words(user_id: int, ranks: Iterable[int]):
+    """Count words added to dictionary."""
+    deltas = Counter(get_rank_band(rank) for rank in ranks)
+    deltas[WORDS] = sum(deltas.values())
+    change_counter(user_id, deltas)
+
+
+def remove_words(user_id: int, ranks: Iterable[int]):
+    """Count words removed from dictionary."""
+    deltas = Counter(get_rank_band(rank) for rank in ranks)
+    deltas[WORDS] = sum(deltas.values())
+    change_counter(user_id, {
+        field: -delta for field, delta in deltas.items()
+    })
+
+
+def change_ranks(user_id: int, ranks_changes: Iterable[tuple[int, int]]):
+    """Count words which ranks were changed from old to new."""
+    deltas = Counter()
+    for old_rank, new_rank in ranks_changes:
+        deltas[get_rank_band(old_rank)] -= 1
+        deltas[get_rank_band(new_rank)] += 1
+    change_counter(user_id, deltas)
+
+
+def get_dictionary_version(user_id: int) -> str:
+    """Get current version of user dictionary."""
+    key = VERSION_CACHE_KEY.format(user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        version = _new_version()
+        if not cache.add(key, version, VERSION_CACHE_TIMEOUT):
+            version = cache.get(key, version)
+    return version
+
+
+def bump_dictionary_version(user_id: int):
+    """Change version of user dictionary."""
+    cache.set(
+        VERSION_CACHE_KEY.format(user_id=user_id),
+        _new_version(),
+        VERSION_CACHE_TIMEOUT,
+    )
+
+
+def _new_version() -> str:
+    """Generate new random version."""
+    return f"{random.getrandbits(64):x}"
@@ -0,0 +1,133 @@
+"""Set based operations with user dictionary.
+
+Functions here change many user words with fixed count of statements, so
+they don't send `UserWord` signals and update counters themselves.
+"""
+from typing import Iterable
+
+from django.db import connection, transaction
+
+from apps.core import background_jobs
+from apps.training import counters, models, trainings
+
+ADD_CATEGORY_WORDS_SQL = """
+    INSERT INTO {user_word_table} (id, user_id, word_id, rank, learned_times)
+    SELECT gen_random_uuid(), %s, word_category.word_id, 0, 0
+    FROM {categories_table} AS word_category
+    WHERE word_category.category_id = %s
+    ON CONFLICT (user_id, word_id) DO NOTHING
+"""
+
+ADD_WORDS_SQL = """
+    INSERT INTO {user_word_table} (id, user_id, word_id, rank, learned_times)
+    SELECT gen_random_uuid(), %s, word.id, 0, 0
+    FROM {word_table} AS word
+    WHERE word.id = ANY(%s)
+    ON CONFLICT (user_id, word_id) DO NOTHING
+    RETURNING word_id
+"""
+
+REMOVE_WORDS_SQL = """
+    DELETE FROM {user_word_table}
+    WHERE user_id = %s AND word_id = ANY(%s)
+    RETURNING word_id, rank
+"""
+
+# Results of bulk adding and removing of words
+ADDED = "added"
+ALREADY_ADDED = "already_added"
+REMOVED = "removed"
+NOT_IN_DICTIONARY = "not_in_dictionary"
+NOT_FOUND = "not_found"
+
+# Adding of words of big category in background, check
+# `apps.training.tasks.add_category_words`
+add_category_words_job = background_jobs.BackgroundJob(
+    "training:add-category-words",
+    initial_status=dict(user_id=None, added_count=None),
+)
+
+
+def add_category_words(user_id: int, category_id: int) -> int:
+    """Add all words of category to dictionary.
+
+    Words which are already in dictionary are skipped.
+    Returns count of added words.
+    """
+    sql = ADD_CATEGORY_WORDS_SQL.format(
+        user_word_table=models.UserWord._meta.db_table,
+        categories_table=models.Word.categories.through._meta.db_table,
+    )
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [user_id, category_id])
+            added_count = cursor.rowcount
+        counters.add_words(user_id, [0] * added_count)
+    return added_count
+
+
+def add_words(user_id: int, words_ids: Iterable[str]) -> dict[str, str]:
+    """Add words to dictionary.
+
+    Returns mapping of passed word id to result of adding (`ADDED`,
+    `ALREADY_ADDED` or `NOT_FOUND`).
+    """
+    words_ids = list(dict.fromkeys(words_ids))
+    if not words_ids:
+        return {}
+    sql = ADD_WORDS_SQL.format(
+        user_word_table=models.UserWord._meta.db_table,
+        word_table=models.Word._meta.db_table,
+    )
+    with transaction.atomic():
+        existing_words_ids = set(
+            models.Word.objects.filter(
+                id__in=words_ids,
+            ).values_list("id", flat=True)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [user_id, words_ids])
+            added_words_ids = {row[0] for row in cursor.fetchall()}
+        counters.add_words(user_id, [0] * len(added_words_ids))
+
+    results = {}
+    for word_id in words_ids:
+        if word_id in added_words_ids:
+            results[word_id] = ADDED
+        elif word_id in existing_words_ids:
+            results[word_id] = ALREADY_ADDED
+        else:
+            results[word_id] = NOT_FOUND
+    return results
+
+
+def remove_words(user_id: int, words_ids: Iterable[str]) -> dict[str, str]:
+    """Remove words from dictionary.
+
+    Trainings with removed words and words chosen for training types are
+    deleted too.
+
+    Returns mapping of passed word id to result of removing (`REMOVED` or
+    `NOT_IN_DICTIONARY`).
+    """
+    words_ids = list(dict.fromkeys(words_ids))
+    if not words_ids:
+        return {}
+    sql = REMOVE_WORDS_SQL.format(
+        user_word_table=models.UserWord._meta.db_table,
+    )
+    with transaction.atomic():
+        trainings.invalidate_trainings(user_id, words_ids=words_ids)
+        models.TrainingTypeUserWord.objects.filter(
+            user_word__user_id=user_id,
+            user_word__word_id__in=words_ids,
+        ).delete()
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [user_id, words_ids])
+            removed_ranks = dict(cursor.fetchall())
+        counters.remove_words(user_id, removed_ranks.values())
+
+    return {
+        word_id: REMOVED if word_id in removed_ranks else NOT_IN_DICTIONARY
+        for word_id in words_ids
+    }
@@ -0,0 +1,188 @@
+"""Distractors generation for trainings.
+
+Distractors are words that are shown to user together with right
+translation. They are taken from words which are similar to the
+question word (postgres `trigram similar`), and if there are not enough of
+them, from random words of question word categories (check
+`apps.training.categories_pool`).
+
+All functions here work with batch of words, so distractors for whole
+training are generated with fixed count of queries.
+
+Source of similar words is defined by `TRAINING_SIMILAR_WORDS_SOURCE`
+setting.
+"""
+from typing import Sequence
+
+from django.conf import settings
+from django.db import connection
+
+from apps.training import categories_pool, models, words_index
+
+DATABASE_SOURCE = "database"
+INDEX_SOURCE = "index"
+TABLE_SOURCE = "table"
+
+TRIGRAM_SIMILAR_WORDS_SQL = """
+    SELECT source.word_id, similar.value
+    FROM unnest(%s::varchar[], %s::citext[]) AS source(word_id, value)
+    CROSS JOIN LATERAL (
+        SELECT word.{attr} AS value, word.english AS sort_key
+        FROM {word_table} AS word
+        WHERE word.{attr} <> source.value
+            AND (word.{attr})::text %% source.value::text
+        ORDER BY word.english
+        LIMIT %s
+    ) AS similar
+    ORDER BY source.word_id, similar.sort_key
+"""
+
+
+def get_similar_words(
+    words: Sequence[models.Word],
+    attr: str,
+    count: int,
+) -> dict[str, list[str]]:
+    """Get words similar to passed ones.
+
+    Returns mapping of word id to list of `attr` values of similar words.
+
+    Firstly it tries to get similar words using postgres `trigram similar`,
+    if found words count less than passed count,
+     then gets words from categories.
+    """
+    similar_words = {word.id: [] for word in words}
+    if not words or count == 0:
+        return similar_words
+
+    get_similar_words_pairs = SIMILAR_WORDS_SOURCES[
+        settings.TRAINING_SIMILAR_WORDS_SOURCE
+    ]
+    for word_id, value in get_similar_words_pairs(words, attr, count):
+        similar_words[word_id].append(value)
+
+    remaining_counts = {
+        word_id: count - len(values)
+        for word_id, values in similar_words.items()
+        if len(values) < count
+    }
+    if remaining_counts:
+        for word_id, value in _get_category_words(remaining_counts, attr):
+            similar_words[word_id].append(value)
+    return similar_words
+
+
+def _get_trigram_similar_words(
+    words: Sequence[models.Word],
+    attr: str,
+    count: int,
+) -> list[tuple[str, str]]:
+    """Get `(word id, similar word)` pairs using `trigram similar`."""
+    sql = TRIGRAM_SIMILAR_WORDS_SQL.format(
+        attr=_get_column(attr),
+        word_table=models.Word._meta.db_table,
+    )
+    params = [
+        [word.id for word in words],
+        [getattr(word, attr) for word in words],
+        count,
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def _get_index_similar_words(
+    words: Sequence[models.Word],
+    attr: str,
+    count: int,
+) -> list[tuple[str, str]]:
+    """Get `(word id, similar word)` pairs using in-process words index."""
+    index = words_index.get_index(attr)
+    return [
+        (word.id, value)
+        for word in words
+        for value in index.get_similar_words(getattr(word, attr), count)
+    ]
+
+
+def _get_table_similar_words(
+    words: Sequence[models.Word],
+    attr: str,
+    count: int,
+) -> list[tuple[str, str]]:
+    """Get `(word id, similar word)` pairs from `WordSimilarity` table.
+
+    Words which similar words are not computed yet are processed with
+    in-process words index.
+    """
+    computed_words_ids = [
+        word.id for word in words if word.similar_words_computed_at
+    ]
+    not_computed_words = [
+        word for word in words if not word.similar_words_computed_at
+    ]
+    pairs = []
+    if computed_words_ids:
+        similarities = models.WordSimilarity.objects.filter(
+            word_id__in=computed_words_ids,
+            language=attr,
+        ).order_by(
+            "word_id",
+            "-score",
+        ).values_list("word_id", f"similar_word__{attr}")
+        taken_counts = dict.fromkeys(computed_words_ids, 0)
+        for word_id, value in similarities:
+            if taken_counts[word_id] < count:
+                taken_counts[word_id] += 1
+                pairs.append((word_id, value))
+    if not_computed_words:
+        pairs += _get_index_similar_words(not_computed_words, attr, count)
+    return pairs
+
+
+def _get_category_words(
+    remaining_counts: dict[str, int],
+    attr: str,
+) -> list[tuple[str, str]]:
+    """Get `(word id, random word)` pairs from words categories."""
+    words_categories = categories_pool.get_words_categories(
+        remaining_counts.keys(),
+    )
+    sampled_words_ids = {
+        word_id: categories_pool.sample_words_ids(
+            categories_ids=words_categories.get(word_id, []),
+            count=remaining_count,
+            exclude={word_id},
+        )
+        for word_id, remaining_count in remaining_counts.items()
+    }
+    values = dict(
+        models.Word.objects.filter(
+            id__in={
+                sampled_word_id
+                for words_ids in sampled_words_ids.values()
+                for sampled_word_id in words_ids
+            },
+        ).values_list("id", attr)
+    )
+    return [
+        (word_id, values[sampled_word_id])
+        for word_id, words_ids in sampled_words_ids.items()
+        for sampled_word_id in words_ids
+        if sampled_word_id in values
+    ]
+
+
+def _get_column(attr: str) -> str:
+    """Get quoted column name of `Word` field."""
+    return connection.ops.quote_name(
+        models.Word._meta.get_field(attr).column,
+    )
+
+
+SIMILAR_WORDS_SOURCES = {
+    DATABASE_SOURCE: _get_trigram_similar_words,
+    INDEX_SOURCE: _get_index_similar_words,
+    TABLE_SOURCE: _get_table_similar_words,
+}
@@ -0,0 +1,33 @@
+from django import forms
+from django.utils.translation import gettext_lazy as _
+
+from apps.core import background_jobs
+
+
+class WordsImportForm(forms.Form):
+    """Form to upload file for words import in background."""
+    file = forms.FileField(
+        label=_("File"),
+        help_text=_(
+            "CSV or XLSX file with english, russian, image and Categories "
+            "columns"
+        ),
+    )
+
+    def clean_file(self):
+        """Check that file has supported format."""
+        file = self.cleaned_data["file"]
+        if not background_jobs.get_file_format(file.name):
+            raise forms.ValidationError(_("Only CSV and XLSX are supported"))
+        return file
+
+
+class CatalogueExportForm(forms.Form):
+    """Form to start catalogue export in background."""
+    file_format = forms.ChoiceField(
+        label=_("Format"),
+        choices=[
+            (file_format, file_format.upper())
+            for file_format in background_jobs.FORMATS
+        ],
+    )
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from apps.training import models, tasks, words_similarity
+
+
+class Command(BaseCommand):
+    """Compute similar words of words vocabulary."""
+    help = "Compute similar words (distractors) of words"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute all words, not only stale ones",
+        )
+
+    def handle(self, *args, **options):
+        if not options["all"]:
+            tasks.rebuild_stale_similar_words()
+            return
+
+        word_ids = list(
+            models.Word.objects.order_by().values_list("id", flat=True)
+        )
+        chunk_size = tasks.SIMILAR_WORDS_CHUNK_SIZE
+        for index in range(0, len(word_ids), chunk_size):
+            words_similarity.compute_similar_words(
+                word_ids[index:index + chunk_size],
+            )
+            self.stdout.write(
+                f"Computed {min(index + chunk_size, len(word_ids))}"
+                f"/{len(word_ids)} words",
+            )
@@ -0,0 +1,42 @@
+# Generated by Django 3.2.7 on 2026-10-18 07:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training', '0010_trainingtype_description'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='word',
+            name='similar_words_computed_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='When similar words were computed last time, empty if they should be recomputed', null=True, verbose_name='Similar words computed at'),
+        ),
+        migrations.CreateModel(
+            name='WordSimilarity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(choices=[('english', 'English'), ('russian', 'Russian')], max_length=20, verbose_name='Language')),
+                ('score', models.FloatField(verbose_name='Score')),
+                ('computed_at', models.DateTimeField(verbose_name='Computed at')),
+                ('similar_word', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='training.word')),
+                ('word', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similarities', to='training.word')),
+            ],
+            options={
+                'verbose_name': 'Word similarity',
+                'verbose_name_plural': 'Words similarities',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='wordsimilarity',
+            index=models.Index(fields=['word', 'language', '-score'], name='training_word_similarity_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='wordsimilarity',
+            unique_together={('word', 'similar_word', 'language')},
+        ),
+    ]
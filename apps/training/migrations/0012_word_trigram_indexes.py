@@ -0,0 +1,25 @@
+# Generated by Django 3.2.7 on 2026-10-18 08:00
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+import django.db.models.functions.comparison
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training', '0011_word_similarity'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='word',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.comparison.Cast('english', models.TextField()), name='gin_trgm_ops'), name='training_word_english_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='word',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.comparison.Cast('russian', models.TextField()), name='gin_trgm_ops'), name='training_word_russian_trgm'),
+        ),
+    ]
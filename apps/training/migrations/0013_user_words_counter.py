@@ -0,0 +1,53 @@
+# Generated by Django 3.2.7 on 2026-10-18 08:01
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def fill_counters(apps, schema_editor):
+    """Calculate counters of users which have words."""
+    UserWord = apps.get_model("training", "UserWord")
+    UserWordsCounter = apps.get_model("training", "UserWordsCounter")
+    counts = UserWord.objects.order_by().values("user_id").annotate(
+        words_count=models.Count("id"),
+        new_words_count=models.Count("id", filter=models.Q(rank__lte=0)),
+        in_study_words_count=models.Count(
+            "id",
+            filter=models.Q(rank__gt=0, rank__lt=100),
+        ),
+        learned_words_count=models.Count(
+            "id",
+            filter=models.Q(rank__gte=100),
+        ),
+    )
+    UserWordsCounter.objects.bulk_create(
+        UserWordsCounter(**user_counts) for user_counts in counts.iterator()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('training', '0012_word_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserWordsCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('words_count', models.PositiveIntegerField(default=0, verbose_name='Words count')),
+                ('new_words_count', models.PositiveIntegerField(default=0, help_text='Words with rank 0', verbose_name='New words count')),
+                ('in_study_words_count', models.PositiveIntegerField(default=0, help_text='Words with rank from 1 to 99', verbose_name='In study words count')),
+                ('learned_words_count', models.PositiveIntegerField(default=0, help_text='Words with rank 100', verbose_name='Learned words count')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='words_counter', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'User words counter',
+                'verbose_name_plural': 'User words counters',
+            },
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
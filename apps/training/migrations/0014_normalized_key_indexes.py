@@ -0,0 +1,22 @@
+# Generated by Django 3.2.7 on 2026-10-18 08:28
+
+import apps.core.lookups
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training', '0013_user_words_counter'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(apps.core.lookups.NormalizedKey('name'), name='training_category_name_key'),
+        ),
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(apps.core.lookups.NormalizedKey('english'), name='training_word_english_key'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.7 on 2026-10-18 08:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training', '0014_normalized_key_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['name', 'id'], name='training_category_name_id'),
+        ),
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(fields=['english', 'id'], name='training_word_english_id'),
+        ),
+    ]
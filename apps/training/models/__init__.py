@@ -1,2 +1,2 @@
 from .training import Question, Training, TrainingType, TrainingTypeUserWord
-from .word import Category, UserWord, Word
+from .word import Category, UserWord, UserWordsCounter, Word, WordSimilarity
@@ -2,12 +2,42 @@ import uuid
 
 from django.conf import settings
 from django.contrib.postgres.fields import CICharField
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.validators import MaxValueValidator
 from django.db import models
-from django.db.models import Case, OuterRef, Q, Subquery, Value, When
+from django.db.models import ExpressionWrapper, FilteredRelation, Q
+from django.db.models.functions import Cast
 from django.utils.translation import gettext_lazy as _
 
 from django_extensions.db.fields import AutoSlugField
+from sql_util.utils import SubqueryCount
+
+# Register lookups which use trigram and normalized key indexes
+from apps.core import lookups
+
+
+class CategoryQuerySet(models.QuerySet):
+    """QuerySet for Category model"""
+
+    def with_words_count(self):
+        """Annotate with `words_count`.
+
+        Count of words is calculated with subquery which uses index of
+        categories of words, so there is no query per category.
+        """
+        return self.annotate(words_count=SubqueryCount("word"))
+
+    def with_user_words_count(self, user):
+        """Annotate with `user_words_count`.
+
+        How many words of category are already in dictionary of user.
+        """
+        return self.annotate(
+            user_words_count=SubqueryCount(
+                "word",
+                filter=Q(word__user_words__user=user),
+            ),
+        )
 
 
 class Category(models.Model):
@@ -24,10 +54,24 @@ class Category(models.Model):
         verbose_name=_("Image"),
     )
 
+    objects = CategoryQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Category")
         verbose_name_plural = _("Categories")
         ordering = ("name",)
+        indexes = (
+            # Used by `normalized_key` lookup of import
+            models.Index(
+                lookups.NormalizedKey("name"),
+                name="training_category_name_key",
+            ),
+            # Used by keyset pagination
+            models.Index(
+                fields=("name", "id"),
+                name="training_category_name_id",
+            ),
+        )
 
     def __str__(self) -> str:
         return str(self.name)
@@ -40,30 +84,46 @@ class WordQuerySet(models.QuerySet):
         """Annotate with `is_linked`.
 
         Does this user already linked to this word.
+
+        Words are joined with user words of this user with `LEFT JOIN`, so
+        planner can use `(user, word)` unique index instead of running
+        subquery for every word.
         """
-        user_words = UserWord.objects.filter(
-            word=OuterRef("pk")
-        ).filter(
-            user=user
-        ).values("user_id")
-        return self.annotate(user_id=Value(user.id)).annotate(
-            is_linked=Case(
-                When(
-                    user_id__in=Subquery(user_words),
-                    then=True,
-                ),
-                default=False,
+        return self.annotate(
+            linked_user_word=FilteredRelation(
+                "user_words",
+                condition=Q(user_words__user=user),
+            ),
+        ).annotate(
+            is_linked=ExpressionWrapper(
+                Q(linked_user_word__isnull=False),
                 output_field=models.BooleanField(),
             ),
         )
 
+    def get_linked_ids(self, user) -> set[str]:
+        """Get ids of words from queryset which are linked to user.
+
+        It can be used to calculate `is_linked` for page of words in memory
+        with single query.
+        """
+        return set(
+            UserWord.objects.filter(
+                user=user,
+                word__in=self.order_by().values("id"),
+            ).order_by().values_list("word_id", flat=True)
+        )
+
 
 class Word(models.Model):
     """The word with translate."""
+    # Passed ids of added words are kept, they are generated by import with
+    # one query (check `words_import`)
     id = AutoSlugField(
         populate_from="english",
         primary_key=True,
         max_length=255,
+        overwrite_on_add=False,
     )
     english = CICharField(
         verbose_name=_("Word in english"),
@@ -93,12 +153,49 @@ class Word(models.Model):
         related_query_name="word",
         through="UserWord",
     )
+    similar_words_computed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name=_("Similar words computed at"),
+        help_text=_(
+            "When similar words were computed last time, empty if they "
+            "should be recomputed",
+        ),
+    )
     objects = WordQuerySet.as_manager()
 
     class Meta:
         verbose_name = _("Word")
         verbose_name_plural = _("Words")
         ordering = ("english",)
+        # Used by `text_icontains` and `text_trigram_similar` lookups
+        indexes = (
+            GinIndex(
+                OpClass(
+                    Cast("english", models.TextField()),
+                    name="gin_trgm_ops",
+                ),
+                name="training_word_english_trgm",
+            ),
+            GinIndex(
+                OpClass(
+                    Cast("russian", models.TextField()),
+                    name="gin_trgm_ops",
+                ),
+                name="training_word_russian_trgm",
+            ),
+            # Used by `normalized_key` lookup of import
+            models.Index(
+                lookups.NormalizedKey("english"),
+                name="training_word_english_key",
+            ),
+            # Used by keyset pagination
+            models.Index(
+                fields=("english", "id"),
+                name="training_word_english_id",
+            ),
+        )
 
     def __str__(self) -> str:
         return f"{self.english} - {self.russian}"
@@ -145,3 +242,90 @@ class UserWord(models.Model):
 
     def __str__(self):
         return f"{self.user}: {self.word} Rank:{self.rank}/100"
+
+
+class WordSimilarity(models.Model):
+    """Precomputed similar word for word.
+
+    Stores top similar words (postgres `trigram similar`) of each word for
+    english and russian, check `apps.training.words_similarity`.
+    """
+    LANGUAGE_CHOICES = (
+        ("english", _("English")),
+        ("russian", _("Russian")),
+    )
+
+    word = models.ForeignKey(
+        "training.Word",
+        on_delete=models.CASCADE,
+        related_name="similarities",
+    )
+    similar_word = models.ForeignKey(
+        "training.Word",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    language = models.CharField(
+        max_length=20,
+        choices=LANGUAGE_CHOICES,
+        verbose_name=_("Language"),
+    )
+    score = models.FloatField(
+        verbose_name=_("Score"),
+    )
+    computed_at = models.DateTimeField(
+        verbose_name=_("Computed at"),
+    )
+
+    class Meta:
+        verbose_name = _("Word similarity")
+        verbose_name_plural = _("Words similarities")
+        unique_together = ("word", "similar_word", "language")
+        indexes = (
+            models.Index(
+                fields=("word", "language", "-score"),
+                name="training_word_similarity_idx",
+            ),
+        )
+
+    def __str__(self):
+        return f"{self.word} ~ {self.similar_word} ({self.score:.2f})"
+
+
+class UserWordsCounter(models.Model):
+    """Denormalized counters of user dictionary.
+
+    Counters are updated in the same transaction with user words, check
+    `apps.training.counters`.
+    """
+    user = models.OneToOneField(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="words_counter",
+    )
+    words_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Words count"),
+    )
+    new_words_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("New words count"),
+        help_text=_("Words with rank 0"),
+    )
+    in_study_words_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("In study words count"),
+        help_text=_("Words with rank from 1 to 99"),
+    )
+    learned_words_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Learned words count"),
+        help_text=_("Words with rank 100"),
+    )
+
+    class Meta:
+        verbose_name = _("User words counter")
+        verbose_name_plural = _("User words counters")
+
+    def __str__(self):
+        return f"{self.user}: {self.words_count} words"
@@ -1,11 +1,12 @@
-from import_export import resources
 from import_export.fields import Field
 
 from libs.import_export.widgets import FileWidget
+
+from ...core.import_export.resource import ModelResource
 from .. import models
 
 
-class CategoryResource(resources.ModelResource):
+class CategoryResource(ModelResource):
     """Resource for word importing/exporting."""
     image = Field(
         column_name="image",
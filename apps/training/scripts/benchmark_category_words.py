@@ -0,0 +1,78 @@
+"""Benchmark of random category words sampling.
+
+Compares `ORDER BY random()` query with sampling from cached category words
+ids on category with 100k words. All created data is rolled back.
+
+Usage: python manage.py runscript benchmark_category_words
+"""
+import time
+
+from django.db import transaction
+
+from apps.training import categories_pool, models
+
+WORDS_COUNT = 100_000
+SAMPLE_SIZE = 4
+ITERATIONS = 100
+
+
+def _measure(function) -> float:
+    """Get average time of function call in milliseconds."""
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        function()
+    return (time.perf_counter() - started_at) / ITERATIONS * 1000
+
+
+def run():
+    with transaction.atomic():
+        category = models.Category.objects.create(name="benchmark-category")
+        print(f"Creating {WORDS_COUNT} words...")
+        words = models.Word.objects.bulk_create(
+            models.Word(
+                id=f"benchmark-word-{index}",
+                english=f"benchmark word {index}",
+                russian=f"слово {index}",
+            )
+            for index in range(WORDS_COUNT)
+        )
+        models.Word.categories.through.objects.bulk_create(
+            models.Word.categories.through(
+                word_id=word.id,
+                category_id=category.id,
+            )
+            for word in words
+        )
+        categories_pool.invalidate([category.id])
+
+        def order_by_random():
+            list(
+                models.Word.objects.filter(
+                    categories=category,
+                ).order_by("?")[:SAMPLE_SIZE].values_list("english", flat=True)
+            )
+
+        def sample_from_pool():
+            words_ids = categories_pool.sample_words_ids(
+                categories_ids=[category.id],
+                count=SAMPLE_SIZE,
+            )
+            list(
+                models.Word.objects.filter(
+                    id__in=words_ids,
+                ).values_list("english", flat=True)
+            )
+
+        started_at = time.perf_counter()
+        categories_pool.get_category_words_ids(category.id)
+        warm_up_time = (time.perf_counter() - started_at) * 1000
+
+        order_by_random_time = _measure(order_by_random)
+        sample_from_pool_time = _measure(sample_from_pool)
+        print(f"ORDER BY random(): {order_by_random_time:.2f} ms per call")
+        print(f"Pool loading (once per category): {warm_up_time:.2f} ms")
+        print(f"Pool sampling: {sample_from_pool_time:.2f} ms per call")
+        print(f"Speedup: {order_by_random_time / sample_from_pool_time:.1f}x")
+
+        transaction.set_rollback(True)
+    categories_pool.invalidate([category.id])
@@ -0,0 +1,79 @@
+"""Benchmark of string normalization of imported cells.
+
+Compares normalization of each cell (as it was before ASCII fast path and
+memoization) with `normalize_string_values` on columns of ASCII, unicode
+and repeated values. Throughput is reported per million cells.
+
+Usage: python manage.py runscript benchmark_normalization
+"""
+import random
+import re
+import string
+import time
+import unicodedata
+
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+from libs.import_export import utils
+
+CELLS_COUNT = 1_000_000
+DISTINCT_REPEATED_COUNT = 1_000
+
+
+def _legacy_normalize_string_value(value: str) -> str:
+    """Normalization before ASCII fast path and memoization."""
+    cleaned = " ".join(value.strip().split()).strip()
+    return unicodedata.normalize(
+        "NFKC",
+        re.sub(ILLEGAL_CHARACTERS_RE, "", cleaned),
+    )
+
+
+def _make_value(alphabet: str) -> str:
+    """Get random words with extra spaces."""
+    return "  ".join(
+        "".join(random.choices(alphabet, k=random.randint(3, 10)))
+        for _ in range(random.randint(1, 3))
+    )
+
+
+def _measure(function, values: list) -> float:
+    """Get time in seconds of normalization of values."""
+    utils.normalize_string_value.cache_clear()
+    started_at = time.perf_counter()
+    function(values)
+    return time.perf_counter() - started_at
+
+
+def run():
+    random.seed(0)
+    repeated = [
+        _make_value(string.ascii_letters)
+        for _ in range(DISTINCT_REPEATED_COUNT)
+    ]
+    columns = {
+        "ascii": [
+            _make_value(string.ascii_letters) for _ in range(CELLS_COUNT)
+        ],
+        "unicode": [
+            _make_value("абвгдежзиклмнопрстуфхцчшщэюя")
+            for _ in range(CELLS_COUNT)
+        ],
+        "repeated": random.choices(repeated, k=CELLS_COUNT),
+    }
+    for name, values in columns.items():
+        legacy_time = _measure(
+            lambda values: [
+                _legacy_normalize_string_value(value) for value in values
+            ],
+            values,
+        )
+        batched_time = _measure(utils.normalize_string_values, values)
+        per_million = 1_000_000 / len(values)
+        print(
+            f"{name}: "
+            f"per cell {legacy_time * per_million:.2f} s, "
+            f"batched {batched_time * per_million:.2f} s "
+            f"per million cells, "
+            f"speedup {legacy_time / batched_time:.1f}x"
+        )
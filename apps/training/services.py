@@ -2,7 +2,7 @@ from random import randint
 
 from django.db.models import QuerySet
 
-from apps.training import models
+from apps.training import categories_pool, models
 from apps.users.models import User
 
 
@@ -90,9 +90,14 @@ def get_similar_words(word: models.Word, count: int) -> list[str]:
      )
     remaining_count = count - len(similar_words)
     if remaining_count > 0:
-        qs = models.Word.objects.exclude(english=word.english).filter(
-            categories__in=word.categories.values("id"),
-        ).order_by('?')[:remaining_count]
-
-        similar_words += list(qs.values_list("english", flat=True))
+        words_ids = categories_pool.sample_words_ids(
+            categories_ids=list(word.categories.values_list("id", flat=True)),
+            count=remaining_count,
+            exclude={word.id},
+        )
+        similar_words += list(
+            models.Word.objects.filter(
+                id__in=words_ids,
+            ).values_list("english", flat=True)
+        )
     return similar_words
@@ -0,0 +1,216 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from import_export.signals import post_import
+
+from . import cache, catalogue, categories_pool, counters, models, words_index
+
+
+@receiver(post_save, sender=models.Word)
+def update_words_index(instance: models.Word, **kwargs):
+    """Update word in words index after changes are committed."""
+    transaction.on_commit(partial(words_index.update_word, instance))
+
+
+@receiver(post_delete, sender=models.Word)
+def remove_from_words_index(instance: models.Word, **kwargs):
+    """Remove word from words index after changes are committed."""
+    transaction.on_commit(partial(words_index.remove_words, [instance.id]))
+
+
+@receiver(post_import)
+def rebuild_words_index(model, **kwargs):
+    """Rebuild words index when words were imported."""
+    if model is models.Word:
+        transaction.on_commit(words_index.clear)
+
+
+@receiver(post_import)
+@receiver(post_save, sender=models.Word)
+@receiver(post_delete, sender=models.Word)
+@receiver(post_save, sender=models.Category)
+@receiver(post_delete, sender=models.Category)
+@receiver(post_save, sender=models.TrainingType)
+@receiver(post_delete, sender=models.TrainingType)
+def bump_catalogue_version(**kwargs):
+    """Change version of catalogue after changes are committed.
+
+    Cached catalogue responses of previous version are not used anymore.
+    """
+    transaction.on_commit(catalogue.bump_version)
+
+
+@receiver(m2m_changed, sender=models.Word.categories.through)
+def bump_catalogue_version_on_categories_change(action: str, **kwargs):
+    """Change version of catalogue when categories of words are changed."""
+    if action in ("post_add", "post_remove", "post_clear"):
+        transaction.on_commit(catalogue.bump_version)
+
+
+@receiver(post_save, sender=models.TrainingType)
+@receiver(post_delete, sender=models.TrainingType)
+def invalidate_training_type(instance: models.TrainingType, **kwargs):
+    """Remove cached training type after changes are committed."""
+    transaction.on_commit(partial(cache.invalidate_training_type, instance.id))
+
+
+@receiver(pre_save, sender=models.Word)
+def mark_similar_words_stale(
+    instance: models.Word,
+    update_fields=None,
+    **kwargs,
+):
+    """Mark that similar words of added or renamed word should be recomputed.
+
+    Similar words depend only on `english` and `russian`, so saving of other
+    fields keeps them. Stale words are recomputed by hourly
+    `rebuild_stale_similar_words` task, until then their similar words are
+    taken from words index (check `distractors`).
+    """
+    if not instance._state.adding:
+        if update_fields is not None and not (
+            {"english", "russian"} & set(update_fields)
+        ):
+            return
+        saved_values = models.Word.objects.filter(
+            pk=instance.pk,
+        ).values_list("english", "russian").first()
+        if saved_values == (instance.english, instance.russian):
+            return
+    instance.similar_words_computed_at = None
+
+
+@receiver(pre_delete, sender=models.Word)
+def mark_similar_words_of_neighbours_stale(instance: models.Word, **kwargs):
+    """Mark that words which have deleted word as similar are stale.
+
+    Their similarities to deleted word are removed by cascade, so it's done
+    before deletion. Stale words are recomputed by hourly
+    `rebuild_stale_similar_words` task.
+    """
+    models.Word.objects.filter(
+        similarities__similar_word=instance,
+    ).update(similar_words_computed_at=None)
+
+
+@receiver(m2m_changed, sender=models.Word.categories.through)
+def invalidate_categories_pool(
+    instance,
+    action: str,
+    reverse: bool,
+    pk_set: set,
+    **kwargs,
+):
+    """Invalidate cached words of changed categories after commit."""
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if reverse:
+        categories_ids = [instance.pk]
+    elif action == "pre_clear":
+        categories_ids = list(instance.categories.values_list("id", flat=True))
+    else:
+        categories_ids = list(pk_set)
+    transaction.on_commit(
+        partial(categories_pool.invalidate, categories_ids),
+    )
+
+
+@receiver(pre_delete, sender=models.Word)
+def invalidate_word_categories_pool(instance: models.Word, **kwargs):
+    """Invalidate cached words of deleted word categories after commit."""
+    categories_ids = list(instance.categories.values_list("id", flat=True))
+    transaction.on_commit(
+        partial(categories_pool.invalidate, categories_ids),
+    )
+
+
+@receiver(post_delete, sender=models.Training)
+def invalidate_training_data(instance: models.Training, **kwargs):
+    """Remove cached questions of deleted training after commit."""
+    transaction.on_commit(partial(
+        cache.invalidate_training_data,
+        instance.user_id,
+        instance.type_id,
+        instance.id,
+    ))
+
+
+@receiver(pre_save, sender=models.UserWord)
+def remember_counted_user_word(
+    instance: models.UserWord,
+    update_fields=None,
+    **kwargs,
+):
+    """Remember saved user and rank of changed user word.
+
+    They are compared with new ones by `count_saved_user_word`.
+    """
+    instance._counted_values = None
+    if instance._state.adding or (
+        update_fields is not None
+        and not {"user", "user_id", "rank"} & set(update_fields)
+    ):
+        return
+    instance._counted_values = models.UserWord.objects.filter(
+        pk=instance.pk,
+    ).values_list("user_id", "rank").first()
+
+
+@receiver(post_save, sender=models.UserWord)
+def count_saved_user_word(
+    instance: models.UserWord,
+    created: bool,
+    **kwargs,
+):
+    """Update dictionary counter of user.
+
+    Counters are changed only if user or rank band of word was changed.
+    """
+    if created:
+        counters.add_words(instance.user_id, [instance.rank])
+        return
+    counted_values = getattr(instance, "_counted_values", None)
+    if counted_values is None:
+        return
+    user_id, rank = counted_values
+    if user_id != instance.user_id:
+        counters.remove_words(user_id, [rank])
+        counters.add_words(instance.user_id, [instance.rank])
+    else:
+        counters.change_ranks(user_id, [(rank, instance.rank)])
+
+
+@receiver(post_delete, sender=models.UserWord)
+def count_deleted_user_word(instance: models.UserWord, **kwargs):
+    """Update dictionary counter of user."""
+    counters.remove_words(instance.user_id, [instance.rank])
+
+
+@receiver(m2m_changed, sender=models.UserWord)
+def count_added_words(
+    instance,
+    action: str,
+    reverse: bool,
+    pk_set: set,
+    **kwargs,
+):
+    """Update dictionary counters when words are added with `add()`.
+
+    Removed words are counted by `post_delete` of `UserWord`.
+    """
+    if action != "post_add" or not pk_set:
+        return
+    if reverse:
+        counters.add_words(instance.pk, [0] * len(pk_set))
+        return
+    for user_id in pk_set:
+        counters.add_words(user_id, [0])
@@ -0,0 +1,69 @@
+from config.celery import app
+
+from . import catalogue_export, dictionary, words_import, words_similarity
+
+SIMILAR_WORDS_CHUNK_SIZE = 500
+
+
+@app.task
+def rebuild_stale_similar_words():
+    """Recompute similar words of stale words and words affected by them."""
+    word_ids = list(words_similarity.get_affected_words(
+        words_similarity.get_stale_words_ids(),
+    ))
+    for index in range(0, len(word_ids), SIMILAR_WORDS_CHUNK_SIZE):
+        words_similarity.compute_similar_words(
+            word_ids[index:index + SIMILAR_WORDS_CHUNK_SIZE],
+        )
+
+
+@app.task
+def add_category_words(user_id: int, category_id: int, status_id: str):
+    """Add words of category to dictionary in background.
+
+    If adding fails, status is marked as failed and error is raised again.
+    """
+    job = dictionary.add_category_words_job
+    try:
+        added_count = dictionary.add_category_words(user_id, category_id)
+    except Exception as error:
+        job.fail(status_id, error)
+        raise
+    job.set_status(status_id, job.get_initial_status(
+        user_id=user_id,
+        is_done=True,
+        added_count=added_count,
+    ))
+
+
+@app.task
+def import_words(file_name: str, file_format: str, import_id: str):
+    """Import words from uploaded file in background.
+
+    File is removed from storage after import. If import fails, its status
+    is marked as failed and error is raised again.
+    """
+    storage = words_import.job.get_storage()
+    try:
+        with storage.open(file_name, "rb") as file:
+            words_import.import_words(file, file_format, import_id)
+    except Exception as error:
+        words_import.job.fail(import_id, error)
+        raise
+    finally:
+        storage.delete(file_name)
+    rebuild_stale_similar_words.delay()
+
+
+@app.task
+def export_catalogue(name: str, file_format: str, export_id: str):
+    """Export all words or categories to file in background.
+
+    If export fails, its status is marked as failed and error is raised
+    again.
+    """
+    try:
+        catalogue_export.export_to_storage(name, file_format, export_id)
+    except Exception as error:
+        catalogue_export.job.fail(export_id, error)
+        raise
@@ -0,0 +1,65 @@
+from django.core.cache import cache
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+import pytest
+
+from ...users.factories import UserFactory
+from .. import catalogue
+from ..factories import UserWordFactory, WordFactory
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Clear cached versions and responses left by other tests."""
+    cache.clear()
+    catalogue.responses_cache.clear_local()
+
+
+@pytest.fixture
+def client():
+    """Client of user with word in dictionary."""
+    user = UserFactory()
+    UserWordFactory(user=user, word=WordFactory(english="linked"))
+    api_client = APIClient()
+    api_client.force_authenticate(user)
+    return api_client
+
+
+def test_version_is_changed():
+    """Test that version is kept until it's bumped."""
+    version = catalogue.get_version()
+    assert catalogue.get_version() == version
+    catalogue.bump_version()
+    assert catalogue.get_version().tag != version.tag
+
+
+@pytest.mark.django_db(transaction=True)
+def test_not_modified_response(client, django_assert_num_queries):
+    """Test that unchanged words get `304 Not Modified`.
+
+    Dictionary version is changed after commit, so test uses transaction.
+    """
+    url = reverse("training_api:words-list")
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.data["results"][0]["is_linked"]
+
+    with django_assert_num_queries(0):
+        not_modified_response = client.get(
+            url,
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+    assert not_modified_response.status_code == 304
+
+    client.post(
+        reverse("training_api:dictionary-bulk-remove"),
+        data=dict(words=["linked"]),
+        format="json",
+    )
+    response = client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+    assert response.status_code == 200
+    assert not response.data["results"][0]["is_linked"]
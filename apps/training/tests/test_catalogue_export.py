@@ -0,0 +1,86 @@
+import csv
+import io
+
+import pytest
+from openpyxl import load_workbook
+
+from apps.core import background_jobs
+
+from .. import catalogue_export, tasks
+from ..factories import CategoryFactory, WordFactory
+from ..resources import WordResource
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+
+def test_stream_csv():
+    """Test that rows are rendered to CSV lines one by one."""
+    lines = catalogue_export.stream_csv([["a", "b,c"], ["d", None]])
+
+    assert list(lines) == ["a,\"b,c\"\r\n", "d,\r\n"]
+
+
+@pytest.mark.django_db
+def test_export_rows_by_chunks(django_assert_num_queries):
+    """Test that each chunk costs fixed count of queries."""
+    category = CategoryFactory(name="animals")
+    for english in ("cat", "dog", "fox"):
+        WordFactory(english=english).categories.add(category)
+
+    queryset = catalogue_export.get_queryset("word")
+    # two chunks with categories and empty chunk
+    with django_assert_num_queries(5):
+        rows = list(catalogue_export.export_rows(
+            WordResource(),
+            queryset,
+            chunk_size=2,
+        ))
+
+    assert rows[0] == WordResource().get_export_headers()
+    assert sorted(row[0] for row in rows[1:]) == ["cat", "dog", "fox"]
+    assert {row[3] for row in rows[1:]} == {"animals"}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "file_format",
+    [background_jobs.CSV_FORMAT, background_jobs.XLSX_FORMAT],
+)
+def test_export_to_storage(file_format, settings, tmp_path):
+    """Test that catalogue is exported to file in storage."""
+    settings.MEDIA_ROOT = tmp_path
+    WordFactory(english="cat")
+
+    status = catalogue_export.export_to_storage("word", file_format, "test")
+
+    assert status["is_done"]
+    assert status["exported_rows"] == 1
+    content = (tmp_path / status["file_name"]).read_bytes()
+    if file_format == background_jobs.CSV_FORMAT:
+        rows = list(csv.reader(io.StringIO(content.decode())))
+    else:
+        sheet = load_workbook(io.BytesIO(content)).active
+        rows = [list(row) for row in sheet.iter_rows(values_only=True)]
+    assert rows[1][0] == "cat"
+
+
+def test_failed_export_status(monkeypatch):
+    """Test that failed export is marked in status."""
+    def export_to_storage(*args, **kwargs):
+        raise RuntimeError("Storage is not available")
+
+    monkeypatch.setattr(
+        catalogue_export,
+        "export_to_storage",
+        export_to_storage,
+    )
+    export_id = catalogue_export.job.start()
+
+    with pytest.raises(RuntimeError):
+        tasks.export_catalogue("word", background_jobs.XLSX_FORMAT, export_id)
+
+    status = catalogue_export.job.get_status(export_id)
+    assert status["is_done"]
+    assert status["is_failed"]
+    assert status["error"] == "Storage is not available"
+    assert status["exported_rows"] == 0
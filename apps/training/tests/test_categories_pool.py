@@ -0,0 +1,72 @@
+import pytest
+
+from .. import categories_pool
+from ..factories import CategoryFactory, WordFactory
+
+# pylint:disable=unused-argument,redefined-outer-name,protected-access
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def category():
+    """Category with words."""
+    created_category = CategoryFactory()
+    created_category.words.add(*[
+        WordFactory(english=f"word{index}") for index in range(10)
+    ])
+    return created_category
+
+
+def test_sample_words_ids(category):
+    """Test that sampled words are unique and from category."""
+    words_ids = categories_pool.sample_words_ids(
+        categories_ids=[category.id],
+        count=5,
+        exclude={"word0"},
+    )
+    assert len(words_ids) == 5
+    assert len(set(words_ids)) == 5
+    assert "word0" not in words_ids
+    assert set(words_ids) <= set(
+        category.words.values_list("id", flat=True)
+    )
+
+
+def test_category_words_are_cached(category, django_assert_num_queries):
+    """Test that category words are loaded once."""
+    categories_pool.get_category_words_ids(category.id)
+    with django_assert_num_queries(0):
+        categories_pool.sample_words_ids([category.id], count=3)
+
+
+def test_invalidate(category):
+    """Test that changed category words are reloaded."""
+    categories_pool.get_category_words_ids(category.id)
+    category.words.add(WordFactory(english="new"))
+    categories_pool.invalidate([category.id])
+    assert "new" in categories_pool.get_category_words_ids(category.id)
+
+
+def test_categories_words_are_loaded_at_once(
+    category,
+    django_assert_num_queries,
+):
+    """Test that words of several categories are loaded with one query."""
+    other_category = CategoryFactory()
+    other_category.words.add(WordFactory(english="other"))
+    with django_assert_num_queries(1):
+        pools = categories_pool.get_categories_words_ids(
+            [category.id, other_category.id],
+        )
+    assert pools[other_category.id] == ("other",)
+    assert len(pools[category.id]) == 10
+
+
+def test_process_pools_are_limited(category, settings):
+    """Test that least recently used pools are dropped from process."""
+    settings.TRAINING_CATEGORIES_POOLS_MAX_SIZE = 1
+    other_category = CategoryFactory()
+    categories_pool.get_category_words_ids(category.id)
+    categories_pool.get_category_words_ids(other_category.id)
+    assert list(categories_pool._pools) == [other_category.id]
@@ -0,0 +1,28 @@
+import pytest
+
+from ...users.factories import UserFactory
+from ..factories import CategoryFactory, UserWordFactory, WordFactory
+from ..models import Category
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+pytestmark = pytest.mark.django_db
+
+
+def test_categories_are_annotated_with_counts(django_assert_num_queries):
+    """Test that counts of words are got with single query."""
+    user = UserFactory()
+    category = CategoryFactory(name="numbers")
+    CategoryFactory(name="empty")
+    words = [WordFactory(english=english) for english in ("one", "two")]
+    category.words.add(*words)
+    UserWordFactory(user=user, word=words[0])
+
+    with django_assert_num_queries(1):
+        counts = {
+            item.id: (item.words_count, item.user_words_count)
+            for item in Category.objects.with_words_count()
+            .with_user_words_count(user)
+        }
+    assert counts[category.id] == (2, 1)
+    assert sorted(counts.values()) == [(0, 0), (2, 1)]
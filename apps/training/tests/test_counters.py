@@ -0,0 +1,70 @@
+import pytest
+
+from ...users.factories import UserFactory
+from .. import counters
+from ..factories import UserWordFactory, WordFactory
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def user():
+    """User with counted dictionary."""
+    created_user = UserFactory()
+    counters.refresh_counter(created_user.id)
+    return created_user
+
+
+def _get_counts(user):
+    counter = counters.get_counter(user.id)
+    return (
+        counter.words_count,
+        counter.new_words_count,
+        counter.in_study_words_count,
+        counter.learned_words_count,
+    )
+
+
+def test_counter_is_updated(user):
+    """Test that counter is updated on words changes."""
+    UserWordFactory(user=user, word=WordFactory(english="one"), rank=0)
+    user_word = UserWordFactory(
+        user=user,
+        word=WordFactory(english="two"),
+        rank=50,
+    )
+    user.words.add(WordFactory(english="three"), WordFactory(english="four"))
+    assert _get_counts(user) == (4, 3, 1, 0)
+
+    user_word.delete()
+    assert _get_counts(user) == (3, 3, 0, 0)
+
+    counters.change_ranks(user.id, [(0, 100)])
+    assert _get_counts(user) == (3, 2, 0, 1)
+
+
+def test_counter_is_calculated_if_missing():
+    """Test that counter is calculated on first usage."""
+    user_word = UserWordFactory(rank=100)
+    assert _get_counts(user_word.user) == (1, 0, 0, 1)
+
+
+def test_counter_is_changed_on_user_word_save(
+    user,
+    django_assert_num_queries,
+):
+    """Test that saved user word changes counter only if rank band changed."""
+    user_word = UserWordFactory(user=user, rank=0)
+
+    user_word.rank = 100
+    user_word.save()
+    assert _get_counts(user) == (1, 0, 0, 1)
+
+    user_word.learned_times = 1
+    with django_assert_num_queries(2):
+        user_word.save()
+    with django_assert_num_queries(1):
+        user_word.save(update_fields=["learned_times"])
+    assert _get_counts(user) == (1, 0, 0, 1)
@@ -0,0 +1,160 @@
+from types import SimpleNamespace
+
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+import pytest
+
+from ...users.factories import UserFactory
+from .. import counters, dictionary, tasks
+from ..api.serializers import UserWordRemoveSerializer
+from ..factories import CategoryFactory, UserWordFactory, WordFactory
+from ..models import Question, Training, TrainingType, UserWord
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def user():
+    """User with counted dictionary."""
+    created_user = UserFactory()
+    counters.refresh_counter(created_user.id)
+    return created_user
+
+
+def test_add_category_words(user):
+    """Test that only missing category words are added."""
+    category = CategoryFactory()
+    words = [WordFactory(english=english) for english in ("one", "two")]
+    category.words.add(*words)
+    UserWordFactory(user=user, word=words[0])
+
+    assert dictionary.add_category_words(user.id, category.id) == 1
+    assert set(user.words.all()) == set(words)
+    assert counters.get_counter(user.id).words_count == 2
+
+
+@pytest.fixture
+def add_in_background(settings, monkeypatch):
+    """Add words of any category in task which is run in place."""
+    settings.TRAINING_ADD_CATEGORY_WORDS_ASYNC_THRESHOLD = 0
+    monkeypatch.setattr(
+        tasks.add_category_words,
+        "delay",
+        tasks.add_category_words,
+    )
+
+
+def _add_category_words(user, category):
+    """Add words of category with API and get status of adding."""
+    client = APIClient()
+    client.force_authenticate(user)
+    response = client.post(
+        reverse("training_api:dictionary-add-category-words"),
+        data=dict(category_id=category.id),
+        format="json",
+    )
+    assert response.status_code == 202
+    assert not response.data["is_done"]
+    return client.get(reverse(
+        "training_api:dictionary-add-category-words-status",
+        kwargs=dict(status_id=response.data["status_id"]),
+    ))
+
+
+def test_add_category_words_in_background(user, add_in_background):
+    """Test that big category is added in background with status."""
+    category = CategoryFactory()
+    category.words.add(WordFactory(english="one"), WordFactory(english="two"))
+
+    response = _add_category_words(user, category)
+
+    assert response.status_code == 200
+    assert response.data["is_done"]
+    assert not response.data["is_failed"]
+    assert response.data["added_count"] == 2
+    assert counters.get_counter(user.id).words_count == 2
+
+    other_client = APIClient()
+    other_client.force_authenticate(UserFactory())
+    assert other_client.get(reverse(
+        "training_api:dictionary-add-category-words-status",
+        kwargs=dict(status_id=response.data["status_id"]),
+    )).status_code == 404
+
+
+def test_add_category_words_failed(user, monkeypatch):
+    """Test that failed adding in background is marked in status."""
+    def add_category_words(*args, **kwargs):
+        raise RuntimeError
+
+    monkeypatch.setattr(
+        dictionary,
+        "add_category_words",
+        add_category_words,
+    )
+    status_id = dictionary.add_category_words_job.start(user_id=user.id)
+    with pytest.raises(RuntimeError):
+        tasks.add_category_words(user.id, 1, status_id)
+
+    add_status = dictionary.add_category_words_job.get_status(status_id)
+    assert add_status["is_done"]
+    assert add_status["is_failed"]
+
+
+def test_add_words(user):
+    """Test that results of adding are returned for each word."""
+    added = WordFactory(english="added")
+    existing = WordFactory(english="existing")
+    UserWordFactory(user=user, word=existing)
+
+    results = dictionary.add_words(user.id, [added.id, existing.id, "none"])
+
+    assert results == {
+        added.id: dictionary.ADDED,
+        existing.id: dictionary.ALREADY_ADDED,
+        "none": dictionary.NOT_FOUND,
+    }
+    assert counters.get_counter(user.id).words_count == 2
+
+
+def test_remove_words(user):
+    """Test that words and trainings with them are removed."""
+    user_word = UserWordFactory(user=user, word=WordFactory(english="one"))
+    training = Training.objects.create(
+        user=user,
+        type=TrainingType.objects.create(
+            id="test-type",
+            name="Test type",
+            questions_count=1,
+            words_per_question_count=1,
+            cost=10,
+        ),
+    )
+    Question.objects.create(training=training, user_word=user_word)
+
+    results = dictionary.remove_words(user.id, [user_word.word_id, "none"])
+
+    assert results == {
+        user_word.word_id: dictionary.REMOVED,
+        "none": dictionary.NOT_IN_DICTIONARY,
+    }
+    assert not UserWord.objects.filter(user=user).exists()
+    assert not Training.objects.filter(user=user).exists()
+    assert counters.get_counter(user.id).words_count == 0
+
+
+def test_remove_word_not_in_dictionary(user):
+    """Test that missing word isn't valid for removing."""
+    UserWordFactory(word=WordFactory(english="one"))
+    serializer = UserWordRemoveSerializer(
+        data=dict(word="one"),
+        context=dict(request=SimpleNamespace(user=user)),
+    )
+
+    assert not serializer.is_valid()
+    assert "word" in serializer.errors
+    assert UserWord.objects.filter(word_id="one").exists()
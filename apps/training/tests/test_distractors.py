@@ -0,0 +1,68 @@
+import pytest
+
+from .. import distractors
+from ..factories import CategoryFactory, WordFactory
+from ..models import Word
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def words():
+    """Words of single category with similar spelling."""
+    category = CategoryFactory()
+    created_words = [
+        WordFactory(english=english)
+        for english in ("cat", "cats", "catch", "dog", "dogs", "bird")
+    ]
+    category.words.add(*created_words)
+    return created_words
+
+
+def _get_trigram_similar_words(word: Word, attr: str, count: int):
+    """Get similar words with per word query, like handlers did before.
+
+    Words are ordered by `english` explicitly, like `get_similar_words`
+    orders them, so result doesn't depend on order of rows returned by
+    postgres.
+    """
+    return list(
+        Word.objects.exclude(**{
+            attr: getattr(word, attr),
+        }).filter(**{
+            f"{attr}__trigram_similar": getattr(word, attr),
+        }).order_by("english")[:count].values_list(attr, flat=True)
+    )
+
+
+@pytest.mark.parametrize("source", ["database", "index"])
+def test_similar_words_match_per_word_queries(words, settings, source):
+    """Test trigram part is the same as separate query for each word."""
+    settings.TRAINING_SIMILAR_WORDS_SOURCE = source
+    similar_words = distractors.get_similar_words(
+        words=words,
+        attr="english",
+        count=2,
+    )
+    for word in words:
+        expected = _get_trigram_similar_words(word, "english", 2)
+        assert similar_words[word.id][:len(expected)] == expected
+        assert len(similar_words[word.id]) == 2
+        assert word.english not in similar_words[word.id]
+
+
+def test_similar_words_queries_count(
+    words,
+    settings,
+    django_assert_max_num_queries,
+):
+    """Test that queries count doesn't depend on words count."""
+    settings.TRAINING_SIMILAR_WORDS_SOURCE = "database"
+    with django_assert_max_num_queries(3):
+        distractors.get_similar_words(
+            words=words,
+            attr="english",
+            count=5,
+        )
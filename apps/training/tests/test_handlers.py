@@ -0,0 +1,70 @@
+import pytest
+
+from ...users.factories import UserFactory
+from ..factories import UserWordFactory
+from ..models import TrainingType, TrainingTypeUserWord
+from ..training_types_handlers import (
+    FastTranslateHandler,
+    WordTranslateHandler,
+)
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def training_type():
+    """Training type with 3 questions."""
+    return TrainingType.objects.create(
+        id="test-type",
+        name="Test type",
+        questions_count=3,
+        words_per_question_count=1,
+        cost=1,
+    )
+
+
+@pytest.fixture
+def user_words():
+    """User words with different ranks."""
+    user = UserFactory()
+    return {
+        rank: UserWordFactory(user=user, rank=rank)
+        for rank in (0, 10, 20, 50, 100)
+    }
+
+
+def test_chosen_words_first(
+    training_type,
+    user_words,
+    django_assert_num_queries,
+):
+    """Test that chosen words go first and then words by rank."""
+    TrainingTypeUserWord.objects.create(
+        training_type=training_type,
+        user_word=user_words[100],
+    )
+    handler = WordTranslateHandler(
+        training_type=training_type,
+        user=user_words[0].user,
+    )
+    with django_assert_num_queries(1):
+        words = handler._get_words_for_training()
+    assert words == [user_words[100], user_words[0], user_words[10]]
+
+
+def test_fast_translate_in_learning_words_first(
+    training_type,
+    user_words,
+):
+    """Test that fast translate takes in learning words before new."""
+    handler = FastTranslateHandler(
+        training_type=training_type,
+        user=user_words[0].user,
+    )
+    assert handler._get_words_for_training() == [
+        user_words[10],
+        user_words[20],
+        user_words[50],
+    ]
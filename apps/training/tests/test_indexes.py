@@ -0,0 +1,82 @@
+from django.db import connection
+
+import pytest
+
+from libs.import_export.utils import get_clear_q_filter
+
+from apps.core.api.pagination import KeysetPagination
+
+from ..factories import CategoryFactory, WordFactory
+from ..models import Category, Word
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def disabled_seqscan():
+    """Make planner avoid sequential scans if there is an index."""
+    with connection.cursor() as cursor:
+        cursor.execute("SET enable_seqscan = off")
+    yield
+    with connection.cursor() as cursor:
+        cursor.execute("RESET enable_seqscan")
+
+
+@pytest.mark.parametrize("lookup", ["text_icontains", "text_trigram_similar"])
+@pytest.mark.parametrize("attr", ["english", "russian"])
+def test_trigram_lookups_use_index(disabled_seqscan, attr, lookup):
+    """Test that text lookups on words use trigram indexes."""
+    WordFactory(english="cat", russian="кот")
+    plan = Word.objects.filter(**{f"{attr}__{lookup}": "ca"}).explain()
+    assert f"training_word_{attr}_trgm" in plan
+    assert "Seq Scan on training_word" not in plan
+
+
+@pytest.mark.parametrize(
+    "model, attr, index_name",
+    [
+        (Word, "english", "training_word_english_key"),
+        (Category, "name", "training_category_name_key"),
+    ],
+)
+def test_normalized_key_lookup_uses_index(
+    disabled_seqscan,
+    model,
+    attr,
+    index_name,
+):
+    """Test that import matching by normalized key uses expression index."""
+    WordFactory(english="big  Cat")
+    CategoryFactory(name="big  Animals")
+    plan = model.objects.filter(
+        get_clear_q_filter(["Big Cat", "big animals"], attr),
+    ).explain()
+    assert index_name in plan
+    assert f"Seq Scan on {model._meta.db_table}" not in plan
+
+
+@pytest.mark.parametrize(
+    "model, keyset_ordering, index_name",
+    [
+        (Word, ("english", "id"), "training_word_english_id"),
+        (Category, ("name", "id"), "training_category_name_id"),
+    ],
+)
+def test_keyset_page_uses_index(
+    disabled_seqscan,
+    model,
+    keyset_ordering,
+    index_name,
+):
+    """Test that keyset page is read with index of ordering fields."""
+    WordFactory(english="cat")
+    CategoryFactory(name="animals")
+    paginator = KeysetPagination()
+    paginator.keyset_ordering = keyset_ordering
+    plan = model.objects.filter(
+        paginator.get_keyset_filter(["b", "1"]),
+    ).order_by(*keyset_ordering)[:10].explain()
+    assert index_name in plan
+    assert f"Seq Scan on {model._meta.db_table}" not in plan
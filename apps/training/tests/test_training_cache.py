@@ -0,0 +1,160 @@
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+import pytest
+
+from ...users.factories import UserFactory
+from .. import cache, counters
+from ..api.views import TrainingTypeViewSet
+from ..constants import WORD_TRANSLATE_ID
+from ..factories import UserWithWordsFactory, UserWordFactory, WordFactory
+from ..models import Question, Training, TrainingType
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def training():
+    """Started training of user."""
+    user = UserWithWordsFactory()
+    training_type = TrainingType.objects.create(
+        id="test-type",
+        name="Test type",
+        questions_count=1,
+        words_per_question_count=1,
+        cost=1,
+    )
+    return Training.objects.create(user=user, type=training_type)
+
+
+def test_training_data_is_invalidated_on_training_delete(training):
+    """Test that cached questions are removed with training."""
+    key = (training.user_id, training.type_id, training.id)
+    cache.set_training_data(*key, [{}])
+    assert cache.get_training_data(*key)
+
+    training.delete()
+    assert cache.get_training_data(*key) is None
+
+
+def test_training_data_of_deleted_training_is_not_used(training):
+    """Test that questions cached after training is deleted aren't used.
+
+    It happens when training is finished while concurrent start generates
+    questions of it.
+    """
+    training.delete()
+    cache.set_training_data(
+        training.user_id,
+        training.type_id,
+        training.id,
+        [{}],
+    )
+    next_training = Training.objects.create(
+        user=training.user,
+        type=training.type,
+    )
+
+    assert cache.get_training_data(
+        next_training.user_id,
+        next_training.type_id,
+        next_training.id,
+    ) is None
+
+
+@pytest.fixture
+def client():
+    """Client of user with enough words for training."""
+    user = UserFactory()
+    for index in range(10):
+        UserWordFactory(user=user, word=WordFactory(english=f"word{index}"))
+    counters.refresh_counter(user.id)
+    api_client = APIClient()
+    api_client.force_authenticate(user)
+    return api_client
+
+
+def _start(client) -> Training:
+    """Start training with API and return started training."""
+    response = client.post(reverse(
+        "training_api:training-types-start",
+        kwargs=dict(pk=WORD_TRANSLATE_ID),
+    ))
+    assert response.status_code == 200, response.data
+    return Training.objects.get(type_id=WORD_TRANSLATE_ID)
+
+
+def _get_cached_data(training: Training):
+    """Get cached questions of training."""
+    return cache.get_training_data(
+        training.user_id,
+        training.type_id,
+        training.id,
+    )
+
+
+def test_start_returns_cached_questions(client, mocker):
+    """Test that second start doesn't generate questions again."""
+    generate = mocker.spy(TrainingTypeViewSet, "_generate_training_data")
+    training = _start(client)
+    first_data = _get_cached_data(training)
+
+    assert _start(client) == training
+    assert generate.call_count == 1
+    assert _get_cached_data(training) == first_data
+
+
+def test_training_data_is_dropped_after_finish(client):
+    """Test that finished training isn't started again from cache."""
+    training = _start(client)
+    words = Question.objects.filter(
+        training=training,
+    ).values_list("user_word__word__english", flat=True)
+    response = client.post(
+        reverse(
+            "training_api:training-types-finish",
+            kwargs=dict(pk=WORD_TRANSLATE_ID),
+        ),
+        data=dict(result=[
+            dict(word=word, is_true=True) for word in words
+        ]),
+        format="json",
+    )
+    assert response.status_code == 200, response.data
+
+    assert _get_cached_data(training) is None
+    assert _start(client).id != training.id
+
+
+def test_training_data_is_dropped_after_word_remove(client):
+    """Test that training with removed word isn't started from cache."""
+    training = _start(client)
+    response = client.post(
+        reverse("training_api:dictionary-remove-from-dictionary"),
+        data=dict(word=training.questions.first().user_word.word_id),
+        format="json",
+    )
+    assert response.status_code == 204, response.data
+
+    assert _get_cached_data(training) is None
+    assert not Training.objects.filter(id=training.id).exists()
+
+
+def test_training_data_is_dropped_after_words_added_to_training(client):
+    """Test that training without chosen words isn't started from cache."""
+    training = _start(client)
+    response = client.post(
+        reverse("training_api:dictionary-add-words-to-training"),
+        data=dict(
+            words=[training.questions.first().user_word.word_id],
+            training_type=WORD_TRANSLATE_ID,
+        ),
+        format="json",
+    )
+    assert response.status_code == 200, response.data
+
+    assert _get_cached_data(training) is None
+    assert not Training.objects.filter(id=training.id).exists()
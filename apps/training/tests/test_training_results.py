@@ -0,0 +1,101 @@
+import pytest
+
+from ...users.factories import UserFactory
+from .. import training_results
+from ..factories import UserWordFactory, WordFactory
+from ..models import (
+    Question,
+    Training,
+    TrainingType,
+    TrainingTypeUserWord,
+    UserWord,
+)
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def training():
+    """Training with words with different ranks."""
+    user = UserFactory()
+    training_type = TrainingType.objects.create(
+        id="test-type",
+        name="Test type",
+        questions_count=3,
+        words_per_question_count=1,
+        cost=10,
+    )
+    created_training = Training.objects.create(user=user, type=training_type)
+    for english, rank in (("low", 5), ("high", 95), ("wrong", 50)):
+        user_word = UserWordFactory(
+            user=user,
+            word=WordFactory(english=english),
+            rank=rank,
+        )
+        Question.objects.create(
+            training=created_training,
+            user_word=user_word,
+        )
+        TrainingTypeUserWord.objects.create(
+            training_type=training_type,
+            user_word=user_word,
+        )
+    return created_training
+
+
+def test_apply_training_result(training, django_assert_max_num_queries):
+    """Test that ranks, learned times and chosen words are updated."""
+    user_words = {
+        user_word.word_id: user_word
+        for user_word in UserWord.objects.filter(user=training.user)
+    }
+    with django_assert_max_num_queries(5):
+        training_results.apply_training_result(
+            training=training,
+            results={
+                user_words["low"]: True,
+                user_words["high"]: True,
+                user_words["wrong"]: False,
+            },
+        )
+
+    ranks = dict(
+        UserWord.objects.filter(
+            user=training.user,
+        ).values_list("word_id", "rank")
+    )
+    assert ranks == {"low": 15, "high": 100, "wrong": 40}
+    assert UserWord.objects.get(word_id="high").learned_times == 1
+    assert list(
+        TrainingTypeUserWord.objects.values_list(
+            "user_word__word_id",
+            flat=True,
+        )
+    ) == ["wrong"]
+    assert not Training.objects.filter(id=training.id).exists()
+
+
+def test_apply_training_result_without_right_answers(training):
+    """Test that training with only wrong answers lowers ranks and ends.
+
+    Before bulk applying, ranks of wrong answered words were kept and
+    training without right answers wasn't deleted.
+    """
+    training_results.apply_training_result(
+        training=training,
+        results={
+            user_word: False
+            for user_word in UserWord.objects.filter(user=training.user)
+        },
+    )
+
+    ranks = dict(
+        UserWord.objects.filter(
+            user=training.user,
+        ).values_list("word_id", "rank")
+    )
+    assert ranks == {"low": 0, "high": 85, "wrong": 40}
+    assert TrainingTypeUserWord.objects.count() == 3
+    assert not Training.objects.filter(id=training.id).exists()
@@ -0,0 +1,61 @@
+import pytest
+
+from ...users.factories import UserFactory
+from .. import trainings
+from ..factories import UserWordFactory, WordFactory
+from ..models import Question, Training, TrainingType, TrainingTypeUserWord
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def training_type():
+    """Training type for trainings."""
+    return TrainingType.objects.create(
+        id="test-type",
+        name="Test type",
+        questions_count=1,
+        words_per_question_count=1,
+        cost=10,
+    )
+
+
+def _create_training(user, word, training_type):
+    user_word = UserWordFactory(user=user, word=word)
+    training = Training.objects.create(user=user, type=training_type)
+    Question.objects.create(training=training, user_word=user_word)
+    return training
+
+
+def test_trainings_of_other_users_are_kept(training_type):
+    """Test that only trainings of passed user are deleted."""
+    word = WordFactory(english="one")
+    user = UserFactory()
+    _create_training(user, word, training_type)
+    other_training = _create_training(UserFactory(), word, training_type)
+
+    assert trainings.invalidate_trainings(user.id, words_ids=[word.id]) == 1
+    assert list(Training.objects.all()) == [other_training]
+
+
+def test_trainings_with_chosen_words_are_kept(training_type):
+    """Test that trainings with chosen words are kept if requested."""
+    user = UserFactory()
+    training = _create_training(
+        user,
+        WordFactory(english="one"),
+        training_type,
+    )
+    TrainingTypeUserWord.objects.create(
+        training_type=training_type,
+        user_word=training.questions.get().user_word,
+    )
+
+    assert not trainings.invalidate_trainings(
+        user.id,
+        training_type_id=training_type.id,
+        without_chosen_words=True,
+    )
+    assert Training.objects.filter(id=training.id).exists()
@@ -0,0 +1,73 @@
+import pytest
+from tablib import Dataset
+
+from libs.import_export.utils import get_clear_q_filter
+
+from ..factories import CategoryFactory, WordFactory
+from ..models import Category, Word
+from ..resources import WordResource
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+pytestmark = pytest.mark.django_db
+
+
+def test_categories_widget_resolves_in_bulk(django_assert_num_queries):
+    """Test that categories are resolved before rows are cleaned."""
+    CategoryFactory(name="animals")
+    widget = WordResource().fields["categories"].widget
+
+    with django_assert_num_queries(3):
+        widget.prepare(["Animals,pets", "pets", None])
+    with django_assert_num_queries(0):
+        categories = widget.clean("animals, Pets")
+
+    assert [category.name for category in categories] == ["animals", "pets"]
+
+
+def test_import_creates_missing_categories():
+    """Test that missing categories are created if some of them exist."""
+    CategoryFactory(name="animals")
+    dataset = Dataset(headers=("english", "russian", "image", "Categories"))
+    dataset.append(("cat", "кот", "", "animals,pets"))
+    dataset.append(("dog", "собака", "", "pets"))
+
+    result = WordResource().import_data(dataset)
+
+    assert not result.has_errors()
+    assert Category.objects.count() == 2
+    assert set(
+        Word.objects.get(english="cat").categories.values_list(
+            "name",
+            flat=True,
+        )
+    ) == {"animals", "pets"}
+
+
+@pytest.mark.parametrize("use_normalized_key", [True, False])
+def test_clear_q_filter_modes_match_the_same_words(use_normalized_key):
+    """Test that normalized key matches like regex."""
+    WordFactory(english="Wild  cat")
+    WordFactory(english=" wild cat")
+    WordFactory(english="wild dog")
+
+    words = Word.objects.filter(
+        get_clear_q_filter(
+            ["wild CAT", "wild\tdog", "fox"],
+            "english",
+            use_normalized_key=use_normalized_key,
+        ),
+    )
+
+    assert sorted(words.values_list("english", flat=True)) == [
+        "Wild  cat",
+        "wild dog",
+    ]
+
+
+def test_categories_are_matched_regardless_of_whitespaces():
+    """Test that categories with extra whitespaces aren't duplicated."""
+    category = CategoryFactory(name="Wild animals")
+    widget = WordResource().fields["categories"].widget
+
+    assert widget.clean("wild   animals") == [category]
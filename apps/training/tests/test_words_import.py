@@ -0,0 +1,125 @@
+import io
+
+from django.core.files.base import ContentFile
+
+import pytest
+from openpyxl import Workbook
+
+from apps.core import background_jobs
+
+from .. import tasks, words_import
+from ..factories import CategoryFactory, WordFactory
+from ..models import Word
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+HEADERS = ("english", "russian", "image", "Categories")
+
+
+def _make_csv(*rows) -> io.BytesIO:
+    lines = [",".join(HEADERS)] + [",".join(row) for row in rows]
+    return io.BytesIO("\n".join(lines).encode())
+
+
+def _make_xlsx(*rows) -> io.BytesIO:
+    workbook = Workbook()
+    workbook.active.append(HEADERS)
+    for row in rows:
+        workbook.active.append(row)
+    file = io.BytesIO()
+    workbook.save(file)
+    file.seek(0)
+    return file
+
+
+@pytest.mark.parametrize(
+    "file_format, make_file",
+    [
+        (background_jobs.CSV_FORMAT, _make_csv),
+        (background_jobs.XLSX_FORMAT, _make_xlsx),
+    ],
+)
+def test_read_rows(file_format, make_file):
+    """Test that rows are read as mapping of column to value."""
+    file = make_file(("cat", "кот", "", "animals"))
+    rows = list(words_import.read_rows(file, file_format))
+    assert len(rows) == 1
+    assert rows[0]["english"] == "cat"
+    assert rows[0]["Categories"] == "animals"
+
+
+@pytest.mark.django_db
+def test_import_words():
+    """Test that words are created, updated and linked to categories."""
+    WordFactory(english="cat", russian="кошка")
+    CategoryFactory(name="animals")
+    file = _make_csv(
+        ("Cat", "кот", "", "Animals"),
+        ("dog", "собака", "", '"animals,pets"'),
+        ("", "пусто", "", ""),
+    )
+
+    status = words_import.import_words(
+        file,
+        background_jobs.CSV_FORMAT,
+        chunk_size=2,
+    )
+
+    assert status["created_count"] == 1
+    assert status["updated_count"] == 1
+    assert [number for number, _ in status["errors"]] == [3]
+    assert Word.objects.get(english="cat").russian == "кот"
+    assert set(
+        Word.objects.get(english="dog").categories.values_list(
+            "name",
+            flat=True,
+        )
+    ) == {"animals", "pets"}
+
+
+@pytest.mark.django_db
+def test_import_chunk_colliding_slugs(django_assert_num_queries):
+    """Test that unique ids of new words are generated with one query."""
+    WordFactory(english="cat")
+    WordFactory(english="cat 2")
+    rows = [
+        (number, dict(english=english, russian="кот", image="", Categories=""))
+        for number, english in enumerate(("cat.", "Cat!", "dog"), start=1)
+    ]
+
+    # Existing words, taken ids and insert of new words
+    with django_assert_num_queries(3):
+        created_count, *_ = words_import.import_chunk(rows)
+
+    assert created_count == 3
+    assert set(Word.objects.values_list("id", flat=True)) == {
+        "cat",
+        "cat-2",
+        "cat-3",
+        "cat-4",
+        "dog",
+    }
+
+
+def test_failed_import_status(settings, tmp_path):
+    """Test that failed import is marked in status and file is removed."""
+    settings.MEDIA_ROOT = tmp_path
+    settings.TRAINING_WORDS_IMPORT_STORAGE = (
+        "django.core.files.storage.FileSystemStorage"
+    )
+    storage = words_import.job.get_storage()
+    file_name = storage.save("imports/words.xlsx", ContentFile(b"broken"))
+    import_id = words_import.job.start()
+
+    with pytest.raises(Exception):
+        tasks.import_words(
+            file_name,
+            background_jobs.XLSX_FORMAT,
+            import_id,
+        )
+
+    status = words_import.job.get_status(import_id)
+    assert status["is_done"]
+    assert status["is_failed"]
+    assert status["error"]
+    assert not storage.exists(file_name)
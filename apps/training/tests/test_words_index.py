@@ -0,0 +1,49 @@
+import pytest
+
+from .. import words_index
+from ..factories import WordFactory
+from ..models import Word
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+
+def test_get_trigrams():
+    """Test that trigrams are the same as `show_trgm` of `pg_trgm`."""
+    assert words_index.get_trigrams("Word") == {
+        "  w", " wo", "wor", "ord", "rd ",
+    }
+    assert words_index.get_trigrams("a-b") == {
+        "  a", " a ", "  b", " b ",
+    }
+
+
+@pytest.mark.django_db
+def test_index_matches_trigram_similar_lookup():
+    """Test that index returns the same words as postgres."""
+    for english in ("cat", "cats", "catch", "scat", "dog", "Cat food"):
+        WordFactory(english=english)
+    index = words_index.WordsIndex("english")
+
+    for word in Word.objects.all():
+        expected = list(
+            Word.objects.exclude(
+                english=word.english,
+            ).filter(
+                english__trigram_similar=word.english,
+            ).values_list("english", flat=True)
+        )
+        assert index.get_similar_words(word.english, 10) == expected
+
+
+@pytest.mark.django_db
+def test_index_update_and_remove():
+    """Test incremental index updates."""
+    word = WordFactory(english="cat")
+    index = words_index.WordsIndex("english")
+    assert index.get_similar_words("cats", 10) == ["cat"]
+
+    index.update(Word(id="cats", english="cats", russian="коты"))
+    assert index.get_similar_words("cat", 10) == ["cats"]
+
+    index.remove(word.id)
+    assert index.get_similar_words("cats", 10) == []
@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+import pytest
+
+from ...users.factories import UserFactory
+from ..api.serializers import WordSerializer
+from ..factories import UserWordFactory, WordFactory
+from ..models import Word
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def user():
+    """User with one of two words in dictionary."""
+    created_user = UserFactory()
+    UserWordFactory(user=created_user, word=WordFactory(english="linked"))
+    WordFactory(english="unlinked")
+    return created_user
+
+
+def test_with_is_linked(user):
+    """Test that words are joined with user words without subquery."""
+    words = Word.objects.with_is_linked(user).order_by("english")
+    assert [(word.english, word.is_linked) for word in words] == [
+        ("linked", True),
+        ("unlinked", False),
+    ]
+    plan = words.explain()
+    assert "Left Join" in plan
+    assert "SubPlan" not in plan
+
+
+def test_linked_ids_are_got_once_for_page(user, django_assert_num_queries):
+    """Test that `is_linked` of page is calculated with single query."""
+    words = list(Word.objects.order_by("english"))
+    serializer = WordSerializer(
+        words,
+        many=True,
+        context=dict(request=SimpleNamespace(user=user)),
+    )
+    with django_assert_num_queries(1):
+        data = serializer.data
+    assert [(item["english"], item["is_linked"]) for item in data] == [
+        ("linked", True),
+        ("unlinked", False),
+    ]
@@ -0,0 +1,87 @@
+import pytest
+
+from .. import distractors, words_similarity
+from ..factories import WordFactory
+from ..models import Word, WordSimilarity
+
+# pylint:disable=unused-argument,redefined-outer-name
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def words():
+    """Words with similar spelling."""
+    return [
+        WordFactory(english=english)
+        for english in ("cat", "cats", "catch", "scat")
+    ]
+
+
+def test_compute_similar_words(words):
+    """Test that similar words are computed and word isn't stale."""
+    words_similarity.compute_similar_words([word.id for word in words])
+
+    cat = Word.objects.get(english="cat")
+    assert cat.similar_words_computed_at is not None
+    similar_words = list(
+        WordSimilarity.objects.filter(
+            word=cat,
+            language="english",
+        ).order_by("-score").values_list("similar_word__english", flat=True)
+    )
+    assert similar_words[0] == "cats"
+    assert "cat" not in similar_words
+    assert cat.id not in words_similarity.get_stale_words_ids()
+
+
+def test_get_affected_words(words):
+    """Test that words similar to changed one are affected."""
+    affected_words = words_similarity.get_affected_words(["cat"])
+    assert {"cat", "cats"} <= affected_words
+
+
+def test_table_source_single_query(
+    words,
+    settings,
+    django_assert_num_queries,
+):
+    """Test that similar words are taken from table with single query."""
+    settings.TRAINING_SIMILAR_WORDS_SOURCE = "table"
+    words_similarity.compute_similar_words([word.id for word in words])
+    computed_words = list(Word.objects.exclude(english="scat"))
+
+    with django_assert_num_queries(1):
+        similar_words = distractors.get_similar_words(
+            words=computed_words,
+            attr="english",
+            count=1,
+        )
+    assert similar_words["cat"] == ["cats"]
+
+
+def test_word_is_stale_only_when_text_changed(words):
+    """Test that only changes of english or russian make word stale."""
+    words_similarity.compute_similar_words([word.id for word in words])
+    cat = Word.objects.get(english="cat")
+
+    cat.image = "cat.png"
+    cat.save()
+    cat.refresh_from_db()
+    assert cat.similar_words_computed_at is not None
+
+    cat.russian = f"{cat.russian} кошка"
+    cat.save()
+    cat.refresh_from_db()
+    assert cat.similar_words_computed_at is None
+
+
+def test_neighbours_are_stale_after_word_delete(words):
+    """Test that words which had deleted word as similar become stale."""
+    words_similarity.compute_similar_words([word.id for word in words])
+
+    Word.objects.get(english="cats").delete()
+
+    cat = Word.objects.get(english="cat")
+    assert cat.similar_words_computed_at is None
+    assert cat.id in words_similarity.get_stale_words_ids()
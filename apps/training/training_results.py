@@ -0,0 +1,82 @@
+"""Applying of training results to user words.
+
+Result of whole training is applied with single statement:
+* rank of each word is changed by its delta (training type cost for right
+  answer, negative cost for wrong one) and clamped to 0..100
+* `learned_times` is increased (up to 3) when word becomes learned, i.e.
+  its rank reaches 100
+* right answered words are removed from words chosen for training type
+
+Training is deleted even if all answers are wrong, so finished training
+can't be finished again to lower ranks once more.
+"""
+from django.db import connection
+
+from apps.training import counters, models
+
+MIN_RANK = 0
+MAX_RANK = 100
+MAX_LEARNED_TIMES = 3
+
+APPLY_TRAINING_RESULT_SQL = """
+    WITH result (id, delta) AS (
+        VALUES {values}
+    ),
+    updated AS (
+        UPDATE {user_word_table} AS user_word
+        SET
+            rank = LEAST(GREATEST(user_word.rank + result.delta, %s), %s),
+            learned_times = CASE
+                WHEN user_word.rank < %s
+                    AND user_word.rank + result.delta >= %s
+                THEN LEAST(user_word.learned_times + 1, %s)
+                ELSE user_word.learned_times
+            END
+        FROM result, {user_word_table} AS old_user_word
+        WHERE user_word.id = result.id
+            AND old_user_word.id = user_word.id
+            AND user_word.user_id = %s
+        RETURNING old_user_word.rank, user_word.rank
+    ),
+    unchosen AS (
+        DELETE FROM {chosen_word_table}
+        WHERE training_type_id = %s
+            AND user_word_id IN (SELECT id FROM result WHERE delta > 0)
+    )
+    SELECT * FROM updated
+"""
+
+
+def apply_training_result(
+    training: models.Training,
+    results: dict[models.UserWord, bool],
+):
+    """Apply result of training and delete training.
+
+    `results` is mapping of user word to flag if answer was right.
+    """
+    cost = training.type.cost
+    values = ", ".join(["(%s::uuid, %s::integer)"] * len(results))
+    sql = APPLY_TRAINING_RESULT_SQL.format(
+        values=values,
+        user_word_table=models.UserWord._meta.db_table,
+        chosen_word_table=models.TrainingTypeUserWord._meta.db_table,
+    )
+    params = []
+    for user_word, is_true in results.items():
+        params += [user_word.id, cost if is_true else -cost]
+    params += [
+        MIN_RANK,
+        MAX_RANK,
+        MAX_RANK,
+        MAX_RANK,
+        MAX_LEARNED_TIMES,
+        training.user_id,
+        training.type_id,
+    ]
+    if results:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            ranks_changes = cursor.fetchall()
+        counters.change_ranks(training.user_id, ranks_changes)
+    training.delete()
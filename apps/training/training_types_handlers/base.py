@@ -1,10 +1,14 @@
 from collections import namedtuple
+from typing import Optional
 
+from django.db.models import Case, IntegerField, Value, When
 from django.utils.translation import gettext_lazy as _
 
-from apps.training import models
+from apps.training import counters, distractors, models
 from apps.users.models import User
 
+from . import priorities
+
 TrainingQuestionData = namedtuple(
     typename="TrainingQuestionData",
     field_names=[
@@ -20,6 +24,9 @@ class BaseTrainingTypeHandler:
 
     WORD_ATTR = "russian"
     TRANSLATE_ATTR = "english"
+    WORDS_PRIORITIES = (
+        priorities.CHOSEN_WORDS,
+    )
 
     def __init__(
         self,
@@ -29,11 +36,13 @@ class BaseTrainingTypeHandler:
         """Store training type and user."""
         self.training_type = training_type
         self.user = user
+        self.training: Optional[models.Training] = None
 
     def check_enough_words(self) -> bool:
         """Check that there are enough words in dictionary."""
         return (
-            self.user.user_words.count() > self.training_type.questions_count
+            counters.get_counter(self.user.id).words_count
+            > self.training_type.questions_count
         )
 
     def get_not_enough_words_error_message(self) -> str:
@@ -47,6 +56,9 @@ class BaseTrainingTypeHandler:
         """Generate data for training."""
         data = []
         questions = self._get_training_questions()
+        similar_words = self._get_similar_words(
+            words=[question.user_word.word for question in questions],
+        )
         for question in questions:
             data.append(TrainingQuestionData(
                 word=self._get_training_question_data_word(
@@ -55,9 +67,7 @@ class BaseTrainingTypeHandler:
                 translation=self._get_training_question_data_translation(
                     question,
                 ),
-                similar_words=self._get_similar_words(
-                    word=question.user_word.word,
-                ),
+                similar_words=similar_words[question.user_word.word_id],
             ))
         return data
 
@@ -65,7 +75,7 @@ class BaseTrainingTypeHandler:
         """Get training questions.
 
         If there is already created training, take questions from it,
-        otherwise generate questions.
+        otherwise generate questions. Training is stored in `training`.
         """
         training: models.Training = self.training_type.trainings.filter(
             user=self.user,
@@ -81,6 +91,7 @@ class BaseTrainingTypeHandler:
                 type=self.training_type,
             )
             questions = self._generate_training_questions(training)
+        self.training = training
         return questions
 
     def _generate_training_questions(
@@ -101,72 +112,42 @@ class BaseTrainingTypeHandler:
 
     def _get_similar_words(
         self,
-        word: models.Word,
-    ) -> list[str]:
-        """Get words similar to passed.
+        words: list[models.Word],
+    ) -> dict[str, list[str]]:
+        """Get words similar to passed for all questions at once.
 
-        It trying to get similar words using postgres `trigram similar`,
-        if found words count less than passed count,
-         then gets words from categories.
+        Returns mapping of word id to similar words, check
+        `distractors.get_similar_words`.
         """
-        count = self.training_type.words_per_question_count
-        similar_words = list(
-            models.Word.objects.exclude(**{
-                self.TRANSLATE_ATTR: getattr(word, self.TRANSLATE_ATTR),
-            }).filter(**{
-                f"{self.TRANSLATE_ATTR}__trigram_similar":
-                    getattr(word, self.TRANSLATE_ATTR),
-            })[:count].values_list(self.TRANSLATE_ATTR, flat=True)
+        return distractors.get_similar_words(
+            words=words,
+            attr=self.TRANSLATE_ATTR,
+            count=self.training_type.words_per_question_count,
         )
-        remaining_count = count - len(similar_words)
-        if remaining_count > 0:
-            qs = models.Word.objects.exclude(english=word.english).filter(
-                categories__in=word.categories.values("id"),
-            ).order_by('?')[:remaining_count]
-
-            similar_words += list(qs.values_list(
-                self.TRANSLATE_ATTR,
-                flat=True,
-            ))
-        return similar_words
 
     def _get_words_for_training(self) -> list[models.UserWord]:
         """Get words for training questions.
 
-        Firstly it tries to get words from added to training words, check
-        `TrainingTypeUserWord` processing.
-        If not enough words, then it get another words from dictionary
-        """
-        chosen_words = list(
-            self.user.user_words.filter(
-                chosen_words__training_type=self.training_type,
-            ).order_by("rank")[:self.training_type.questions_count]
-        )
-        chosen_words_count = len(chosen_words)
-        additional_words = []
-        if chosen_words_count != self.training_type.questions_count:
-            remaining_count = (
-                self.training_type.questions_count - chosen_words_count
-            )
-            additional_words = self._get_additional_words_for_training(
-                chosen_words=chosen_words,
-                remaining_count=remaining_count,
-            )
-        return chosen_words + additional_words
-
-    def _get_additional_words_for_training(
-        self,
-        chosen_words: list[models.UserWord],
-        remaining_count: int,
-    ) -> list[models.UserWord]:
-        """Override this to get words that need for training type.
-
-        This need if not enough words in chosen words.
+        Words are taken with single query according to `WORDS_PRIORITIES`,
+        by default firstly it takes words added to training, check
+        `TrainingTypeUserWord` processing, then another words from
+        dictionary.
         """
+        priority_whens = [
+            When(priority.get_condition(self), then=Value(index))
+            for index, priority in enumerate(self.WORDS_PRIORITIES)
+        ]
         return list(
-            self.user.user_words.exclude(
-                id__in=[chosen_word.id for chosen_word in chosen_words],
-            ).order_by("rank")[:remaining_count]
+            self.user.user_words.annotate(
+                priority=Case(
+                    *priority_whens,
+                    default=Value(len(priority_whens)),
+                    output_field=IntegerField(),
+                ),
+            ).select_related("word").order_by(
+                "priority",
+                "rank",
+            )[:self.training_type.questions_count]
         )
 
     def _get_training_question_data_word(
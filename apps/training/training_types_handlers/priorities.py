@@ -0,0 +1,50 @@
+"""Priorities of words for training questions.
+
+Handler declares tiers of words in `WORDS_PRIORITIES`, words of first tier
+are taken firstly, then words of second tier and so on, words which are
+not in any tier are taken at last. Inside each tier words are ordered by
+rank.
+
+Example:
+    class SomeHandler(BaseTrainingTypeHandler):
+        WORDS_PRIORITIES = (
+            priorities.CHOSEN_WORDS,
+            priorities.IN_LEARNING_WORDS,
+        )
+"""
+import abc
+
+from django.db.models import Exists, OuterRef, Q
+
+from apps.training import models
+
+
+class WordsPriority(abc.ABC):
+    """Tier of words for training."""
+
+    @abc.abstractmethod
+    def get_condition(self, handler):
+        """Get condition for `UserWord` which matches words of tier."""
+
+
+class ChosenWordsPriority(WordsPriority):
+    """Words added to training type, check `TrainingTypeUserWord`."""
+
+    def get_condition(self, handler):
+        return Exists(
+            models.TrainingTypeUserWord.objects.filter(
+                training_type=handler.training_type,
+                user_word=OuterRef("pk"),
+            )
+        )
+
+
+class InLearningWordsPriority(WordsPriority):
+    """Words which are on learning, i.e. 0 < rank < 100."""
+
+    def get_condition(self, handler):
+        return Q(rank__gt=0, rank__lt=100)
+
+
+CHOSEN_WORDS = ChosenWordsPriority()
+IN_LEARNING_WORDS = InLearningWordsPriority()
@@ -0,0 +1,56 @@
+"""Invalidation of in-progress trainings.
+
+Training stores questions with user words, so when dictionary or chosen
+words are changed, started trainings of user can become stale and should be
+deleted. Trainings are always filtered by user first, questions are checked
+with `EXISTS` subqueries which use indexes of `Question` (`training` +
+`user_word` and `user_word`), so trainings of other users are never
+scanned or touched.
+
+Cached questions of deleted trainings are dropped by `Training`
+`post_delete` signal (check `apps.training.signals`).
+"""
+from typing import Iterable, Optional
+
+from django.db.models import Exists, OuterRef
+
+from apps.training import models
+
+
+def invalidate_trainings(
+    user_id: int,
+    words_ids: Optional[Iterable[str]] = None,
+    training_type_id: Optional[str] = None,
+    without_chosen_words: bool = False,
+) -> int:
+    """Delete in-progress trainings of user.
+
+    Args:
+        user_id: owner of trainings.
+        words_ids: only trainings with questions about these words are
+            deleted.
+        training_type_id: only training of this type is deleted.
+        without_chosen_words: only trainings which have no questions about
+            words chosen for their training type are deleted.
+
+    Returns count of deleted trainings.
+    """
+    trainings = models.Training.objects.filter(user_id=user_id)
+    if training_type_id is not None:
+        trainings = trainings.filter(type_id=training_type_id)
+    if words_ids is not None:
+        trainings = trainings.filter(Exists(
+            models.Question.objects.filter(
+                training=OuterRef("pk"),
+                user_word__word_id__in=list(words_ids),
+            )
+        ))
+    if without_chosen_words:
+        trainings = trainings.exclude(Exists(
+            models.Question.objects.filter(
+                training=OuterRef("pk"),
+                user_word__chosen_words__training_type=OuterRef("type"),
+            )
+        ))
+    _, deleted_counts = trainings.delete()
+    return deleted_counts.get(models.Training._meta.label, 0)
@@ -0,0 +1,312 @@
+"""Streaming import of words.
+
+Admin import of `WordResource` processes rows one by one (get word, save
+it, add categories), so big vocabulary files time out. Here words file
+(CSV or XLSX with the same columns as `WordResource`) is read in chunks
+and each chunk is imported with fixed count of queries:
+* existing words of chunk are fetched by normalized key of `english` (case
+  and whitespaces insensitive, uses expression index) with one query
+* new words are created with `bulk_create`, changed ones are updated with
+  `bulk_update`
+* categories are fetched (and created if missing) by names and links of
+  words to categories are inserted with one `bulk_create`
+
+Bulk queries don't send model signals, so after import caches which depend
+on words are invalidated by `finish_import` (`post_import` signal is sent
+like admin import does).
+
+Import is run in background by `apps.training.tasks.import_words`, its
+progress is stored in status of `job` (check `apps.core.background_jobs`).
+"""
+import codecs
+import csv
+import re
+from itertools import count, islice
+from typing import IO, Iterable, Iterator, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils.text import slugify
+from django.utils.translation import gettext as _
+
+from import_export.signals import post_import
+from openpyxl import load_workbook
+
+from libs.import_export.utils import get_clear_q_filter, get_normalized_key
+
+from apps.core import background_jobs
+from apps.training import categories_pool, models, resources
+
+# Max count of row errors kept in import status
+MAX_ERRORS_COUNT = 100
+
+SLUG_SEPARATOR = "-"
+# Length of the longest suffix of slug, e.g. `-123456789`
+MAX_SLUG_SUFFIX_LENGTH = 10
+
+job = background_jobs.BackgroundJob(
+    "training:words-import",
+    initial_status=dict(
+        processed_rows=0,
+        created_count=0,
+        updated_count=0,
+        errors=[],
+    ),
+    storage_setting="TRAINING_WORDS_IMPORT_STORAGE",
+)
+
+
+def import_words(
+    file: IO[bytes],
+    file_format: str,
+    import_id: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+) -> dict:
+    """Import words from file chunk by chunk.
+
+    If `import_id` is passed, progress is stored in status of `job` after
+    each chunk.
+    Returns status of import.
+    """
+    chunk_size = chunk_size or settings.TRAINING_WORDS_IMPORT_CHUNK_SIZE
+    resource = resources.WordResource()
+    status = job.get_initial_status()
+    categories_ids = set()
+    rows = enumerate(read_rows(file, file_format), start=1)
+    while chunk := list(islice(rows, chunk_size)):
+        resource.prefetch(row for _, row in chunk)
+        with transaction.atomic():
+            created_count, updated_count, chunk_categories_ids, errors = (
+                import_chunk(chunk, resource)
+            )
+        status["processed_rows"] += len(chunk)
+        status["created_count"] += created_count
+        status["updated_count"] += updated_count
+        status["errors"] = (status["errors"] + errors)[:MAX_ERRORS_COUNT]
+        categories_ids.update(chunk_categories_ids)
+        if import_id:
+            job.set_status(import_id, status)
+
+    finish_import(categories_ids)
+    status["is_done"] = True
+    if import_id:
+        job.set_status(import_id, status)
+    return status
+
+
+def read_rows(file: IO[bytes], file_format: str) -> Iterator[dict]:
+    """Read rows of file one by one as mapping of column to value."""
+    if file_format == background_jobs.XLSX_FORMAT:
+        return _read_xlsx_rows(file)
+    return _read_csv_rows(file)
+
+
+def import_chunk(
+    rows: list[tuple[int, dict]],
+    resource: Optional[resources.WordResource] = None,
+) -> tuple[int, int, set[int], list[tuple[int, str]]]:
+    """Import chunk of numbered rows.
+
+    External images of rows are taken from `resource` widget if they were
+    prefetched with it (check `FileWidget.prefetch`).
+
+    Returns count of created words, count of updated words, ids of
+    categories which got new words and errors of rows.
+    """
+    resource = resource or resources.WordResource()
+    words_data, errors = _clean_rows(rows, resource)
+    if not words_data:
+        return 0, 0, set(), errors
+
+    existing_words = {
+        get_normalized_key(word.english): word
+        for word in models.Word.objects.filter(
+            get_clear_q_filter(
+                [data["english"] for data in words_data.values()],
+                "english",
+            ),
+        ).only(
+            "id",
+            "english",
+            "russian",
+            "image",
+            "similar_words_computed_at",
+        )
+    }
+    new_words = []
+    updated_words = []
+    for key, data in words_data.items():
+        word = existing_words.get(key)
+        if word is None:
+            new_words.append(models.Word(
+                english=data["english"],
+                russian=data["russian"],
+                image=data["image"],
+            ))
+            continue
+        if word.russian != data["russian"] or word.image != data["image"]:
+            if word.russian != data["russian"]:
+                word.similar_words_computed_at = None
+            word.russian = data["russian"]
+            word.image = data["image"]
+            updated_words.append(word)
+
+    _set_words_ids(new_words)
+    models.Word.objects.bulk_create(new_words)
+    models.Word.objects.bulk_update(
+        updated_words,
+        fields=("russian", "image", "similar_words_computed_at"),
+    )
+
+    words = {**existing_words, **{
+        get_normalized_key(word.english): word for word in new_words
+    }}
+    categories = resource.fields["categories"].widget.resolve({
+        name
+        for data in words_data.values()
+        for name in data["categories"]
+    })
+    words_categories = [
+        models.Word.categories.through(
+            word_id=words[key].id,
+            category_id=categories[get_normalized_key(name)].id,
+        )
+        for key, data in words_data.items()
+        for name in data["categories"]
+    ]
+    models.Word.categories.through.objects.bulk_create(
+        words_categories,
+        ignore_conflicts=True,
+    )
+    categories_ids = {
+        word_category.category_id for word_category in words_categories
+    }
+    return len(new_words), len(updated_words), categories_ids, errors
+
+
+def finish_import(categories_ids: Iterable[int]):
+    """Invalidate caches which depend on imported words."""
+    categories_pool.invalidate(categories_ids)
+    post_import.send(sender=None, model=models.Word)
+
+
+def _clean_rows(
+    rows: list[tuple[int, dict]],
+    resource: resources.WordResource,
+) -> tuple[dict[str, dict], list[tuple[int, str]]]:
+    """Get words data from rows, mapping of normalized key of english to data.
+
+    If there are many rows with the same english (regardless of case and
+    extra whitespaces), the last one is used.
+    """
+    fields = resource.fields
+    categories_field = fields["categories"]
+    words_data = {}
+    errors = []
+    for number, row in rows:
+        english = _clean_string(row.get(fields["english"].column_name))
+        russian = _clean_string(row.get(fields["russian"].column_name))
+        if not english or not russian:
+            errors.append((number, _("English and russian are required")))
+            continue
+        try:
+            image = fields["image"].widget.clean(
+                _clean_string(row.get(fields["image"].column_name)),
+            )
+        except ValueError as error:
+            errors.append((number, str(error)))
+            continue
+        categories = categories_field.widget.get_names(
+            _clean_string(row.get(categories_field.column_name)),
+        )
+        words_data[get_normalized_key(english)] = dict(
+            english=english,
+            russian=russian,
+            image=image or "",
+            categories=categories,
+        )
+    return words_data, errors
+
+
+def _set_words_ids(words: list[models.Word]):
+    """Set unique slug ids of new words with one query.
+
+    Ids are generated like `AutoSlugField` does (`<slug>`, `<slug>-2`,
+    `<slug>-3` and so on), but ids which can be taken by words are fetched
+    at once instead of query per each candidate. `Word.id` keeps passed ids
+    of added words. Words with empty slug are left without id,
+    `AutoSlugField` generates it.
+    """
+    max_length = models.Word._meta.pk.max_length
+    slugs = {}
+    for word in words:
+        slug = slugify(word.english)[:max_length].strip(SLUG_SEPARATOR)
+        if slug:
+            slugs[word] = slug
+    if not slugs:
+        return
+
+    # Ids with suffixes start with slug which may be cut to fit suffix
+    prefixes = {
+        re.escape(
+            slug[:max_length - MAX_SLUG_SUFFIX_LENGTH].strip(SLUG_SEPARATOR),
+        )
+        for slug in slugs.values()
+    }
+    taken_ids = set(
+        models.Word.objects.filter(
+            Q(id__in=set(slugs.values()))
+            | Q(id__regex=rf"^(?:{'|'.join(prefixes)}).*-[0-9]+$"),
+        ).values_list("id", flat=True)
+    )
+    for word, slug in slugs.items():
+        word.id = next(
+            word_id
+            for word_id in _generate_slugs(slug, max_length)
+            if word_id not in taken_ids
+        )
+        taken_ids.add(word.id)
+
+
+def _generate_slugs(slug: str, max_length: int) -> Iterator[str]:
+    """Generate slug and slugs with suffixes like `AutoSlugField` does."""
+    yield slug
+    for number in count(2):
+        suffix = f"{SLUG_SEPARATOR}{number}"
+        yield (
+            f"{slug[:max_length - len(suffix)].strip(SLUG_SEPARATOR)}"
+            f"{suffix}"
+        )
+
+
+def _clean_string(value) -> str:
+    """Convert cell value to stripped string."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def _read_csv_rows(file: IO[bytes]) -> Iterator[dict]:
+    """Read rows of CSV file."""
+    yield from csv.DictReader(codecs.iterdecode(file, "utf-8-sig"))
+
+
+def _read_xlsx_rows(file: IO[bytes]) -> Iterator[dict]:
+    """Read rows of first sheet of XLSX file.
+
+    Workbook is opened in read only mode, so rows are not loaded to memory
+    at once.
+    """
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        headers = [_clean_string(header) for header in next(rows, ())]
+        for values in rows:
+            if not any(value is not None for value in values):
+                continue
+            yield dict(zip(headers, values))
+    finally:
+        workbook.close()
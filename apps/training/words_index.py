@@ -0,0 +1,194 @@
+"""In-process trigram index of words vocabulary.
+
+Vocabulary is small and rarely changes, so instead of asking postgres for
+`trigram similar` words on every training start, each worker builds
+inverted index of words trigrams once and keeps it up to date with `Word`
+signals (check `apps.training.signals`).
+
+Trigrams and similarity are calculated in the same way as postgres
+`pg_trgm` extension does, so index returns the same words as
+`<attr>__trigram_similar` lookup. Similar words are ordered in python by
+lowercased `english` instead of database collation (check
+`WordsIndex.get_similar_words`).
+"""
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from django.conf import settings
+
+from apps.training import models
+
+# Same as default value of `pg_trgm.similarity_threshold`
+SIMILARITY_THRESHOLD = 0.3
+
+NOT_WORD_CHARACTERS_RE = re.compile(r"[\W_]+")
+
+
+def get_trigrams(value: str) -> frozenset[str]:
+    """Get trigrams of string like `pg_trgm` does.
+
+    String is lowercased and split to words by non alphanumeric characters,
+    each word is padded with two spaces at the beginning and one space at
+    the end.
+    """
+    trigrams = set()
+    for word in NOT_WORD_CHARACTERS_RE.split(value.lower()):
+        if not word:
+            continue
+        padded = f"  {word} "
+        for index in range(len(padded) - 2):
+            trigrams.add(padded[index:index + 3])
+    return frozenset(trigrams)
+
+
+class IndexedWord:
+    """Word stored in index."""
+
+    __slots__ = ("id", "sort_key", "value", "key", "trigrams")
+
+    def __init__(self, word_id: str, english: str, value: str):
+        self.id = word_id
+        self.sort_key = english.lower()
+        self.value = value
+        self.key = value.lower()
+        self.trigrams = get_trigrams(value)
+
+
+class WordsIndex:
+    """Inverted trigram index of one `Word` attribute."""
+
+    def __init__(self, attr: str):
+        """Store indexed attribute."""
+        self.attr = attr
+        self._words: dict[str, IndexedWord] = {}
+        self._trigrams: dict[str, set[str]] = defaultdict(set)
+        self._built_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+    @property
+    def is_expired(self) -> bool:
+        """Check that index should be rebuilt."""
+        if self._built_at is None:
+            return True
+        timeout = settings.TRAINING_WORDS_INDEX_TIMEOUT
+        if timeout is None:
+            return False
+        return time.monotonic() - self._built_at > timeout
+
+    def build(self):
+        """Build index from all words."""
+        words = models.Word.objects.order_by().values_list(
+            "id",
+            "english",
+            self.attr,
+        )
+        with self._lock:
+            self._words = {}
+            self._trigrams = defaultdict(set)
+            for word_id, english, value in words.iterator():
+                self._add(IndexedWord(word_id, english, value))
+            self._built_at = time.monotonic()
+
+    def clear(self):
+        """Drop index, it will be built on next usage."""
+        with self._lock:
+            self._words = {}
+            self._trigrams = defaultdict(set)
+            self._built_at = None
+
+    def update(self, word: models.Word):
+        """Add word to index or update it."""
+        with self._lock:
+            if self._built_at is None:
+                return
+            self.remove(word.id)
+            self._add(IndexedWord(
+                word.id,
+                word.english,
+                getattr(word, self.attr),
+            ))
+
+    def remove(self, word_id: str):
+        """Remove word from index."""
+        with self._lock:
+            indexed_word = self._words.pop(word_id, None)
+            if indexed_word is None:
+                return
+            for trigram in indexed_word.trigrams:
+                self._trigrams[trigram].discard(word_id)
+
+    def get_similar_words(self, value: str, count: int) -> list[str]:
+        """Get values of words similar to passed one.
+
+        Works like `trigram_similar` lookup, excludes words with the same
+        value and orders result by lowercased `english`.
+
+        Ordering is done by python string comparison (by code points), not
+        by collation of database, so words which differ only in case,
+        punctuation or non ASCII letters may be ordered not the same way as
+        `order_by("english")` does. Order only decides which similar words
+        are shown when there are more of them than `count`.
+        """
+        with self._lock:
+            if self.is_expired:
+                self.build()
+            trigrams = get_trigrams(value)
+            if not trigrams:
+                return []
+            key = value.lower()
+            common_counts = defaultdict(int)
+            for trigram in trigrams:
+                for word_id in self._trigrams.get(trigram, ()):
+                    common_counts[word_id] += 1
+
+            similar_words = []
+            for word_id, common_count in common_counts.items():
+                indexed_word = self._words[word_id]
+                if indexed_word.key == key:
+                    continue
+                similarity = common_count / (
+                    len(trigrams) + len(indexed_word.trigrams) - common_count
+                )
+                if similarity >= SIMILARITY_THRESHOLD:
+                    similar_words.append(indexed_word)
+        similar_words.sort(key=lambda indexed_word: indexed_word.sort_key)
+        return [indexed_word.value for indexed_word in similar_words[:count]]
+
+    def _add(self, indexed_word: IndexedWord):
+        """Add word to index."""
+        self._words[indexed_word.id] = indexed_word
+        for trigram in indexed_word.trigrams:
+            self._trigrams[trigram].add(indexed_word.id)
+
+
+WORDS_INDEXES = {
+    "english": WordsIndex("english"),
+    "russian": WordsIndex("russian"),
+}
+
+
+def get_index(attr: str) -> WordsIndex:
+    """Get index for `Word` attribute."""
+    return WORDS_INDEXES[attr]
+
+
+def update_word(word: models.Word):
+    """Update word in all indexes."""
+    for index in WORDS_INDEXES.values():
+        index.update(word)
+
+
+def remove_words(word_ids: Iterable[str]):
+    """Remove words from all indexes."""
+    for index in WORDS_INDEXES.values():
+        for word_id in word_ids:
+            index.remove(word_id)
+
+
+def clear():
+    """Clear all indexes, they will be rebuilt on next usage."""
+    for index in WORDS_INDEXES.values():
+        index.clear()
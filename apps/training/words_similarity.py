@@ -0,0 +1,117 @@
+"""Precomputed similar words.
+
+Top similar words of each word are stored in `WordSimilarity` table, so
+training start needs single indexed lookup instead of similarity scan for
+every question.
+
+Word is considered as stale if its `similar_words_computed_at` is empty
+(word was changed) or too old, stale words are recomputed in background by
+`apps.training.tasks.rebuild_stale_similar_words`.
+"""
+from datetime import timedelta
+from typing import Iterable
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.training import models
+
+LANGUAGES = tuple(
+    language for language, _ in models.WordSimilarity.LANGUAGE_CHOICES
+)
+
+COMPUTE_SIMILAR_WORDS_SQL = """
+    INSERT INTO {similarity_table}
+        (word_id, similar_word_id, language, score, computed_at)
+    SELECT source.id, similar.id, %s, similar.score, %s
+    FROM {word_table} AS source
+    CROSS JOIN LATERAL (
+        SELECT word.id, similarity(word.{attr}, source.{attr}) AS score
+        FROM {word_table} AS word
+        WHERE word.{attr} <> source.{attr}
+            AND (word.{attr})::text %% (source.{attr})::text
+        ORDER BY score DESC, word.english
+        LIMIT %s
+    ) AS similar
+    WHERE source.id = ANY(%s)
+"""
+
+NEIGHBOURS_SQL = """
+    SELECT DISTINCT word.id
+    FROM {word_table} AS source
+    INNER JOIN {word_table} AS word
+        ON (word.{attr})::text %% (source.{attr})::text
+            AND word.id <> source.id
+    WHERE source.id = ANY(%s)
+"""
+
+
+def compute_similar_words(word_ids: Iterable[str]):
+    """Recompute similar words for passed words."""
+    word_ids = list(word_ids)
+    if not word_ids:
+        return
+    computed_at = timezone.now()
+    with transaction.atomic():
+        models.WordSimilarity.objects.filter(word_id__in=word_ids).delete()
+        with connection.cursor() as cursor:
+            for language in LANGUAGES:
+                cursor.execute(
+                    _format_sql(COMPUTE_SIMILAR_WORDS_SQL, language),
+                    [
+                        language,
+                        computed_at,
+                        settings.TRAINING_SIMILAR_WORDS_COUNT,
+                        word_ids,
+                    ],
+                )
+        models.Word.objects.filter(id__in=word_ids).update(
+            similar_words_computed_at=computed_at,
+        )
+
+
+def get_affected_words(word_ids: Iterable[str]) -> set[str]:
+    """Get words which similar words may change after change of passed.
+
+    These are passed words, words which have passed ones in similar words
+    and words which are similar to passed ones now.
+    """
+    word_ids = list(word_ids)
+    affected_word_ids = set(word_ids)
+    affected_word_ids.update(
+        models.WordSimilarity.objects.filter(
+            similar_word_id__in=word_ids,
+        ).values_list("word_id", flat=True)
+    )
+    with connection.cursor() as cursor:
+        for language in LANGUAGES:
+            cursor.execute(
+                _format_sql(NEIGHBOURS_SQL, language),
+                [word_ids],
+            )
+            affected_word_ids.update(row[0] for row in cursor.fetchall())
+    return affected_word_ids
+
+
+def get_stale_words_ids() -> list[str]:
+    """Get ids of words which similar words should be recomputed."""
+    max_age = timedelta(seconds=settings.TRAINING_SIMILAR_WORDS_MAX_AGE)
+    return list(
+        models.Word.objects.filter(
+            Q(similar_words_computed_at__isnull=True)
+            | Q(similar_words_computed_at__lt=timezone.now() - max_age),
+        ).order_by().values_list("id", flat=True)
+    )
+
+
+def _format_sql(sql: str, attr: str) -> str:
+    """Insert tables and column names to sql."""
+    return sql.format(
+        attr=connection.ops.quote_name(
+            models.Word._meta.get_field(attr).column,
+        ),
+        word_table=models.Word._meta.db_table,
+        similarity_table=models.WordSimilarity._meta.db_table,
+    )
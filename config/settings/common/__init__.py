@@ -1,15 +1,18 @@
 import mimetypes
 
 from .authentication import *
+from .cache import *
 from .celery import *
 from .drf import *
 from .installed_apps import *
 from .imagekit import *
+from .import_export import *
 from .internationalization import *
 from .middleware import *
 from .paths import *
 from .static import *
 from .templates import *
+from .training import *
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -0,0 +1,20 @@
+"""Settings for cache.
+
+Process local cache is used by default, deploy settings require shared
+cache from `CACHE_URL` env variable (e.g. `rediscache://redis:6379/2`),
+locally redis from docker-compose is used.
+
+`TWO_TIER_CACHE_*` settings are used by `apps.core.cache.TwoTierCache`
+which keeps hot data in memory of process in front of shared cache.
+"""
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+}
+
+# Max count of items kept in memory of process by each two tier cache
+TWO_TIER_CACHE_LOCAL_MAX_SIZE = 1024
+# Time in seconds while items are kept in memory of process, changes made
+# by another processes are visible after this time
+TWO_TIER_CACHE_LOCAL_TIMEOUT = 60
@@ -11,3 +11,10 @@ CELERY_TASK_EAGER_PROPAGATES = True
 # specify connection options for task producer, so it won’t retry forever if
 # the broker isn’t available at the first task execution
 CELERY_BROKER_TRANSPORT_OPTIONS = {'max_retries': 3, 'socket_timeout': 5}
+
+CELERY_BEAT_SCHEDULE = {
+    "rebuild-stale-similar-words": {
+        "task": "apps.training.tasks.rebuild_stale_similar_words",
+        "schedule": 60 * 60,
+    },
+}
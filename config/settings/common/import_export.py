@@ -0,0 +1,16 @@
+"""Settings for downloading of remote files during import.
+
+Files which are referenced by external URLs in imported rows (e.g. word
+images) are downloaded by `libs.import_export.fetcher.RemoteFilesFetcher`
+concurrently before import transaction is started.
+"""
+# Count of threads which download files
+IMPORT_EXPORT_DOWNLOAD_WORKERS = 8
+# Timeout in seconds of connection and of reading of each chunk
+IMPORT_EXPORT_DOWNLOAD_TIMEOUT = 10
+# Max size of downloaded file in bytes
+IMPORT_EXPORT_DOWNLOAD_MAX_SIZE = 10 * 1024 * 1024
+# Directory of storage for downloaded files
+IMPORT_EXPORT_DOWNLOAD_PATH = "imports"
+# Time in seconds while storage name of downloaded URL is cached
+IMPORT_EXPORT_DOWNLOAD_CACHE_TIMEOUT = 60 * 60 * 24
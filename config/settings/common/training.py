@@ -0,0 +1,46 @@
+"""Settings for trainings.
+
+`TRAINING_SIMILAR_WORDS_SOURCE` defines where similar words (distractors)
+for training questions are taken from:
+* `database` - postgres `trigram similar` query
+* `index` - in-process trigram index of words (`apps.training.words_index`)
+* `table` - precomputed similar words (`apps.training.words_similarity`),
+  words which similar words are not computed yet are taken from `index`
+"""
+TRAINING_SIMILAR_WORDS_SOURCE = "table"
+
+# Time in seconds after which in-process words index is rebuilt, it's
+# needed to get changes made in another processes. `None` means never.
+TRAINING_WORDS_INDEX_TIMEOUT = 60 * 10
+
+# How many similar words are stored for each word in `WordSimilarity` table
+TRAINING_SIMILAR_WORDS_COUNT = 10
+# Time in seconds after which precomputed similar words are rebuilt
+TRAINING_SIMILAR_WORDS_MAX_AGE = 60 * 60 * 24
+
+# Max count of categories which word ids are kept in memory of process
+# for sampling of distractors (check `apps.training.categories_pool`)
+TRAINING_CATEGORIES_POOLS_MAX_SIZE = 1024
+
+# Time in seconds while rendered questions of started training are cached
+TRAINING_DATA_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Categories with more words are added to dictionary in background
+TRAINING_ADD_CATEGORY_WORDS_ASYNC_THRESHOLD = 1000
+# Max count of words which can be added or removed with one request
+TRAINING_BULK_WORDS_MAX_COUNT = 1000
+
+# Time in seconds while catalogue responses (words, categories, training
+# types) of the same catalogue version are cached
+TRAINING_CATALOGUE_CACHE_TIMEOUT = 60 * 60 * 24
+# How many rows of words file are imported with one set of bulk queries
+TRAINING_WORDS_IMPORT_CHUNK_SIZE = 1000
+# Storage of uploaded words files, `None` means default storage
+TRAINING_WORDS_IMPORT_STORAGE = None
+# How many words or categories are exported with one set of queries
+TRAINING_CATALOGUE_EXPORT_CHUNK_SIZE = 2000
+# Storage of exported catalogue files, `None` means default storage
+TRAINING_CATALOGUE_EXPORT_STORAGE = None
+
+# Time in seconds while training types are cached
+TRAINING_REFERENCE_CACHE_TIMEOUT = 60 * 60 * 24
@@ -25,6 +25,12 @@ DATABASES = {
 DATABASES["default"]["ATOMIC_REQUESTS"] = True
 DATABASES["default"]["CONN_MAX_AGE"] = 600
 
+# Cache is shared by processes (e.g. statuses of background tasks, catalogue
+# versions), so it must be set explicitly
+CACHES = {
+    "default": env.cache("CACHE_URL"),
+}
+
 CELERY_TASK_ALWAYS_EAGER = env("CELERY_TASK_ALWAYS_EAGER")
 CELERY_BROKER_URL = ""
 CELERY_RESULT_BACKEND = ""
@@ -45,3 +51,9 @@ CLOUDINARY_STORAGE = {
     "API_SECRET": env("API_SECRET"),
 }
 DEFAULT_FILE_STORAGE = 'cloudinary_storage.storage.MediaCloudinaryStorage'
+TRAINING_WORDS_IMPORT_STORAGE = (
+    "cloudinary_storage.storage.RawMediaCloudinaryStorage"
+)
+TRAINING_CATALOGUE_EXPORT_STORAGE = (
+    "cloudinary_storage.storage.RawMediaCloudinaryStorage"
+)
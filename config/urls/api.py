@@ -1,9 +1,12 @@
 from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from apps.core.api.views import CacheStatsView
+
 urlpatterns = [
     path("user/", include("apps.users.api.urls", namespace="users_api")),
     path("schema/", SpectacularAPIView.as_view(), name="schema"),
+    path("cache-stats/", CacheStatsView.as_view(), name="cache-stats"),
     path(
         "schema/swagger-ui/",
         SpectacularSwaggerView.as_view(url_name="schema"),
@@ -0,0 +1,144 @@
+"""Concurrent fetching of remote files for import.
+
+Import of rows with external file URLs (e.g. word images) downloaded files
+one by one, so it was bound by network latency. `RemoteFilesFetcher`
+downloads all URLs of import at once with a pool of threads which share
+one `requests.Session` (connections are reused), with timeouts and size
+limit.
+
+Each file is stored once:
+* name of file is sha256 of its content, so the same content from
+  different URLs is saved to storage only once
+* storage name of downloaded URL is cached, so the same URL isn't
+  downloaded again by next imports (e.g. after dry run of admin import)
+
+Files are downloaded before import transaction is started, check
+`FileWidget.prefetch`.
+"""
+import hashlib
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from libs.import_export.utils import (
+    DownloadError,
+    download_file,
+    get_file_extension,
+)
+
+
+class RemoteFilesFetcher:
+    """Downloader of remote files to storage.
+
+    Example:
+        fetcher = RemoteFilesFetcher(upload_to='imports/image')
+        names = fetcher.fetch(['https://example.com/cat.png'])
+        # {'https://example.com/cat.png': 'imports/image/<sha256>.png'}
+
+    """
+    cache_key = 'import-export:download:{}'
+
+    def __init__(
+        self,
+        upload_to=None,
+        storage=None,
+        max_workers=None,
+        timeout=None,
+        max_size=None,
+    ):
+        self.upload_to = upload_to or settings.IMPORT_EXPORT_DOWNLOAD_PATH
+        self.storage = storage or default_storage
+        self.max_workers = (
+            max_workers or settings.IMPORT_EXPORT_DOWNLOAD_WORKERS
+        )
+        self.timeout = timeout
+        self.max_size = max_size
+        self._locks = defaultdict(threading.Lock)
+        self._locks_lock = threading.Lock()
+
+    def fetch(self, urls):
+        """Download files and save them to storage.
+
+        Returns mapping of URL to storage name of file or to
+        ``DownloadError`` if file can't be downloaded.
+        """
+        urls = set(filter(None, urls))
+        if not urls:
+            return {}
+        cache_keys = {self._get_cache_key(url): url for url in urls}
+        results = {
+            cache_keys[cache_key]: name
+            for cache_key, name in cache.get_many(cache_keys).items()
+        }
+        missing_urls = sorted(urls - results.keys())
+        if not missing_urls:
+            return results
+
+        with self._get_session() as session, ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(missing_urls)),
+        ) as executor:
+            fetched = dict(zip(
+                missing_urls,
+                executor.map(
+                    lambda url: self._fetch_one(session, url),
+                    missing_urls,
+                ),
+            ))
+        cache.set_many(
+            {
+                self._get_cache_key(url): name
+                for url, name in fetched.items()
+                if not isinstance(name, DownloadError)
+            },
+            settings.IMPORT_EXPORT_DOWNLOAD_CACHE_TIMEOUT,
+        )
+        results.update(fetched)
+        return results
+
+    def _fetch_one(self, session, url):
+        """Download file and save it to storage."""
+        try:
+            file = download_file(
+                url,
+                session=session,
+                timeout=self.timeout,
+                max_size=self.max_size,
+            )
+        except DownloadError as error:
+            return error
+
+        content = file.read()
+        file.seek(0)
+        name = hashlib.sha256(content).hexdigest()
+        extension = get_file_extension(url)
+        if extension:
+            name = f'{name}.{extension}'
+        name = f'{self.upload_to}/{name}'
+        # Lock prevents saving of the same content from different URLs twice
+        with self._locks_lock:
+            lock = self._locks[name]
+        with lock:
+            if not self.storage.exists(name):
+                name = self.storage.save(name, file)
+        return name
+
+    def _get_session(self):
+        """Get session with connections pool for all threads."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=self.max_workers)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _get_cache_key(self, url):
+        """Get key of cached storage name of URL."""
+        return self.cache_key.format(
+            hashlib.sha256(f'{self.upload_to}:{url}'.encode()).hexdigest(),
+        )
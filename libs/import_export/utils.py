@@ -4,7 +4,8 @@ import os
 import re
 import unicodedata
 import uuid
-from urllib.parse import unquote_plus
+from functools import lru_cache, reduce
+from urllib.parse import unquote_plus, urlparse
 
 from django.conf import settings
 from django.core.files.base import ContentFile
@@ -14,7 +15,17 @@ from django.utils.html import strip_tags
 import requests
 from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
 
+# Max count of normalized values memoized by each normalization function.
+# Imported columns often repeat values (e.g. categories), so repeated cells
+# aren't normalized again.
+NORMALIZATION_CACHE_SIZE = 64 * 1024
+# Count of first values of column which are checked for repeats
+DEDUPLICATION_SAMPLE_SIZE = 1000
 
+ESCAPE_RE = re.compile(r'[(){}\[\].*?|^$\\+-]')
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
 def normalize_string_value(value):
     """Normalize string value.
 
@@ -25,9 +36,25 @@ def normalize_string_value(value):
     4. Normalize Unicode string, using `NFKC` form. See the details:
     https://docs.python.org/3/library/unicodedata.html#unicodedata.normalize
 
+    Results are memoized, use ``normalize_string_values`` for columns.
+
     """
-    cleaned = ' '.join(value.strip().split()).strip()
-    return remove_illegal_characters(cleaned)
+    return _normalize_string_value(value)
+
+
+def normalize_string_values(values):
+    """Normalize sequence of string values (e.g. column of dataset).
+
+    Repeated values (e.g. categories) are normalized once.
+
+    Args:
+        values: sequence of strings
+
+    Returns:
+        list of normalized strings in the same order
+
+    """
+    return _map_values(_normalize_string_value, values)
 
 
 def get_default_file_mime_type():
@@ -69,15 +96,66 @@ def upload_media_path(model_instance, filename):
     return os.path.join(*components)
 
 
-def download_file(external_url):
-    """Download file from external resource and return the file object."""
+class DownloadError(Exception):
+    """File can't be downloaded."""
+
+
+def download_file(external_url, session=None, timeout=None, max_size=None):
+    """Download file from external resource and return the file object.
+
+    File is downloaded by chunks, so download is stopped as soon as file
+    exceeds ``max_size``.
+
+    Args:
+        external_url (str): URL of file
+        session (requests.Session): session to reuse connections
+        timeout (int): timeout of connection and of reading of each chunk,
+            ``IMPORT_EXPORT_DOWNLOAD_TIMEOUT`` by default
+        max_size (int): max size of file in bytes,
+            ``IMPORT_EXPORT_DOWNLOAD_MAX_SIZE`` by default
+
+    Raises:
+        DownloadError: if request failed or file is too large
+
+    """
+    timeout = timeout or settings.IMPORT_EXPORT_DOWNLOAD_TIMEOUT
+    max_size = max_size or settings.IMPORT_EXPORT_DOWNLOAD_MAX_SIZE
     mime_type = get_mime_type_by_file_url(external_url)
-    data = requests.get(external_url)
-    file = ContentFile(data.content)
+    try:
+        with (session or requests).get(
+            external_url,
+            timeout=timeout,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            if int(response.headers.get('Content-Length') or 0) > max_size:
+                raise DownloadError(f'File is too large: {external_url}')
+            content = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                content += chunk
+                if len(content) > max_size:
+                    raise DownloadError(f'File is too large: {external_url}')
+    except requests.RequestException as error:
+        raise DownloadError(f'Failed to download {external_url}: {error}')
+    file = ContentFile(bytes(content))
     file.content_type = mime_type
     return file
 
 
+def is_internal_url(file_url):
+    """Check if URL points to file of own media storage.
+
+    URLs without domain are considered as names of files in storage.
+    """
+    parsed_url = urlparse(file_url)
+    if not parsed_url.netloc or parsed_url.path.startswith(
+        settings.MEDIA_URL,
+    ):
+        return True
+    cloud_name = getattr(settings, 'CLOUDINARY_CLOUD_NAME', None)
+    return bool(cloud_name) and cloud_name in file_url
+
+
 def get_file_extension(url, lower=True):
     """Method to extract file extension from path/URL.
 
@@ -169,48 +247,63 @@ def remove_illegal_characters(value):
     https://docs.python.org/3/library/unicodedata.html#unicodedata.normalize
 
     """
-    return unicodedata.normalize(
-        'NFKC',
-        re.sub(ILLEGAL_CHARACTERS_RE, '', value)
-    )
+    if not value.isprintable():
+        # control characters aren't printable, so other strings are skipped
+        value = ILLEGAL_CHARACTERS_RE.sub('', value)
+    if value.isascii():
+        # ASCII strings are already in `NFKC` form
+        return value
+    return unicodedata.normalize('NFKC', value)
 
 
-def get_clear_q_filter(str_value, attribute_name):
+def get_clear_q_filter(str_value, attribute_name, use_normalized_key=True):
     """Makes clear Q filter for ``str_value``
 
-    For given string we must create regex pattern that isn't
-    dependent on word's cases and extra whitespaces.
+    Filter matches values that aren't dependent on word's cases and extra
+    whitespaces. ``str_value`` may be a string or a sequence of strings,
+    then filter matches any of them, so batch of values is resolved with
+    one query.
 
-    First we build regular expression for ``str_value``
+    By default values are matched by normalized key (lowered value with
+    single spaces, see ``get_normalized_key``) with ``normalized_key``
+    lookup (``apps.core.lookups.NormalizedKey``), so expression index on
+    key of attribute could be used.
         Example:
-            if str_value = 'Hello, world' then regex patter for it
-            is '^Hello\s+world$'
+            If attribute_name is 'title' and str_value = 'Hello   World'
+            then Q filter is Q(title__normalized_key__in={'hello world'})
 
-    Then for regex patter we create Q filter.
+    If ``use_normalized_key`` is False, for each string we build regular
+    expression which is matched with ``iregex`` (it can't use indexes).
         Example:
-            If attribute_name is 'title' then Q filter is
+            if str_value = 'Hello, world' then regex patter for it
+            is '^Hello\s+world$' and Q filter is
             Q(title__iregex='^Hello\s+world$')
 
     Args:
-        str_value: some string
+        str_value: some string or sequence of strings
         attribute_name: model's attribute name
+        use_normalized_key: match by normalized key instead of regex
 
     """  # noqa: W605
+    values = [str_value] if isinstance(str_value, str) else list(str_value)
+    if use_normalized_key or not values:
+        q_key_attr = '{0}__normalized_key__in'.format(attribute_name)
+        return Q(**{q_key_attr: {get_normalized_key(v) for v in values}})
+
     q_regex_attr = '{0}__iregex'.format(attribute_name)
+    return reduce(operator.or_, (
+        Q(**{q_regex_attr: _get_clear_pattern(value)}) for value in values
+    ))
 
-    try:
-        str_value.encode('ascii')
-        esc = re.escape
-    except UnicodeEncodeError:
-        esc = escape
 
-    words = str_value.split()
-    words = map(esc, words)
-    pattern = r'\s+'.join(words)
-    pattern = r'^{0}$'.format(pattern)
+def get_normalized_key(str_value):
+    """Get key of string which isn't dependent on cases and whitespaces.
 
-    # build Q filter and append in list
-    return Q(**{q_regex_attr: pattern})
+    Example:
+        '  Hello \t World ' -> 'hello world'
+
+    """
+    return ' '.join(str_value.split()).lower()
 
 
 def clean_sequence_of_string_values(sequence, ignore_empty=True):
@@ -228,13 +321,14 @@ def clean_sequence_of_string_values(sequence, ignore_empty=True):
         cleared_sequence: list of cleared sequence items
 
     """
-    sequence = (normalize_string_value(item) for item in sequence)
+    sequence = normalize_string_values(sequence)
     if ignore_empty:
         return list(filter(None, sequence))
 
-    return list(sequence)
+    return sequence
 
 
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
 def clear_string(string):
     """Normalize ``string`` and make it lower case.
 
@@ -242,7 +336,7 @@ def clear_string(string):
     headers
     """
     string = string.lower()
-    string = normalize_string_value(string)
+    string = _normalize_string_value(string)
     string = string.replace(': ', ':').replace(' :', ':')
     return string
 
@@ -256,12 +350,43 @@ def clear_seq_items(sequence):
     make it to lower case
 
     """
-    return list(map(clear_string, sequence))
+    return _map_values(clear_string, sequence)
 
 
 def escape(s):
     """Escapes special characters in unicode string"""
-    return re.sub(r'[(){}\[\].*?|^$\\+-]', r'\\\g<0>', s)
+    return ESCAPE_RE.sub(r'\\\g<0>', s)
+
+
+def _normalize_string_value(value):
+    """Normalize string value without memoization."""
+    return remove_illegal_characters(' '.join(value.split()))
+
+
+@lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+def _get_clear_pattern(str_value):
+    """Get regex pattern of ``str_value`` for ``get_clear_q_filter``."""
+    esc = re.escape if str_value.isascii() else escape
+    words = map(esc, str_value.split())
+    pattern = r'\s+'.join(words)
+    return r'^{0}$'.format(pattern)
+
+
+def _map_values(function, values):
+    """Apply function to each value of sequence.
+
+    If more than 10% of sample values are repeated, function is applied to
+    each distinct value once. For columns of distinct values deduplication
+    costs more than it saves.
+    """
+    values = list(values)
+    sample = values[:DEDUPLICATION_SAMPLE_SIZE]
+    if len(set(sample)) >= len(sample) * 0.9:
+        return [function(value) for value in values]
+    results = dict.fromkeys(values)
+    for value in results:
+        results[value] = function(value)
+    return [results[value] for value in values]
 
 
 def _get_random_path(obj, filename):
@@ -1,21 +1,19 @@
 from urllib.parse import urlparse
 
 from django.conf import settings
-from django.core.exceptions import SuspiciousFileOperation
-from django.core.files import File
-from django.core.files.storage import default_storage
 
 from import_export.widgets import CharWidget
 
-from libs.import_export.utils import (
-    download_file,
-    get_file_extension,
-    url_to_internal_value,
-)
+from libs.import_export.fetcher import RemoteFilesFetcher
+from libs.import_export.utils import is_internal_url, url_to_internal_value
 
 
 class FileWidget(CharWidget):
-    """Widget for working with File fields"""
+    """Widget for working with File fields
+
+    External files are downloaded to storage by ``prefetch`` before import,
+    files of own storage are used as is.
+    """
 
     def __init__(self, filename):
         """
@@ -23,9 +21,14 @@ class FileWidget(CharWidget):
             filename (str): Filename to save file
         """
         self.filename = filename
+        self._fetched = {}
 
     def render(self, value, obj=None):
-        """Convert DB value to URL to file"""
+        """Convert DB value to URL to file
+
+        URL is built by storage without requests, so it's cheap for each
+        exported row.
+        """
         if value:
             if (
                 settings.DEFAULT_FILE_STORAGE
@@ -34,14 +37,32 @@ class FileWidget(CharWidget):
                 return f'http://localhost:8000{value.url}'
             return value.url
 
+    def prefetch(self, values):
+        """Download external files of all column values concurrently."""
+        fetcher = RemoteFilesFetcher(
+            upload_to=f'{settings.IMPORT_EXPORT_DOWNLOAD_PATH}/'
+                      f'{self.filename}',
+        )
+        values = (
+            value.strip() for value in values if isinstance(value, str)
+        )
+        self._fetched = fetcher.fetch(
+            value for value in values if value and not is_internal_url(value)
+        )
+
+    def reset(self):
+        """Forget files downloaded by ``prefetch``."""
+        self._fetched = {}
+
     def clean(self, value, *args, **kwargs):
         """Get the file and check for exists."""
         if not value:
             return
+        if isinstance(value, str):
+            value = value.strip()
+        if value in self._fetched:
+            name = self._fetched[value]
+            if isinstance(name, Exception):
+                raise ValueError(str(name))
+            return name
         return url_to_internal_value(urlparse(value).path)
-
-    def _get_file(self, url):
-        """Download file from the external resource."""
-        ext = get_file_extension(url)
-        file = download_file(url)
-        return File(file, f'{self.filename}.{ext}')